@@ -23,14 +23,19 @@ from ciscoconfparse2.ccp_util import (
     CiscoIOSInterface,
     CiscoIOSXRInterface,
     CiscoRange,
+    CiscoVlanSet,
     EUI64Obj,
+    IPPrefixTrie,
     IPv4Obj,
     IPv6Obj,
     L4Object,
     MACObj,
     PythonOptimizeCheck,
+    RouteTable,
+    StaticRoute,
     _get_ipv4,
     _get_ipv6,
+    canonical_interface_name,
     ccp_logger_control,
     collapse_addresses,
     configure_loguru,
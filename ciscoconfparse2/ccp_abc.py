@@ -18,9 +18,12 @@ mike [~at~] pennington [/dot\] net
 # Silence pylint warnings about type hints with a pipe
 from __future__ import annotations
 
+import functools
 import math
 import re
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import copy
 from typing import TYPE_CHECKING, Any
 from warnings import warn
@@ -33,12 +36,123 @@ from ciscoconfparse2.errors import (
     ConfigListItemDoesNotExist,
     InvalidParameters,
     InvalidTypecast,
+    ReadOnlyConfiguration,
 )
 
 if TYPE_CHECKING:
     from types import GeneratorType
 
 DEFAULT_TEXT = "__undefined__"
+# BaseCfgLine()._typed_cache values for a regex which does not match, or
+#     a match group which did not participate in the match
+TYPED_NO_MATCH = object()
+TYPED_NO_GROUP = object()
+# A regex which starts with ^\s* or ^\s+ and a literal keyword, which is
+#     followed by whitespace or the end of the line
+_RE_LEADING_KEYWORD = re.compile(r"^\^\\s[*+]([A-Za-z0-9][\w-]*)(?:\\s(?![*?{])|\$)")
+# get_regex_keyword() results, keyed by regex
+REGEX_KEYWORDS: dict[str | re.Pattern, str | None] = {}
+# The keyword indexes of the families which are being read in the current
+#     thread (or asyncio task), keyed by id() of the family parent; a
+#     ContextVar() keeps concurrent readers of the same family apart.  See
+#     BaseCfgLine()._keyword_index_scope()
+KEYWORD_INDEXES: ContextVar[dict[int, dict] | None] = ContextVar("KEYWORD_INDEXES", default=None)
+
+
+class RegexRegistry(dict):
+    r"""
+    A dict of compiled regexes, keyed by their pattern string.  Nothing is compiled at import; each pattern is compiled the first time it is looked up, and every later lookup returns the same ``re.Pattern``.
+
+    The registry is cleared when it holds ``maxsize`` patterns, so regexes which are built on the fly (i.e. with an interface name in them) do not grow it without limit.
+
+    .. code-block:: python
+
+        >>> registry = RegexRegistry()
+        >>> registry[r"^\s*mtu\s+(\d+)$"] is registry[r"^\s*mtu\s+(\d+)$"]
+        True
+        >>> len(registry)
+        1
+        >>>
+    """
+
+    __slots__ = ("maxsize",)
+
+    def __init__(self, maxsize: int = 4096):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __missing__(self, pattern: str) -> re.Pattern:
+        if len(self) >= self.maxsize:
+            self.clear()
+        retval = self[pattern] = re.compile(pattern)
+        return retval
+
+
+# The compiled regexes used by BaseCfgLine() searches; model properties
+#     pass their regexes as strings, and they are compiled here once
+REGEX_REGISTRY = RegexRegistry()
+
+
+def compiled_regex(regex: str | re.Pattern) -> re.Pattern:
+    """
+    :return: ``regex`` if it is already a compiled ``re.Pattern``; otherwise the ``REGEX_REGISTRY`` entry for the ``regex`` string.
+    :rtype: re.Pattern
+    """
+    if isinstance(regex, str):
+        return REGEX_REGISTRY[regex]
+    return regex
+
+
+# Cached values of these types are returned as they are; values of any
+#     other type are returned as a shallow copy
+IMMUTABLE_CACHE_TYPES = (str, int, float, bool, tuple, frozenset, bytes, type(None))
+
+
+def copy_cached_value(value: Any) -> Any:
+    """
+    :return: ``value`` if it is immutable, otherwise a shallow copy of ``value``, so callers which modify a cached value (i.e. ``IPv4Obj().masklen = 8``) do not change the cache.
+    :rtype: Any
+    """
+    if isinstance(value, IMMUTABLE_CACHE_TYPES):
+        return value
+    return copy(value)
+
+
+def mutation_cached(func: Callable) -> Callable:
+    r"""
+    Cache the value of a model property on each object until the ConfigList() which owns the object adds, removes or changes the text of any object.  Use it below ``@property``.
+
+    Objects which do not belong to a ConfigList() are not cached, and exceptions are not cached.  Mutable values, such as lists, ``IPv4Obj()`` or ``CiscoIOSInterface()``, are returned as a shallow copy with :py:func:`copy_cached_value`.
+
+    .. code-block:: python
+
+        class MyIntfLine(IOSIntfLine):
+            @property
+            @mutation_cached
+            def port_type_lower(self):
+                return self.port_type.lower()
+    """
+
+    @functools.wraps(func)
+    def wrapper(self):
+        confobj = self.confobj
+        mutation_counter = getattr(confobj, "mutation_counter", None)
+        if mutation_counter is None:
+            return func(self)
+
+        counters = (mutation_counter, confobj.text_mutation_counter)
+        cache = self._value_cache
+        if cache is None:
+            cache = self._value_cache = {}
+
+        cached = cache.get(func)
+        if cached is None or cached[0] != counters:
+            cached = (counters, func(self))
+            cache[func] = cached
+
+        return copy_cached_value(cached[1])
+
+    return wrapper
 
 
 @logger.catch(reraise=True)
@@ -82,6 +196,89 @@ def get_brace_termination(line: str) -> str:
     return "".join(_retval).strip()
 
 
+def get_regex_keyword(regex: str | re.Pattern) -> str | None:
+    r"""
+    Get the literal keyword which must be the first word of any line that ``regex`` matches.
+
+    :return: The keyword, or None if ``regex`` does not start with ``^\s*`` (or ``^\s+``) and a literal keyword.
+    :rtype: Union[str,None]
+
+    .. code-block:: python
+
+        >>> get_regex_keyword(r"^\s*description\s+(\S.*)$")
+        'description'
+        >>> get_regex_keyword(r"^\s*(shut\S*)\s*$") is None
+        True
+        >>>
+    """
+    try:
+        return REGEX_KEYWORDS[regex]
+    except KeyError:
+        pass
+
+    retval = None
+    if isinstance(regex, re.Pattern):
+        pattern = regex.pattern if regex.flags & re.IGNORECASE == 0 and isinstance(regex.pattern, str) else ""
+    else:
+        pattern = regex
+    mm = _RE_LEADING_KEYWORD.search(pattern)
+    if mm is not None:
+        retval = mm.group(1)
+        # An alternation outside of a group does not have to start
+        #     with the keyword
+        depth = 0
+        in_class = False
+        escaped = False
+        for char in pattern:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif in_class:
+                in_class = char != "]"
+            elif char == "[":
+                in_class = True
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "|" and depth == 0:
+                retval = None
+                break
+    REGEX_KEYWORDS[regex] = retval
+    return retval
+
+
+#
+# -------------  Config Line text view
+#
+
+
+class ConfigLinesView(Sequence):
+    """A read-only sequence of the text of each object in a ConfigList(); the text is read from the objects when it is indexed, so the view never copies the configuration."""
+
+    __slots__ = ("_source",)
+
+    def __init__(self, source: Any):
+        """
+        :param source: A ConfigList() or a list of BaseCfgLine() instances
+        :type source: Any
+        """
+        self._source = source
+
+    def __repr__(self) -> str:
+        return f"<ConfigLinesView: {len(self)} lines>"
+
+    def __len__(self) -> int:
+        return len(getattr(self._source, "data", self._source))
+
+    def __getitem__(self, idx: int | slice) -> str | list[str]:
+        data = getattr(self._source, "data", self._source)
+        if isinstance(idx, slice):
+            return [obj.text for obj in data[idx]]
+        return data[idx].text
+
+
 #
 # -------------  Config Line ABC
 #
@@ -92,11 +289,24 @@ def get_brace_termination(line: str) -> str:
 class BaseCfgLine:
     """Base configuration object for all configuration line instances; in most cases, the configuration line will be a subclass of this object."""
 
-    all_text: Any = None
-    all_lines: Any = None
-    line: str = DEFAULT_TEXT
     _text: str = DEFAULT_TEXT
-    linenum: int = -1
+    _linenum: int = -1
+    # Gapped order label maintained by ConfigList(); see ConfigList().renumber()
+    _order_label: int = 0
+    # Copy-on-write epoch; see ConfigList().snapshot()
+    _cow_epoch: int = 0
+    # all_children / all_parents / lineage (keyed by name) and @mutation_cached
+    #     model properties (keyed by function), cached until the ConfigList() changes
+    _value_cache: dict | None = None
+    # get_unique_identifier() result, cleared when text or linenum changes
+    _unique_id: int | None = None
+    # Leading spaces of _text and the lazily-split words of _text; both are
+    #     maintained by the text and indent setters
+    _indent: int = 0
+    _words: tuple | None = None
+    # Typed regex match results keyed by (regex, group, result_type), cleared
+    #     when the text changes; see BaseCfgLine()._re_search_typed()
+    _typed_cache: dict | None = None
     parent: Any = None
     child_indent: int = 0
     _children: list | None = None
@@ -113,12 +323,12 @@ class BaseCfgLine:
     def __init__(self, all_lines=None, line=DEFAULT_TEXT, **kwargs):
         """Accept an IOS line number and initialize family relationship attributes"""
 
+        # all_lines (or the old all_text kwarg) is accepted so every
+        # factory class can be called like is_object_for(), but objects
+        # do not keep a reference to it; see BaseCfgLine().all_lines
+        #
         # Hack to accept old parameter names instead of finding all the places
-        # where `all_text` and `text` are used and renaming attributes all
-        # over the place
-        if isinstance(kwargs.get("all_text"), list):
-            # The all_text kwarg is now called all_lines
-            all_lines = kwargs.get("all_text")
+        # where `text` is used and renaming attributes all over the place
         if isinstance(kwargs.get("text"), str):
             # The text kwarg is now called line
             line = kwargs.get("text")
@@ -148,16 +358,19 @@ class BaseCfgLine:
 
         self._text: str = line
         self._children: list[BaseCfgLine] = children
-        self.linenum: int = int(linenum)
+        self._linenum: int = int(linenum)
+        self._order_label: int = 0
+        self._cow_epoch: int = 0
+        self._value_cache = None
+        self._unique_id = None
+        self._indent: int = len(line) - len(line.lstrip())
+        self._words = None
+        self._typed_cache = None
         self.parent: BaseCfgLine = self  # by default, assign parent as itself
         self.child_indent: int = int(child_indent)
         self.confobj = confobj
         self.blank_line_keep: bool = False  # CiscoConfParse() uses blank_line_keep
 
-        self.all_text: list[str] = all_lines
-        self.all_lines = all_lines
-        self.line = self._text
-
         # Implementing __setstate__ for loguru picking problems...
         self.__setstate__ = None
 
@@ -220,7 +433,8 @@ class BaseCfgLine:
         return len(self._text)
 
     # On BaseCfgLine()
-    @logger.catch(reraise=True)
+    # __hash__(), __eq__(), __gt__() and __lt__() are called for every set,
+    #     dict and sort operation, so they are not wrapped in logger.catch()
     def __hash__(self) -> int:
         """
         :return: A unique identifier for this object
@@ -233,31 +447,105 @@ class BaseCfgLine:
         return self.get_unique_identifier()
 
     # On BaseCfgLine()
-    @logger.catch(reraise=True)
     def __eq__(self, val):
-        if not getattr(val, "get_unique_identifier", False):
-            return False
+        if self is val:
+            return True
 
         try:
-            #   try / except is much faster than isinstance();
-            #   I added hash_arg() inline below for speed... whenever I change
-            #   self.__hash__() I *must* change this
             return self.get_unique_identifier() == val.get_unique_identifier()
-        except BaseException as eee:
-            logger.error(eee)
+        except AttributeError:
             return False
 
     # On BaseCfgLine()
-    @logger.catch(reraise=True)
     def __gt__(self, val):
+        # Objects in the same ConfigList() compare by order label, which
+        #     does not require renumbering the ConfigList() after edits
+        confobj = self.confobj
+        if confobj is not None and confobj is getattr(val, "confobj", None):
+            return self._order_label > val._order_label
         return self.linenum > val.linenum
 
     # On BaseCfgLine()
-    @logger.catch(reraise=True)
     def __lt__(self, val):
         # Ref: http://stackoverflow.com/a/7152796/667301
+        confobj = self.confobj
+        if confobj is not None and confobj is getattr(val, "confobj", None):
+            return self._order_label < val._order_label
         return self.linenum < val.linenum
 
+    # On BaseCfgLine()
+    @property
+    def linenum(self) -> int:
+        """
+        :return: The line number of this object in the configuration.  Line numbers are renumbered lazily (on the first read) after the configuration is modified.
+        :rtype: int
+        """
+        confobj = self.confobj
+        if confobj is not None and confobj.linenum_counter != confobj.mutation_counter:
+            confobj.renumber()
+        return self._linenum
+
+    # On BaseCfgLine()
+    @linenum.setter
+    def linenum(self, value: int) -> None:
+        self._linenum = value
+        self._unique_id = None
+
+    # On BaseCfgLine()
+    def _require_writable(self) -> None:
+        """
+        Raise :py:class:`~ciscoconfparse2.errors.ReadOnlyConfiguration` if this object belongs to a read-only ConfigList().
+
+        :rtype: None
+        """
+        if getattr(self.confobj, "read_only", False) is True:
+            error = f"{self} belongs to a configuration parsed with read_only=True; it cannot be modified"
+            logger.error(error)
+            raise ReadOnlyConfiguration(error)
+
+    # On BaseCfgLine()
+    def _unshare(self) -> None:
+        """
+        Copy this object's family into any :py:meth:`~ciscoconfparse2.CiscoConfParse.snapshot` that still shares it, before this object is modified in place.
+
+        :rtype: None
+        """
+        confobj = self.confobj
+        if getattr(confobj, "cow_shared", False) is True:
+            confobj._unshare_object(self)
+
+    # On BaseCfgLine()
+    def _drop_family_index(self) -> None:
+        """
+        Drop the :py:meth:`~ciscoconfparse2.ConfigList.family_end` index of the ConfigList() which owns this object; the index is keyed by indent.
+
+        :rtype: None
+        """
+        if getattr(self.confobj, "family_index", None) is not None:
+            self.confobj.family_index = None
+
+    # On BaseCfgLine()
+    def _journal_text_change(self, old_text: str) -> None:
+        """
+        Record a change from ``old_text`` in the undo journal of the ConfigList() which owns this object.
+
+        :rtype: None
+        """
+        confobj = self.confobj
+        if getattr(confobj, "journal", None) is not None:
+            confobj._record_text_change(self, old_text)
+
+    # On BaseCfgLine()
+    def _count_text_change(self) -> None:
+        """
+        Increment the ``text_mutation_counter`` of the ConfigList() which owns this object; this drops every :py:func:`mutation_cached` property value.
+
+        :rtype: None
+        """
+        confobj = self.confobj
+        if getattr(confobj, "text_mutation_counter", None) is not None:
+            confobj.text_mutation_counter += 1
+
     # On BaseCfgLine()
     @property
     @logger.catch(reraise=True)
@@ -271,24 +559,26 @@ class BaseCfgLine:
         raise ValueError(error)
 
     # On BaseCfgLine()
-    @logger.catch(reraise=True)
     def get_unique_identifier(self) -> int:
         """
-        :return: A unique number for the BaseCfgLine object
+        :return: A unique number for the BaseCfgLine object, based on its ``linenum`` and ``text``.  The value is cached until ``linenum`` or ``text`` changes.
         :rtype: int
         """
+        confobj = self.confobj
+        if confobj is not None and confobj.linenum_counter != confobj.mutation_counter:
+            confobj.renumber()
 
-        linenum = getattr(self, "linenum", None)
-        _text = getattr(self, "text", DEFAULT_TEXT)
-
-        return hash(linenum) * hash(_text)
+        unique_id = self._unique_id
+        if unique_id is None:
+            unique_id = hash(self._linenum) * hash(self._text)
+            self._unique_id = unique_id
+        return unique_id
 
     # On BaseCfgLine()
     @property
-    @logger.catch(reraise=True)
     def indent(self) -> int:
         """Return an integer indicating how many spaces this line is indented."""
-        return len(self._text) - len(self._text.lstrip())
+        return self._indent
 
     # On BaseCfgLine()
     @indent.setter
@@ -302,7 +592,16 @@ class BaseCfgLine:
         """
         text = copy(self._text)
         if value >= 0:
+            self._require_writable()
+            self._unshare()
             self._text = " " * int(value) + text.lstrip()
+            self._unique_id = None
+            self._typed_cache = None
+            if self._indent != int(value):
+                self._indent = int(value)
+                self._drop_family_index()
+            self._journal_text_change(text)
+            self._count_text_change()
             return value
 
         error = "BaseCfgLine().indent must be positive integer"
@@ -361,6 +660,47 @@ class BaseCfgLine:
         _text = getattr(self, "_text", DEFAULT_TEXT)
         return _text
 
+    # On BaseCfgLine()
+    @property
+    def line(self) -> str:
+        """An alias for ``text``"""
+        return self._text
+
+    # On BaseCfgLine()
+    @line.setter
+    def line(self, value: str) -> None:
+        self.text = value
+
+    # On BaseCfgLine()
+    @property
+    def all_lines(self) -> ConfigLinesView | None:
+        """
+        :return: A :py:class:`ConfigLinesView` of the text of every line in the ConfigList() which owns this object, or None if no ConfigList() owns it.  Objects do not store the configuration text list.
+        :rtype: ConfigLinesView
+        """
+        if self.confobj is None:
+            return None
+        return ConfigLinesView(self.confobj)
+
+    # On BaseCfgLine()
+    @property
+    def all_text(self) -> ConfigLinesView | None:
+        """An alias for ``all_lines``"""
+        return self.all_lines
+
+    # On BaseCfgLine()
+    @property
+    def words(self) -> tuple[str, ...]:
+        """
+        :return: The whitespace-separated words of ``text``; the tuple is built the first time it is read and rebuilt after ``text`` changes
+        :rtype: tuple[str, ...]
+        """
+        words = self._words
+        if words is None:
+            words = tuple(self._text.split())
+            self._words = words
+        return words
+
     # On BaseCfgLine()
     @text.setter
     @logger.catch(reraise=True)
@@ -375,12 +715,27 @@ class BaseCfgLine:
         """
         is_comment = getattr(self, "is_comment", None)
         if isinstance(value, str):
+            self._require_writable()
+            self._unshare()
+            old_text = getattr(self, "_text", DEFAULT_TEXT)
+            old_indent = self._indent
             self._text = self.safe_escape_curly_braces(value)
+            self._unique_id = None
+            self._indent = len(self._text) - len(self._text.lstrip())
+            self._words = None
+            self._typed_cache = None
+            if self._indent != old_indent:
+                self._drop_family_index()
+            self._journal_text_change(old_text)
+            self._count_text_change()
 
             if is_comment is True:
                 # VERY IMPORTANT: due to old behavior, comment parents MUST be self
                 #
                 self.parent = self
+                if getattr(self.confobj, "mutation_counter", None) is not None:
+                    # Drop cached family views
+                    self.confobj.mutation_counter += 1
         else:
             error = f"BaseCfgLine() does not support 'text' assignment of {type(value)}"
             logger.error(error)
@@ -416,9 +771,9 @@ class BaseCfgLine:
     @property
     @logger.catch(reraise=True)
     def children(self):
-        """Return the direct children of this object"""
+        """Return the direct children of this object; the children are a tuple if the object belongs to a read-only configuration"""
 
-        if isinstance(self._children, list):
+        if isinstance(self._children, (list, tuple)):
             return self._children
         error = f"Fatal: {type(self._children)} found as BaseCfgLine().children; it should be a list."
         logger.critical(error)
@@ -427,6 +782,7 @@ class BaseCfgLine:
     @children.setter
     @logger.catch(reraise=True)
     def children(self, arg):
+        self._require_writable()
         if isinstance(arg, list):
             self._children = arg
             return self._children
@@ -527,7 +883,13 @@ class BaseCfgLine:
         :return: The line number of the last child (or grandchild, etc)
         :rtype: int
         """
+        confobj = self.confobj
+        if getattr(confobj, "family_index", False) is not False:
+            family_end = confobj.family_end(self)
+            if family_end is not None:
+                return confobj._family_linenum(family_end)
 
+        # This object is not in a ConfigList() (or was replaced by a commit)
         if not isinstance(self.all_children, list):
             raise ValueError
 
@@ -559,10 +921,14 @@ class BaseCfgLine:
             logger.critical(error)
             raise NotImplementedError(error)
 
-        retval = set()
+        return list(self._cached_family("all_parents", self._build_all_parents))
+
+    # On BaseCfgLine()
+    def _build_all_parents(self) -> list:
+        retval = []
         this = self
-        while this.parent != this:
-            retval.add(this.parent)
+        while this.parent is not this:
+            retval.append(this.parent)
             this = this.parent
         return sorted(retval)
 
@@ -573,13 +939,38 @@ class BaseCfgLine:
         :return: A sequence of all child objects, not including this object
         :rtype: List[BaseCfgLine]
         """
+        return list(self._cached_family("all_children", self._build_all_children))
+
+    # On BaseCfgLine()
+    def _build_all_children(self) -> list:
         retval = []
         if self.has_children:
             for child in self.children:
                 retval.append(child)
-                retval.extend(child.all_children)
+                retval.extend(child._cached_family("all_children", child._build_all_children))
         return sorted(retval)
 
+    # On BaseCfgLine()
+    def _cached_family(self, name: str, build: Callable) -> list:
+        """
+        :return: The cached ``name`` family view, which is built with ``build()`` the first time it is read after the ConfigList() changes.  Callers must not modify the returned list.
+        :rtype: List[BaseCfgLine]
+        """
+        mutation_counter = getattr(self.confobj, "mutation_counter", None)
+        if mutation_counter is None:
+            # Objects without a ConfigList() are not cached
+            return build()
+
+        cache = self._value_cache
+        if cache is None:
+            cache = self._value_cache = {}
+
+        cached = cache.get(name)
+        if cached is None or cached[0] != mutation_counter:
+            cached = (mutation_counter, build())
+            cache[name] = cached
+        return cached[1]
+
     # On BaseCfgLine()
     @property
     def classname(self) -> str:
@@ -596,7 +987,7 @@ class BaseCfgLine:
         :return: Whether this object has children
         :rtype: bool
         """
-        return isinstance(self.children, list) and len(self.children) > 0
+        return isinstance(self.children, (list, tuple)) and len(self.children) > 0
 
     # On BaseCfgLine()
     @property
@@ -665,53 +1056,29 @@ class BaseCfgLine:
            >>>
         """
 
+        if self.confobj is None:
+            raise NotImplementedError()
+
         if self.confobj.debug >= 1:
             logger.info(f"{self}.delete() was called.")
 
-        if self in self.confobj.data:
-            # Build a set of all IOSCfgLine() object instances to be deleted...
-            delete_these = {self}
-        else:
+        # Find the live instance of this object in the ConfigList()
+        idx = self.confobj._object_index(self)
+        if idx is None:
             error = f"{self} instance no longer exists in the same place."
             logger.critical(error)
             raise ConfigListItemDoesNotExist(error)
+        liveobj = self.confobj.data[idx]
 
         if self.confobj.debug >= 1:
-            logger.debug(f"Executing <IOSCfgLine line #{self.linenum}>.delete(recurse=True)")
+            logger.debug(f"Executing <IOSCfgLine line #{liveobj.linenum}>.delete(recurse=True)")
 
-        # NOTE - 1.5.30 changed this from iterating over self.children
+        # NOTE - 1.5.30 changed this from deleting self.children
         #        to self.all_children
-        for child in self.all_children:
-            delete_these.add(child)
-
-        # reverse is important here so we can delete a range of line numbers
-        # without clobbering the line numbers that haven't been deleted
-        # yet...
-        for obj in sorted(delete_these, reverse=True):
-            linenum = obj.linenum
-            if self.confobj.debug >= 1:
-                logger.debug(f"    Deleting <IOSCfgLine(line # {linenum})>.")
-            # If there has not been a commit between the last search
-            # and delete, the line-number could be wrong...
-            try:
-                del self.confobj.data[linenum]
-            except BaseException as eee:
-                logger.critical(str(eee))
-                raise eee
-
-        #######################################################################
-        # IMPORTANT: delete this object from it's parents' list of direct
-        # children
-        #######################################################################
-        parentobj = self.parent
-        for cobj in parentobj.children:
-            if cobj is self:
-                parentobj.children.remove(cobj)
-
-        if self.confobj and self.confobj.auto_commit:
+        self.confobj._delete_family(liveobj)
+
+        if self.confobj.auto_commit:
             self.ccp_ref.commit()
-        elif self.confobj is None:
-            raise NotImplementedError()
 
         return True
 
@@ -861,9 +1228,6 @@ class BaseCfgLine:
             logger.warning(warning_msg)
             warn(warning_msg)
 
-        # Get the value of auto_commit from the ConfigList()
-        auto_commit = bool(self.confobj.auto_commit)
-
         auto_indent_width = self.ccp_ref.auto_indent_width
 
         if indent == 0:
@@ -893,29 +1257,23 @@ class BaseCfgLine:
             raise ValueError(error)
 
         ##############################################################
-        # Get the last child linenum for proper append behavior
+        # Get the index of the last family member for proper append
+        # behavior
         ##############################################################
-        if len(self.all_children) > 0:
-            last_linenum = self.all_children[-1].linenum
+        confobj = self.confobj
+        idx = confobj._object_index(self)
+        if idx is None:
+            # This object was replaced by a commit; use its last line numbers
+            last_idx = self.family_endpoint
+        elif len(confobj.data[idx].all_children) > 0:
+            last_idx = confobj._object_index(confobj.data[idx].all_children[-1])
         else:
-            last_linenum = self.linenum
-
-        ##############################################################
-        # Build the new object to be inserted
-        ##############################################################
-        this_class = type(self)
-        new_obj = this_class(line=" " * indent + insertstr.lstrip())
-        new_obj.parent = self
-        new_obj.linenum = last_linenum + 1
+            last_idx = idx
 
         ##############################################################
         # Add the new object to the ConfigList()
         ##############################################################
-        self._children.append(new_obj)
-        self.confobj.insert(new_obj.linenum, new_obj)
-
-        # Fix up the configuration after appending to family...
-        self.confobj.rebuild_after_modification(commit=auto_commit)
+        confobj.insert(last_idx + 1, " " * indent + insertstr.lstrip())
 
     # On BaseCfgLine()
     @logger.catch(reraise=True)
@@ -1327,6 +1685,93 @@ class BaseCfgLine:
             raise InvalidTypecast(error)
         return retval
 
+    # On BaseCfgLine()
+    def _re_search_typed(self, regex: str | re.Pattern, group: int | str = 1, result_type: type = str) -> Any:
+        """
+        Search the text of this object with ``regex`` and cast match ``group`` as ``result_type``.  The result is cached until the text changes, so values such as :class:`~ciscoconfparse2.ccp_util.IPv4Obj` are only built once per line.
+
+        .. note::
+
+           Mutable cached values are returned as a shallow copy (see :func:`copy_cached_value`), so callers may modify the value without changing the cache.
+
+        :return: The typed value, ``TYPED_NO_MATCH`` if ``regex`` does not match, or ``TYPED_NO_GROUP`` if ``group`` did not participate in the match
+        :rtype: Any
+        """
+        key = (regex, group, result_type)
+        typed_cache = self._typed_cache
+        if typed_cache is None:
+            typed_cache = self._typed_cache = {}
+        else:
+            retval = typed_cache.get(key, None)
+            if retval is TYPED_NO_MATCH or retval is TYPED_NO_GROUP:
+                return retval
+            elif retval is not None:
+                return copy_cached_value(retval)
+
+        mm = compiled_regex(regex).search(self._text)
+        if mm is None:
+            retval = TYPED_NO_MATCH
+        elif mm.group(group) is None:
+            retval = TYPED_NO_GROUP
+        else:
+            retval = result_type(mm.group(group))
+            if retval is None:
+                # Do not cache None, it is the cache miss value
+                return retval
+            typed_cache[key] = retval
+            return copy_cached_value(retval)
+        typed_cache[key] = retval
+        return retval
+
+    # On BaseCfgLine()
+    def _build_keyword_index(self) -> dict[str, list[BaseCfgLine]]:
+        """
+        Walk this object and all its children once, and index them by the first word of their text.
+
+        :return: A dict of lists of objects (in configuration order), keyed by their first word
+        :rtype: Dict[str,List[BaseCfgLine]]
+        """
+        keyword_index = {}
+        for obj in [self, *self.all_children]:
+            words = obj.words
+            if len(words) > 0:
+                keyword_index.setdefault(words[0], []).append(obj)
+        return keyword_index
+
+    # On BaseCfgLine()
+    @contextmanager
+    def _keyword_index_scope(self) -> Iterator[dict[str, list[BaseCfgLine]]]:
+        """
+        Build the keyword index of this family, and use it for the typed searches of this object in the current thread (or asyncio task) until the ``with`` block exits.  The index is never stored on the object, so other threads which read the same object are not affected.
+
+        :return: A context manager which yields the keyword index
+        :rtype: Iterator[Dict[str,List[BaseCfgLine]]]
+        """
+        keyword_index = self._build_keyword_index()
+        indexes = KEYWORD_INDEXES.get()
+        token = KEYWORD_INDEXES.set({**(indexes or {}), id(self): keyword_index})
+        try:
+            yield keyword_index
+        finally:
+            KEYWORD_INDEXES.reset(token)
+
+    # On BaseCfgLine()
+    def _keyword_candidates(self, regex: str | re.Pattern) -> list[BaseCfgLine] | None:
+        """
+        :return: The objects in this family which ``regex`` could match, if a keyword index is in scope (see ``_keyword_index_scope()``) and ``regex`` starts with a literal keyword; otherwise None.
+        :rtype: Union[List[BaseCfgLine],None]
+        """
+        indexes = KEYWORD_INDEXES.get()
+        if indexes is None:
+            return None
+        keyword_index = indexes.get(id(self), None)
+        if keyword_index is None:
+            return None
+        keyword = get_regex_keyword(regex)
+        if keyword is None:
+            return None
+        return keyword_index.get(keyword, [])
+
     # On BaseCfgLine()
     def replace_text(self, before, after, count=-1) -> str:
         """String replace ``before`` with ``after``
@@ -1474,7 +1919,7 @@ class BaseCfgLine:
             logger.critical(error)
             raise NotImplementedError(error)
 
-        mm = re.search(regex, self.text)
+        mm = compiled_regex(regex).search(self._text)
         if mm is not None:
             return mm.group(group)
         return default
@@ -1508,7 +1953,7 @@ class BaseCfgLine:
             if debug > 0:
                 logger.debug(f"'{regex}' is a substring of '{self.text}'")
             retval = self.text
-        elif re.search(regex, self.text) is not None:
+        elif compiled_regex(regex).search(self.text) is not None:
             ## TODO: use re.escape(regex) on all regex, instead of bare regex
             if debug > 0:
                 logger.debug(f"re.search('{regex}', '{self.text}') matches")
@@ -1658,9 +2103,9 @@ class BaseCfgLine:
         if groupdict is not None:
             raise NotImplementedError("groupdict is not supported at this time")
 
-        mm = re.search(regex, self.text)
-        if mm is not None and mm.group(group) is not None:
-            return result_type(mm.group(group))
+        retval = self._re_search_typed(regex, group, result_type)
+        if retval is not TYPED_NO_MATCH and retval is not TYPED_NO_GROUP:
+            return retval
 
         if untyped_default:
             return default
@@ -1757,19 +2202,30 @@ class BaseCfgLine:
             if debug is True:
                 logger.debug(f"    {self}.re_match_iter_typed() is checking with `groupdict`=None")
 
+            candidates = self._keyword_candidates(regex) if recurse else None
+            if candidates is not None:
+                # Only check lines which start with the regex keyword
+                for cobj in candidates:
+                    retval = cobj._re_search_typed(regex, group, result_type)
+                    if retval is not TYPED_NO_MATCH:
+                        return result_type(None) if retval is TYPED_NO_GROUP else retval
+                if untyped_default is True:
+                    return default
+                return result_type(default)
+
             # Return the result if the parent line matches the regex...
-            mm = re.search(regex, self.text)
-            if isinstance(mm, re.Match):
-                return result_type(mm.group(group))
+            retval = self._re_search_typed(regex, group, result_type)
+            if retval is not TYPED_NO_MATCH:
+                return result_type(None) if retval is TYPED_NO_GROUP else retval
 
             if not recurse:
                 # Only work on direct children if not recurse
                 for cobj in self.children:
                     if debug is True:
                         logger.debug(f"    {self}.re_match_iter_typed() is checking match of r'''{regex}''' on -->{cobj}<--")
-                    mm = re.search(regex, cobj.text)
-                    if isinstance(mm, re.Match):
-                        return result_type(mm.group(group))
+                    retval = cobj._re_search_typed(regex, group, result_type)
+                    if retval is not TYPED_NO_MATCH:
+                        return result_type(None) if retval is TYPED_NO_GROUP else retval
 
                 ## Ref Github issue #121
                 if untyped_default:
@@ -1780,9 +2236,9 @@ class BaseCfgLine:
             for cobj in self.all_children:
                 if debug is True:
                     logger.debug(f"    {self}.re_match_iter_typed() is checking match of r'''{regex}''' on -->{cobj}<--")
-                mm = re.search(regex, cobj.text)
-                if isinstance(mm, re.Match):
-                    return result_type(mm.group(group))
+                retval = cobj._re_search_typed(regex, group, result_type)
+                if retval is not TYPED_NO_MATCH:
+                    return result_type(None) if retval is TYPED_NO_GROUP else retval
 
             ## Ref Github issue #121
             if untyped_default is True:
@@ -1793,8 +2249,9 @@ class BaseCfgLine:
             if debug is True:
                 logger.debug(f"    {self}.re_match_iter_typed() is checking with `groupdict`={groupdict}")
 
+            regex = compiled_regex(regex)
             # Return the result if the parent line matches the regex...
-            mm = re.search(regex, self.text)
+            mm = regex.search(self.text)
             if isinstance(mm, re.Match):
                 return self.get_regex_typed_dict(
                     regex=mm,
@@ -1805,7 +2262,7 @@ class BaseCfgLine:
 
             if not recurse:
                 for cobj in self.children:
-                    mm = re.search(regex, cobj.text)
+                    mm = regex.search(cobj.text)
                     return self.get_regex_typed_dict(
                         regex=mm,
                         type_dict=groupdict,
@@ -1820,7 +2277,7 @@ class BaseCfgLine:
                 )
 
             for cobj in self.all_children:
-                mm = re.search(regex, cobj.text)
+                mm = regex.search(cobj.text)
                 if isinstance(mm, re.Match):
                     return self.get_regex_typed_dict(
                         regex=mm,
@@ -1961,24 +2418,23 @@ class BaseCfgLine:
         retval = []
 
         # Append to return values if the parent line matches the regex...
-        mm = re.search(regex, self.text)
-        if isinstance(mm, re.Match):
-            retval.append(result_type(mm.group(group)))
-
         if recurse is False:
-            for cobj in self.children:
-                if debug is True:
-                    logger.debug(f"    {self}.re_list_iter_typed() is checking match of r'''{regex}''' on -->{cobj}<--")
-                mm = re.search(regex, cobj.text)
-                if isinstance(mm, re.Match):
-                    retval.append(result_type(mm.group(group)))
+            objs = [self, *self.children]
         else:
-            for cobj in self.all_children:
-                if debug is True:
-                    logger.debug(f"    {self}.re_list_iter_typed() is checking match of r'''{regex}''' on -->{cobj}<--")
-                mm = re.search(regex, cobj.text)
-                if isinstance(mm, re.Match):
-                    retval.append(result_type(mm.group(group)))
+            # Only check lines which start with the regex keyword, if there
+            #     is a keyword index
+            objs = self._keyword_candidates(regex)
+            if objs is None:
+                objs = [self, *self.all_children]
+
+        for cobj in objs:
+            if debug is True and cobj is not self:
+                logger.debug(f"    {self}.re_list_iter_typed() is checking match of r'''{regex}''' on -->{cobj}<--")
+            value = cobj._re_search_typed(regex, group, result_type)
+            if value is TYPED_NO_GROUP:
+                retval.append(result_type(None))
+            elif value is not TYPED_NO_MATCH:
+                retval.append(value)
         return retval
 
     @logger.catch(reraise=True)
@@ -1999,8 +2455,9 @@ class BaseCfgLine:
 
         retval = []
 
+        regex = compiled_regex(regex)
         # Return the result if the parent line matches the regex...
-        mm = re.search(regex, self.text)
+        mm = regex.search(self.text)
         if isinstance(mm, re.Match):
             tmp = self.get_regex_typed_dict(
                 regex=mm,
@@ -2011,7 +2468,7 @@ class BaseCfgLine:
 
         if recurse is False:
             for cobj in self.children:
-                mm = re.search(regex, cobj.text)
+                mm = regex.search(cobj.text)
                 tmp = self.get_regex_typed_dict(
                     regex=mm,
                     type_dict=groupdict,
@@ -2021,7 +2478,7 @@ class BaseCfgLine:
             return retval
 
         for cobj in self.all_children:
-            mm = re.search(regex, cobj.text)
+            mm = regex.search(cobj.text)
             if isinstance(mm, re.Match):
                 tmp = self.get_regex_typed_dict(
                     regex=mm,
@@ -2069,6 +2526,13 @@ class BaseCfgLine:
             second-child (idx: 2)
              second-child-child (idx: 3)  <-- return this index number
         """
+        confobj = self.confobj
+        if getattr(confobj, "family_index", False) is not False and confobj.family_end(self) is not None:
+            # Use the family index of the ConfigList() instead of
+            #     classifying the indent of every object
+            last_sibling = confobj.last_at_indent(self.indent)
+            return confobj._family_linenum(confobj.family_end(last_sibling))
+
         ######################################################################
         # Find the last 'sibling' object of this object
         ######################################################################
@@ -2098,6 +2562,10 @@ class BaseCfgLine:
 
            All children of this object are returned.
         """
+        return list(self._cached_family("lineage", self._build_lineage))
+
+    # On BaseCfgLine()
+    def _build_lineage(self) -> list:
         retval = self.all_parents
         retval.append(self)
         if self.children:
@@ -37,11 +37,13 @@ mike [~at~] pennington !dot! net
 from __future__ import annotations
 
 import copy
+import functools
 import os
 import re
 import socket
 import sys
 import time
+from array import array
 from collections import UserList
 from collections.abc import Callable, Sequence
 from ipaddress import (
@@ -51,7 +53,10 @@ from ipaddress import (
     IPv6Address,
     IPv6Network,
     collapse_addresses as ipaddr_collapse_addresses,
+    ip_address,
+    ip_network,
 )
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 import attrs
@@ -65,6 +70,7 @@ import ciscoconfparse2
 from ciscoconfparse2.errors import (
     DuplicateMember,
     DynamicAddressException,
+    InvalidCiscoEthernetVlan,
     InvalidCiscoInterface,
     InvalidCiscoRange,
     InvalidMember,
@@ -92,6 +98,10 @@ IPV6_MAXSTR_LEN = 39 + 4  # String length with colons, slash and masklen
 IPV4_MAX_PREFIXLEN = 32
 IPV6_MAX_PREFIXLEN = 128
 
+# The highest vlan number that fits in a CiscoVlanSet() bitmask
+MAX_VLAN_BIT = 4095
+VLAN_BITMASK = (1 << (MAX_VLAN_BIT + 1)) - 1
+
 
 _IPV6_RGX_CLS = r"[0-9a-fA-F]{1,4}"
 _CISCO_RANGE_ATOM_STR = r"""\d+\s*\-*\s*\d*"""
@@ -2096,6 +2106,419 @@ class IPv6Obj:
         return self.network_object.sixtofour
 
 
+# IPPrefixTrie() node slots
+_TRIE_ZERO = 0
+_TRIE_ONE = 1
+_TRIE_PREFIX = 2
+_TRIE_VALUE = 3
+
+
+class IPPrefixTrie:
+    """A binary trie of IPv4 and IPv6 prefixes for longest-prefix match.
+
+    Prefixes may be ``IPv4Obj()``, ``IPv6Obj()`` or strings such as '192.0.2.0/24'.  A lookup walks one trie node per bit of the address prefix, so it costs O(prefix length) no matter how many prefixes are stored.  An address matches a prefix with the same rules as ``addr in prefix`` on ``IPv4Obj()`` and ``IPv6Obj()``; the address network must fit inside the prefix.
+
+    Examples
+    --------
+
+    >>> from ciscoconfparse2.ccp_util import IPPrefixTrie
+    >>> trie = IPPrefixTrie(['10.0.0.0/8', '10.1.0.0/16', '2001:db8::/32'])
+    >>> trie.longest_match('10.1.2.3')
+    <IPv4Obj 10.1.0.0/16>
+    >>> '192.0.2.1' in trie
+    False
+    >>> trie.add('0.0.0.0/0', value='default')
+    >>> trie.lookup('192.0.2.1')
+    'default'
+    """
+
+    __slots__ = ("_roots", "_count")
+
+    # This method is on IPPrefixTrie()
+    @logger.catch(reraise=True)
+    def __init__(self, prefixes: Sequence[IPv4Obj | IPv6Obj | str] | dict[IPv4Obj | IPv6Obj | str, Any] | None = None):
+        # One root per IP version; each node is a list of
+        #     [zero_child, one_child, prefix_or_None, value]
+        self._roots = {4: [None, None, None, None], 6: [None, None, None, None]}
+        self._count = 0
+        if isinstance(prefixes, dict):
+            for prefix, value in prefixes.items():
+                self.add(prefix, value=value)
+        elif prefixes is not None:
+            for prefix in prefixes:
+                self.add(prefix)
+
+    # This method is on IPPrefixTrie()
+    def __repr__(self) -> str:
+        return f"<IPPrefixTrie {self._count} prefixes>"
+
+    # This method is on IPPrefixTrie()
+    def __len__(self) -> int:
+        return self._count
+
+    # This method is on IPPrefixTrie()
+    def __contains__(self, addr: IPv4Obj | IPv6Obj | str) -> bool:
+        return self._find(addr) is not None
+
+    # This method is on IPPrefixTrie()
+    def __iter__(self):
+        for prefix, _ in self.items():
+            yield prefix
+
+    # This method is on IPPrefixTrie()
+    @staticmethod
+    def _network(addr: IPv4Obj | IPv6Obj | str) -> IPv4Network | IPv6Network | None:
+        """Return the stdlib network of ``addr``, or None if ``addr`` is an empty IPv4Obj() or IPv6Obj()"""
+        if isinstance(addr, str):
+            try:
+                # Skip building an IPv4Obj() for plain address / prefix strings
+                return ip_network(addr, strict=False)
+            except ValueError:
+                addr = IPv6Obj(addr) if ":" in addr else IPv4Obj(addr)
+
+        if isinstance(addr, (IPv4Obj, IPv6Obj)):
+            if addr.empty is True:
+                return None
+            return addr.network_object
+
+        error = f"IPPrefixTrie() cannot use {type(addr)} {addr}; use an IPv4Obj(), IPv6Obj() or a string"
+        logger.error(error)
+        raise InvalidParameters(error)
+
+    # This method is on IPPrefixTrie()
+    @logger.catch(reraise=True)
+    def add(self, prefix: IPv4Obj | IPv6Obj | str, value: Any = None) -> None:
+        """Add ``prefix`` to the trie.  ``lookup()`` returns ``value`` for addresses in ``prefix``; ``value`` defaults to the IPv4Obj() or IPv6Obj() of ``prefix``.  Adding a prefix again replaces its value."""
+        if isinstance(prefix, str):
+            prefix = IPv6Obj(prefix) if ":" in prefix else IPv4Obj(prefix)
+        network = self._network(prefix)
+        if network is None:
+            error = f"IPPrefixTrie() cannot add an empty {type(prefix).__name__}()"
+            logger.error(error)
+            raise ValueError(error)
+
+        netint = int(network.network_address)
+        shift = network.max_prefixlen - 1
+        node = self._roots[network.version]
+        for _ in range(network.prefixlen):
+            bit = (netint >> shift) & 1
+            child = node[bit]
+            if child is None:
+                child = node[bit] = [None, None, None, None]
+            node = child
+            shift -= 1
+
+        if node[_TRIE_PREFIX] is None:
+            self._count += 1
+        node[_TRIE_PREFIX] = prefix
+        node[_TRIE_VALUE] = prefix if value is None else value
+
+    # This method is on IPPrefixTrie()
+    def _find(self, addr: IPv4Obj | IPv6Obj | str) -> list | None:
+        """Return the trie node of the longest prefix which contains ``addr``, or None"""
+        network = self._network(addr)
+        if network is None:
+            return None
+
+        netint = int(network.network_address)
+        shift = network.max_prefixlen - 1
+        node = self._roots[network.version]
+        best = node if node[_TRIE_PREFIX] is not None else None
+        for _ in range(network.prefixlen):
+            node = node[(netint >> shift) & 1]
+            if node is None:
+                break
+            if node[_TRIE_PREFIX] is not None:
+                best = node
+            shift -= 1
+        return best
+
+    # This method is on IPPrefixTrie()
+    def longest_match(self, addr: IPv4Obj | IPv6Obj | str) -> IPv4Obj | IPv6Obj | None:
+        """
+        :return: The longest prefix which contains ``addr``, or None if no prefix contains ``addr``.
+        :rtype: Union[IPv4Obj, IPv6Obj, None]
+        """
+        node = self._find(addr)
+        if node is None:
+            return None
+        return node[_TRIE_PREFIX]
+
+    # This method is on IPPrefixTrie()
+    def lookup(self, addr: IPv4Obj | IPv6Obj | str, default: Any = None) -> Any:
+        """
+        :return: The value of the longest prefix which contains ``addr``, or ``default`` if no prefix contains ``addr``.
+        :rtype: Any
+        """
+        node = self._find(addr)
+        if node is None:
+            return default
+        return node[_TRIE_VALUE]
+
+    # This method is on IPPrefixTrie()
+    def get(self, prefix: IPv4Obj | IPv6Obj | str, default: Any = None) -> Any:
+        """
+        :return: The value of exactly ``prefix``, or ``default`` if ``prefix`` was not added.
+        :rtype: Any
+        """
+        network = self._network(prefix)
+        if network is None:
+            return default
+
+        netint = int(network.network_address)
+        shift = network.max_prefixlen - 1
+        node = self._roots[network.version]
+        for _ in range(network.prefixlen):
+            node = node[(netint >> shift) & 1]
+            if node is None:
+                return default
+            shift -= 1
+        if node[_TRIE_PREFIX] is None:
+            return default
+        return node[_TRIE_VALUE]
+
+    # This method is on IPPrefixTrie()
+    def items(self):
+        """Yield a ``(prefix, value)`` tuple for each prefix; IPv4 prefixes come first, and each version is in address order"""
+        for version in (4, 6):
+            stack = [self._roots[version]]
+            while stack:
+                node = stack.pop()
+                if node[_TRIE_PREFIX] is not None:
+                    yield node[_TRIE_PREFIX], node[_TRIE_VALUE]
+                if node[_TRIE_ONE] is not None:
+                    stack.append(node[_TRIE_ONE])
+                if node[_TRIE_ZERO] is not None:
+                    stack.append(node[_TRIE_ZERO])
+
+
+# StaticRoute.from_words() keywords which take the next word as a value
+_STATIC_ROUTE_VALUE_KEYWORDS = {
+    "name": "name",
+    "description": "name",
+    "track": "track",
+    "tag": "tag",
+    "nexthop-vrf": "next_hop_vrf",
+    "vrf": "next_hop_vrf",
+    "next-hop": "next_hop_addr",
+    "qualified-next-hop": "next_hop_addr",
+    "preference": "admin_distance",
+    "distance": "admin_distance",
+}
+
+
+@attrs.define(frozen=True)
+class StaticRoute:
+    """A compact, immutable record of one static route.
+
+    :py:meth:`~ciscoconfparse2.CiscoConfParse.route_table` builds these; compare them across devices with ``==`` or ``attrs.asdict()``.  ``linenum`` is not part of ``==`` or ``hash()``, so the same route on different lines compares equal.
+    """
+
+    prefix: IPv4Obj | IPv6Obj
+    vrf: str = ""
+    next_hop_addr: str = ""
+    next_hop_interface: str = ""
+    next_hop_vrf: str = ""
+    admin_distance: int = 1
+    track: str = ""
+    name: str = ""
+    tag: int | None = None
+    permanent: bool = False
+    linenum: int = attrs.field(default=-1, eq=False)
+
+    # This method is on StaticRoute()
+    @classmethod
+    def from_words(
+        cls,
+        words: Sequence[str],
+        vrf: str = "",
+        linenum: int = -1,
+        interface_first: bool = False,
+    ) -> StaticRoute | None:
+        """
+        Build a StaticRoute() from the words of a static route which follow keywords such as 'ip route' or 'ip route vrf RED'.  The prefix may be CIDR or a network and a netmask; the words after it may be in the IOS, NXOS, IOS-XR, ASA or Junos order.  Set ``interface_first`` for the ASA order, where the interface name comes before the prefix.
+
+        :return: A StaticRoute(), or None if the words do not start with a prefix (such as 'ip route static bfd ...').
+        :rtype: Union[StaticRoute, None]
+        """
+        fields = {"vrf": vrf, "linenum": linenum}
+        idx = 0
+        if interface_first:
+            if len(words) < 2:
+                return None
+            fields["next_hop_interface"] = words[0]
+            idx = 1
+
+        if idx >= len(words):
+            return None
+        prefix_str = words[idx]
+        try:
+            ip_address(prefix_str.split("/", 1)[0])
+        except ValueError:
+            return None
+        if "/" in prefix_str:
+            idx += 1
+        elif idx + 1 < len(words) and "." in words[idx + 1]:
+            prefix_str = f"{prefix_str}/{words[idx + 1]}"
+            idx += 2
+        else:
+            idx += 1
+
+        if ":" in prefix_str:
+            prefix = IPv6Obj(prefix_str)
+        else:
+            prefix = IPv4Obj(prefix_str, strict=False)
+
+        while idx < len(words):
+            word = words[idx]
+            idx += 1
+            field = _STATIC_ROUTE_VALUE_KEYWORDS.get(word)
+            if field is not None and idx < len(words):
+                fields[field] = words[idx]
+                idx += 1
+            elif word == "permanent":
+                fields["permanent"] = True
+            elif word.isdigit():
+                fields["admin_distance"] = word
+            elif "next_hop_addr" not in fields and _is_ip_address(word):
+                fields["next_hop_addr"] = word
+            elif "next_hop_interface" not in fields and "next_hop_addr" not in fields and word not in {"dhcp", "global", "unicast", "multicast"}:
+                fields["next_hop_interface"] = word
+
+        fields["admin_distance"] = int(fields.get("admin_distance", 1))
+        if "tag" in fields:
+            fields["tag"] = int(fields["tag"])
+        return cls(prefix=prefix, **fields)
+
+
+def _is_ip_address(word: str) -> bool:
+    """Return True if ``word`` is an IPv4 or IPv6 address without a prefix length"""
+    try:
+        ip_address(word)
+    except ValueError:
+        return False
+    return True
+
+
+class RouteTable:
+    """The static routes of one VRF, indexed by prefix in an ``IPPrefixTrie()``.
+
+    ``lookup()`` returns the routes of the longest prefix which contains an address in O(prefix length), lowest administrative distance first.
+
+    Examples
+    --------
+
+    >>> from ciscoconfparse2 import CiscoConfParse
+    >>> parse = CiscoConfParse(['ip route 0.0.0.0 0.0.0.0 192.0.2.1', 'ip route 10.0.0.0 255.0.0.0 192.0.2.2 track 5'])
+    >>> table = parse.route_table()
+    >>> [(route.next_hop_addr, route.track) for route in table.lookup('10.1.1.1')]
+    [('192.0.2.2', '5')]
+    """
+
+    __slots__ = ("vrf", "_trie", "_count")
+
+    # This method is on RouteTable()
+    def __init__(self, routes: Sequence[StaticRoute] = (), vrf: str = ""):
+        self.vrf = vrf
+        self._trie = IPPrefixTrie()
+        self._count = 0
+        for route in routes:
+            self.add(route)
+
+    # This method is on RouteTable()
+    def __repr__(self) -> str:
+        return f"<RouteTable vrf: '{self.vrf}' {self._count} routes>"
+
+    # This method is on RouteTable()
+    def __len__(self) -> int:
+        return self._count
+
+    # This method is on RouteTable()
+    def __iter__(self):
+        for _, routes in self._trie.items():
+            yield from routes
+
+    # This method is on RouteTable()
+    def add(self, route: StaticRoute) -> None:
+        """Add ``route`` to the table; routes to the same prefix are kept in administrative distance order"""
+        routes = self._trie.get(route.prefix)
+        if routes is None:
+            routes = []
+            self._trie.add(route.prefix, value=routes)
+        routes.append(route)
+        routes.sort(key=attrgetter("admin_distance"))
+        self._count += 1
+
+    # This method is on RouteTable()
+    def lookup(self, addr: IPv4Obj | IPv6Obj | str) -> list[StaticRoute]:
+        """
+        :return: The routes of the longest prefix which contains ``addr``, lowest administrative distance first; an empty list if no route contains ``addr``.
+        :rtype: List[StaticRoute]
+        """
+        return list(self._trie.lookup(addr, default=()))
+
+
+# CiscoConfParse().interface_columns() columns; each value is the
+#     array.array typecode of the column (None for a list of str), and
+#     the value stored when an interface does not have the attribute
+INTERFACE_COLUMNS: dict[str, tuple[str | None, str | int]] = {
+    "name": (None, ""),
+    "slot": ("i", -1),
+    "card": ("i", -1),
+    "port": ("i", -1),
+    "subinterface": ("i", -1),
+    "ipv4": ("I", 0),
+    "prefixlen": ("b", -1),
+    "vlan": ("h", -1),
+    "mtu": ("i", -1),
+    "shutdown": ("B", 0),
+}
+
+
+@logger.catch(reraise=True)
+def new_interface_columns(columns: Sequence[str] = tuple(INTERFACE_COLUMNS)) -> dict[str, array | list[str]]:
+    """
+    :return: A dict of empty columns, keyed by column name; each column is an ``array.array`` of the ``INTERFACE_COLUMNS`` typecode, or a list for ``name``.
+    :rtype: Dict[str,Union[array.array,List[str]]]
+    """
+    retval = {}
+    for column in columns:
+        if column not in INTERFACE_COLUMNS:
+            error = f"`{column}` is not an interface column; choose from {list(INTERFACE_COLUMNS)}"
+            logger.error(error)
+            raise ValueError(error)
+        typecode = INTERFACE_COLUMNS[column][0]
+        retval[column] = [] if typecode is None else array(typecode)
+    return retval
+
+
+@logger.catch(reraise=True)
+def concat_interface_columns(tables: Sequence[dict[str, array | list[str]]]) -> dict[str, array | list[str]]:
+    """
+    Concatenate ``CiscoConfParse().interface_columns()`` results, such as the interfaces of many configurations; each column is copied with one ``extend()`` per table, without building any rows.
+
+    Examples
+    --------
+
+    >>> from ciscoconfparse2 import CiscoConfParse
+    >>> from ciscoconfparse2.ccp_util import concat_interface_columns
+    >>> tables = [CiscoConfParse(['interface Vlan10', ' mtu 9000'], factory=True).interface_columns(columns=['vlan', 'mtu']) for _ in range(2)]
+    >>> concat_interface_columns(tables)
+    {'vlan': array('h', [-1, -1]), 'mtu': array('i', [9000, 9000])}
+    """
+    if len(tables) == 0:
+        return {}
+    retval = new_interface_columns(list(tables[0]))
+    for table in tables:
+        if table.keys() != retval.keys():
+            error = f"All tables must have the same columns, but found {list(table)} and {list(retval)}"
+            logger.error(error)
+            raise ValueError(error)
+        for column, values in table.items():
+            retval[column].extend(values)
+    return retval
+
+
 @attrs.define(repr=False, slots=False)
 class MACObj(EUI48):
     """
@@ -2611,6 +3034,105 @@ def dns_query(input_str="", query_type="A", server="8.8.8.8", timeout=2.0):
     return retval
 
 
+# The maximum number of names in each parse_single_interface() cache; a
+#     full cache is cleared
+INTERFACE_NAME_CACHE_SIZE = 8192
+# CiscoIOSInterface().parse_single_interface() and
+#     CiscoIOSXRInterface().parse_single_interface() results, keyed by the
+#     stripped interface name
+IOS_INTERFACE_NAME_CACHE: dict[str, dict[str, Any]] = {}
+IOSXR_INTERFACE_NAME_CACHE: dict[str, dict[str, Any]] = {}
+
+# Interface name prefixes, and the abbreviations which IOS / NXOS print
+#     for them (i.e. in 'show interface status' and 'show cdp neighbors')
+CISCO_INTERFACE_PREFIXES: dict[str, tuple[str, ...]] = {
+    "AppGigabitEthernet": ("Ap",),
+    "Async": ("As",),
+    "ATM": ("AT",),
+    "BDI": ("BD",),
+    "Bundle-Ether": ("BE",),
+    "BVI": ("BV",),
+    "Dialer": ("Di",),
+    "Ethernet": ("Et", "Eth"),
+    "FastEthernet": ("Fa",),
+    "FiveGigabitEthernet": ("Fi",),
+    "FortyGigabitEthernet": ("Fo",),
+    "FourHundredGigE": ("FH",),
+    "GigabitEthernet": ("Gi", "Gig"),
+    "HundredGigE": ("Hu",),
+    "Loopback": ("Lo",),
+    "mgmt": (),
+    "MgmtEth": (),
+    "Multilink": ("Mu",),
+    "Null": ("Nu",),
+    "nve": (),
+    "Port-channel": ("Po",),
+    "Serial": ("Se",),
+    "TenGigabitEthernet": ("Te", "Ten"),
+    "Tunnel": ("Tu",),
+    "TwentyFiveGigE": ("Twe",),
+    "TwoGigabitEthernet": ("Tw",),
+    "Virtual-Template": ("Vt",),
+    "Vlan": ("Vl",),
+}
+
+
+def _build_interface_abbreviations() -> dict[str, str]:
+    """
+    :return: A dict of interface name prefixes, keyed by every lowercase abbreviation of the prefix; an abbreviation of more than one prefix is only kept if it is listed in ``CISCO_INTERFACE_PREFIXES``.
+    :rtype: Dict[str,str]
+    """
+    retval = {}
+    ambiguous = set()
+    for prefix in CISCO_INTERFACE_PREFIXES:
+        for length in range(2, len(prefix) + 1):
+            abbreviation = prefix[:length].lower()
+            if retval.get(abbreviation, prefix) != prefix:
+                ambiguous.add(abbreviation)
+            retval[abbreviation] = prefix
+    for abbreviation in ambiguous:
+        del retval[abbreviation]
+    for prefix, abbreviations in CISCO_INTERFACE_PREFIXES.items():
+        retval[prefix.lower()] = prefix
+        for abbreviation in abbreviations:
+            retval[abbreviation.lower()] = prefix
+    return retval
+
+
+# Interface name prefixes, keyed by their lowercase abbreviations, such as
+#     'gi' -> 'GigabitEthernet'
+CISCO_INTERFACE_ABBREVIATIONS = _build_interface_abbreviations()
+_RE_INTERFACE_PREFIX = re.compile(r"^\s*([A-Za-z][A-Za-z\-]*?)\s*(\d\S*(?:\s+\S+)?)\s*$")
+
+
+@functools.lru_cache(maxsize=INTERFACE_NAME_CACHE_SIZE)
+def canonical_interface_name(interface_name: str) -> str:
+    """
+    Expand the abbreviated prefix of ``interface_name`` with ``CISCO_INTERFACE_ABBREVIATIONS``; the results are cached, so names from descriptions, ACL bindings or CDP output can be matched against interface names with dict lookups.
+
+    :return: The interface name with its full prefix; ``interface_name`` is returned (stripped) if its prefix is not a known abbreviation.
+    :rtype: str
+
+    Examples
+    --------
+
+    >>> from ciscoconfparse2.ccp_util import canonical_interface_name
+    >>> canonical_interface_name('Gi1/0/1')
+    'GigabitEthernet1/0/1'
+    >>> canonical_interface_name('po 10')
+    'Port-channel10'
+    >>> canonical_interface_name('Foo1/1')
+    'Foo1/1'
+    """
+    mm = _RE_INTERFACE_PREFIX.search(interface_name)
+    if mm is None:
+        return interface_name.strip()
+    prefix = CISCO_INTERFACE_ABBREVIATIONS.get(mm.group(1).lower(), None)
+    if prefix is None:
+        return interface_name.strip()
+    return prefix + mm.group(2)
+
+
 @attrs.define(repr=False, slots=False)
 class CiscoIOSInterface:
     interface_name: str | None = None
@@ -2866,6 +3388,16 @@ class CiscoIOSInterface:
             logger.critical(error)
             raise InvalidCiscoInterface(error)
 
+        # Reuse the components of a name which was already parsed
+        cache_key = interface_name.strip()
+        # parse_intf_long() returns self._interface_class for a name without
+        #     an interface class, so that result depends on this instance
+        use_cache = debug is False and self._interface_class is None
+        if use_cache is True:
+            cached = IOS_INTERFACE_NAME_CACHE.get(cache_key, None)
+            if cached is not None:
+                return dict(cached)
+
         re_intf_short = re.search(
             r"^(?P<prefix>[a-zA-Z\-\s]*)(?P<port_subinterface_channel>[\d\:\.^\-^a-z^A-Z^\s]+)(?P<interface_class>\s+[a-zA-Z\-]+){0,1}$",
             interface_name.strip(),
@@ -2935,6 +3467,10 @@ class CiscoIOSInterface:
 
         if debug is True:
             logger.success(f"CiscoRange().parse_single_interface() returned {retval}")
+        if use_cache is True:
+            if len(IOS_INTERFACE_NAME_CACHE) >= INTERFACE_NAME_CACHE_SIZE:
+                IOS_INTERFACE_NAME_CACHE.clear()
+            IOS_INTERFACE_NAME_CACHE[cache_key] = dict(retval)
         return retval
 
     # This method is on CiscoIOSInterface()
@@ -3784,6 +4320,16 @@ class CiscoIOSXRInterface:
             logger.critical(error)
             raise InvalidCiscoInterface(error)
 
+        # Reuse the components of a name which was already parsed
+        cache_key = interface_name.strip()
+        # parse_intf_long() returns self._interface_class for a name without
+        #     an interface class, so that result depends on this instance
+        use_cache = debug is False and self._interface_class is None
+        if use_cache is True:
+            cached = IOSXR_INTERFACE_NAME_CACHE.get(cache_key, None)
+            if cached is not None:
+                return dict(cached)
+
         re_intf_short = re.search(
             r"^(?P<prefix>[a-zA-Z\-\s]*)(?P<port_subinterface_channel>[\d\:\.^\-^a-z^A-Z^\s]+)(?P<interface_class>\s+[a-zA-Z\-]+){0,1}$",
             interface_name.strip(),
@@ -3857,6 +4403,10 @@ class CiscoIOSXRInterface:
 
         if debug is True:
             logger.success(f"CiscoRange().parse_single_interface() returned {retval}")
+        if use_cache is True:
+            if len(IOSXR_INTERFACE_NAME_CACHE) >= INTERFACE_NAME_CACHE_SIZE:
+                IOSXR_INTERFACE_NAME_CACHE.clear()
+            IOSXR_INTERFACE_NAME_CACHE[cache_key] = dict(retval)
         return retval
 
     # This method is on CiscoIOSXRInterface()
@@ -4901,6 +5451,10 @@ class CiscoRange(UserList):
     def __eq__(self, other: object):
         if isinstance(other, CiscoRange):
             return self.data == other.data
+        if isinstance(other, CiscoVlanSet):
+            # CiscoVlanSet().__eq__() returns NotImplemented unless this
+            #     CiscoRange() holds vlan numbers
+            return other.__eq__(self) is True
         return False
 
     # This method is on CiscoRange()
@@ -4990,6 +5544,8 @@ class CiscoRange(UserList):
         return self.data[key]
 
     def __add__(self, other):
+        if isinstance(other, CiscoVlanSet):
+            other = other.as_cisco_range()
         if isinstance(other, CiscoRange):
             self.data.extend(other.data)
             self.data = sorted(set(self.data))
@@ -4999,13 +5555,13 @@ class CiscoRange(UserList):
         raise InvalidCiscoRange(error)
 
     def __sub__(self, other):
+        if isinstance(other, CiscoVlanSet):
+            other = other.as_cisco_range()
         if isinstance(other, CiscoRange):
-            for ii in other.data:
-                try:
-                    self.data.remove(ii)
-                except ValueError:
-                    # Skip the item if it does not exist...
-                    pass
+            # Build a set of members to remove once, instead of calling
+            #     list.remove() for each member of other...
+            remove_members = set(other.data)
+            self.data = [ii for ii in self.data if ii not in remove_members]
             return self
         error = f"`{other}` must be a CiscoRange() instance; the received argument was {type(other)} instead of a CiscoRange()"
         logger.error(error)
@@ -5295,7 +5851,9 @@ class CiscoRange(UserList):
             # Build a list of the relevant string iteration pieces...
             input_str = []
             for _, component in enumerate(self.as_list()):
-                input_str.append(getattr(CiscoIOSInterface(component), self.iterate_attribute))
+                if not isinstance(component, CiscoIOSInterface):
+                    component = CiscoIOSInterface(component)
+                input_str.append(getattr(component, self.iterate_attribute))
 
         elif self.member_type is CiscoIOSXRInterface:
 
@@ -5326,7 +5884,9 @@ class CiscoRange(UserList):
             # Build a list of the relevant string iteration pieces...
             input_str = []
             for _, component in enumerate(self.as_list()):
-                input_str.append(getattr(CiscoIOSXRInterface(component), self.iterate_attribute))
+                if not isinstance(component, CiscoIOSXRInterface):
+                    component = CiscoIOSXRInterface(component)
+                input_str.append(getattr(component, self.iterate_attribute))
 
         # Handle str() instances...
         elif self.member_type is str:
@@ -5382,6 +5942,300 @@ class CiscoRange(UserList):
         return retval
 
 
+class CiscoVlanSet:
+    """An integer-bitset of vlan numbers, with O(1) add / discard / membership
+    and set operations that run on whole 4096-bit integers instead of lists.
+
+    ``CiscoVlanSet()`` accepts the same text as ``CiscoRange(text, result_type=int)``;
+    use ``as_cisco_range()`` when a real ``CiscoRange()`` is required.
+
+    Examples
+    --------
+
+    >>> from ciscoconfparse2.ccp_util import CiscoVlanSet
+    >>> vlans = CiscoVlanSet('1-4094') - CiscoVlanSet('2-3000')
+    >>> vlans.as_compressed_str()
+    '1,3001-4094'
+    >>> 3001 in vlans
+    True
+    >>> len(vlans)
+    1095
+    """
+
+    __slots__ = ("bits",)
+
+    # This method is on CiscoVlanSet()
+    @logger.catch(reraise=True)
+    def __init__(self, text: str | Sequence[int] | CiscoRange | CiscoVlanSet | None = ""):
+        self.bits = 0
+        if isinstance(text, CiscoVlanSet):
+            self.bits = text.bits
+        elif isinstance(text, str):
+            if text.strip() != "":
+                self.bits = self.parse_integers(text)
+        elif text is not None:
+            for vlan in text:
+                self.add(vlan)
+
+    # This method is on CiscoVlanSet()
+    @classmethod
+    def from_bits(cls, bits: int) -> CiscoVlanSet:
+        """Return a new CiscoVlanSet() built from an integer bitmask"""
+        retval = cls()
+        retval.bits = bits & VLAN_BITMASK
+        return retval
+
+    # This method is on CiscoVlanSet()
+    @staticmethod
+    def parse_integers(text: str) -> int:
+        """Parse text such as '1-5,7' into an integer bitmask; the text rules match ``CiscoRange(text, result_type=int)``"""
+        bits = 0
+        for csv_part in text.split(","):
+            if "-" in csv_part:
+                range_parts = csv_part.split("-")
+                if len(range_parts) != 2:
+                    error = f"Could not divide {csv_part} into integer components"
+                    logger.error(error)
+                    raise InvalidCiscoRange(error)
+                begin = int(range_parts[0].strip())
+                end = int("".join(filter(str.isdigit, range_parts[1].strip())))
+            else:
+                begin = end = int(csv_part)
+
+            if begin < 0 or end > MAX_VLAN_BIT:
+                error = f"{csv_part} is outside the valid vlan range of 0-{MAX_VLAN_BIT}"
+                logger.error(error)
+                raise InvalidCiscoEthernetVlan(error)
+            if end >= begin:
+                bits |= ((1 << (end - begin + 1)) - 1) << begin
+        return bits
+
+    # This method is on CiscoVlanSet()
+    @logger.catch(reraise=True)
+    def add(self, vlan: int) -> None:
+        """Add ``vlan`` to this CiscoVlanSet()"""
+        vlan = int(vlan)
+        if not 0 <= vlan <= MAX_VLAN_BIT:
+            error = f"{vlan} is outside the valid vlan range of 0-{MAX_VLAN_BIT}"
+            logger.error(error)
+            raise InvalidCiscoEthernetVlan(error)
+        self.bits |= 1 << vlan
+
+    # This method is on CiscoVlanSet()
+    def discard(self, vlan: int) -> None:
+        """Remove ``vlan`` from this CiscoVlanSet() if it is present"""
+        vlan = int(vlan)
+        if 0 <= vlan <= MAX_VLAN_BIT:
+            self.bits &= ~(1 << vlan)
+
+    # This method is on CiscoVlanSet()
+    @logger.catch(reraise=True)
+    def remove(self, vlan: int) -> None:
+        """Remove ``vlan`` from this CiscoVlanSet(); raise InvalidMember if it is absent"""
+        if vlan not in self:
+            error = f"CiscoVlanSet().remove() could not find {vlan} in this CiscoVlanSet()"
+            logger.error(error)
+            raise InvalidMember(error)
+        self.discard(vlan)
+
+    # This method is on CiscoVlanSet()
+    def __contains__(self, vlan: Any) -> bool:
+        try:
+            vlan = int(vlan)
+        except (TypeError, ValueError):
+            return False
+        return 0 <= vlan <= MAX_VLAN_BIT and bool(self.bits >> vlan & 1)
+
+    # This method is on CiscoVlanSet()
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    # This method is on CiscoVlanSet()
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    # This method is on CiscoVlanSet()
+    def __iter__(self):
+        """Iterate over the vlans in ascending order"""
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    # This method is on CiscoVlanSet()
+    @staticmethod
+    def _other_bits(other: Any) -> int | None:
+        """Return the bitmask of ``other``, or None if ``other`` is not a vlan collection"""
+        if isinstance(other, CiscoVlanSet):
+            return other.bits
+        if isinstance(other, CiscoRange):
+            # A CiscoRange() of interfaces (or strings) is not a vlan collection
+            if other.member_type not in (int, None):
+                return None
+            return CiscoVlanSet(other.data).bits
+        if isinstance(other, (set, frozenset)):
+            return CiscoVlanSet(other).bits
+        return None
+
+    # This method is on CiscoVlanSet()
+    def __or__(self, other: Any) -> CiscoVlanSet:
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return CiscoVlanSet.from_bits(self.bits | bits)
+
+    __add__ = __or__
+    __ror__ = __or__
+
+    # This method is on CiscoVlanSet()
+    def __and__(self, other: Any) -> CiscoVlanSet:
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return CiscoVlanSet.from_bits(self.bits & bits)
+
+    __rand__ = __and__
+
+    # This method is on CiscoVlanSet()
+    def __xor__(self, other: Any) -> CiscoVlanSet:
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return CiscoVlanSet.from_bits(self.bits ^ bits)
+
+    __rxor__ = __xor__
+
+    # This method is on CiscoVlanSet()
+    def __sub__(self, other: Any) -> CiscoVlanSet:
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return CiscoVlanSet.from_bits(self.bits & ~bits)
+
+    # This method is on CiscoVlanSet()
+    def __eq__(self, other: object) -> bool:
+        bits = self._other_bits(other)
+        if bits is None:
+            return NotImplemented
+        return self.bits == bits
+
+    # CiscoVlanSet() is mutable, so it is not hashable
+    __hash__ = None
+
+    # This method is on CiscoVlanSet()
+    def __str__(self) -> str:
+        return "[" + ", ".join(str(ii) for ii in self) + "]"
+
+    # This method is on CiscoVlanSet()
+    def __repr__(self) -> str:
+        return f"<CiscoVlanSet {self.as_compressed_str()}>"
+
+    # This method is on CiscoVlanSet()
+    @property
+    def result_type(self) -> type:
+        """CiscoVlanSet() members are always int, like ``CiscoRange(result_type=int)``"""
+        return int
+
+    # This method is on CiscoVlanSet()
+    @property
+    def member_type(self) -> type | None:
+        """Return int, or None if this CiscoVlanSet() is empty; this matches ``CiscoRange().member_type``"""
+        if self.bits:
+            return int
+        return None
+
+    # This method is on CiscoVlanSet()
+    @property
+    def data(self) -> list[int]:
+        """Return a sorted list of vlans, like ``CiscoRange().data``"""
+        return list(self)
+
+    # This method is on CiscoVlanSet()
+    @property
+    def text(self) -> str:
+        return self.as_compressed_str()
+
+    # This method is on CiscoVlanSet()
+    def copy(self) -> CiscoVlanSet:
+        """Return a copy of this CiscoVlanSet()"""
+        return CiscoVlanSet.from_bits(self.bits)
+
+    # This method is on CiscoVlanSet()
+    def union(self, other: Any) -> CiscoVlanSet:
+        return self | CiscoVlanSet(other)
+
+    # This method is on CiscoVlanSet()
+    def intersection(self, other: Any) -> CiscoVlanSet:
+        return self & CiscoVlanSet(other)
+
+    # This method is on CiscoVlanSet()
+    def difference(self, other: Any) -> CiscoVlanSet:
+        return self - CiscoVlanSet(other)
+
+    # This method is on CiscoVlanSet()
+    def issubset(self, other: Any) -> bool:
+        return self.bits & ~CiscoVlanSet(other).bits == 0
+
+    # This method is on CiscoVlanSet()
+    def issuperset(self, other: Any) -> bool:
+        return CiscoVlanSet(other).bits & ~self.bits == 0
+
+    # This method is on CiscoVlanSet()
+    @logger.catch(reraise=True)
+    def as_list(self, result_type: Any = "auto") -> list:
+        """Return a sorted list of vlans as ``result_type`` (int by default)"""
+        if result_type in ("auto", int):
+            return list(self)
+        if result_type in (str, float):
+            return [result_type(ii) for ii in self]
+        error = f"CiscoVlanSet().as_list(result_type={result_type}) is not valid.  Choose from {['auto', int, str, float]}."
+        logger.error(error)
+        raise ValueError(error)
+
+    # This method is on CiscoVlanSet()
+    @logger.catch(reraise=True)
+    def as_set(self, result_type: Any = "auto") -> set:
+        """Return a set of vlans as ``result_type`` (int by default)"""
+        return set(self.as_list(result_type=result_type))
+
+    # This method is on CiscoVlanSet()
+    def as_cisco_range(self) -> CiscoRange:
+        """Return a ``CiscoRange(result_type=int)`` view of this CiscoVlanSet()"""
+        retval = CiscoRange(result_type=int)
+        retval.data = list(self)
+        return retval
+
+    # This method is on CiscoVlanSet()
+    def as_compressed_str(self) -> str:
+        """
+        Return a text string with a compressed csv of vlans; the string is built
+        from runs of set bits, so it never expands the vlans into a list.
+
+        >>> from ciscoconfparse2.ccp_util import CiscoVlanSet
+        >>> CiscoVlanSet('1,3,5,6,7').as_compressed_str()
+        '1,3,5-7'
+        >>>
+        """
+        retval = []
+        bits = self.bits
+        offset = 0
+        while bits:
+            # Skip to the beginning of the next run of set bits...
+            skip = (bits & -bits).bit_length() - 1
+            bits >>= skip
+            offset += skip
+            # Measure the run of set bits...
+            run = (~bits & (bits + 1)).bit_length() - 1
+            if run == 1:
+                retval.append(str(offset))
+            else:
+                retval.append(f"{offset}-{offset + run - 1}")
+            bits >>= run
+            offset += run
+        return ",".join(retval)
+
+
 ##############################################################################
 # Restore SonarCloud warnings in this file
 ##############################################################################
@@ -25,15 +25,21 @@ from __future__ import annotations
 
 import base64
 import copy
+import gzip
 import hashlib
 import inspect
+import io
 import locale
 import os
 import random
 import re
+import shutil
 import time
+import weakref
+from bisect import bisect_left, bisect_right
 from collections import UserList
 from collections.abc import Callable, Iterator, Sequence
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from warnings import warn
@@ -62,12 +68,20 @@ from typeguard import typechecked
 from typing_extensions import Self
 
 from ciscoconfparse2.__about__ import __version__
-from ciscoconfparse2.ccp_abc import BaseCfgLine
-from ciscoconfparse2.ccp_util import configure_loguru, enforce_valid_types
+from ciscoconfparse2.ccp_abc import BaseCfgLine, ConfigLinesView
+from ciscoconfparse2.ccp_util import (
+    INTERFACE_COLUMNS,
+    RouteTable,
+    StaticRoute,
+    configure_loguru,
+    enforce_valid_types,
+    new_interface_columns,
+)
 from ciscoconfparse2.errors import (
     ConfigListItemDoesNotExist,
     InvalidParameters,
     InvalidPassword,
+    ReadOnlyConfiguration,
     RequirementFailure,
 )
 from ciscoconfparse2.models_asa import (
@@ -82,7 +96,9 @@ from ciscoconfparse2.models_asa import (
     ASAObjNetwork,
     ASAObjService,
 )
+from ciscoconfparse2.models_base import BaseFactoryInterfaceLine
 from ciscoconfparse2.models_cisco import (
+    FHRPGroup,
     IOSAccessLine,
     IOSCfgLine,
     IOSIntfGlobal,
@@ -142,6 +158,53 @@ ALL_JUNOS_FACTORY_CLASSES = [
     JunosCfgLine,  # JunosCfgLine MUST be last
 ]
 
+# config_line_factory() only calls is_object_for() on a factory class when
+#     the (lowercased) first word of the line starts with one of these
+#     keywords.  For every other line, a class which is last in its factory
+#     list matches, and all other classes do not match.  Classes which are
+#     missing from this dict are checked for every line.
+FACTORY_CLASS_KEYWORDS = {
+    IOSIntfLine: ("interface",),
+    IOSRouteLine: ("ip",),
+    IOSAccessLine: ("line",),
+    IOSCfgLine: ("hostname", "interface", "aaa", "ip"),
+    NXOSIntfLine: ("interface",),
+    NXOSvPCLine: ("vpc",),
+    NXOSAccessLine: ("line",),
+    NXOSCfgLine: ("hostname", "interface", "aaa", "ip"),
+    IOSXRIntfLine: ("interface",),
+    IOSXRCfgLine: ("hostname", "interface", "aaa", "ip"),
+    ASAIntfLine: ("interface",),
+    ASAName: ("name",),
+    ASAObjNetwork: ("object",),
+    ASAObjService: ("object",),
+    ASAObjGroupNetwork: ("object-group",),
+    ASAObjGroupService: ("object-group",),
+    ASAIntfGlobal: ("mtu",),
+    ASAHostnameLine: ("hostname",),
+    ASAAclLine: ("access-list",),
+    ASACfgLine: (),
+    JunosCfgLine: (),
+}
+
+
+@logger.catch(reraise=True)
+def _build_factory_dispatch(factory_classes: list[type[BaseCfgLine]]) -> tuple[dict[str, tuple[type[BaseCfgLine], ...]], tuple[int, ...], tuple[type[BaseCfgLine], ...]]:
+    """Return a dispatch map of keyword to the factory classes which must be checked for it, the keyword lengths, and the classes which are checked for every line"""
+    always_check = tuple(cls for cls in factory_classes if cls not in FACTORY_CLASS_KEYWORDS)
+    keywords = {kw for cls in factory_classes for kw in FACTORY_CLASS_KEYWORDS.get(cls, ())}
+    dispatch = {kw: tuple(cls for cls in factory_classes if cls in always_check or kw in FACTORY_CLASS_KEYWORDS[cls]) for kw in keywords}
+    return dispatch, tuple(sorted({len(kw) for kw in keywords})), always_check
+
+
+FACTORY_DISPATCH = {
+    "ios": _build_factory_dispatch(ALL_IOS_FACTORY_CLASSES),
+    "nxos": _build_factory_dispatch(ALL_NXOS_FACTORY_CLASSES),
+    "iosxr": _build_factory_dispatch(ALL_IOSXR_FACTORY_CLASSES),
+    "asa": _build_factory_dispatch(ALL_ASA_FACTORY_CLASSES),
+    "junos": _build_factory_dispatch(ALL_JUNOS_FACTORY_CLASSES),
+}
+
 # Indexing into CFGLINE is normally faster than serial if-statements...
 CFGLINE = {
     "ios": IOSCfgLine,
@@ -163,6 +226,25 @@ ALL_BRACE_SYNTAX = {
     "junos",
 }
 
+# ConfigList() order labels are spaced ORDER_LABEL_GAP apart after a
+#     bootstrap(); inserts relabel the smallest enclosing label range with
+#     a density below ORDER_LABEL_DENSITY ** -level
+ORDER_LABEL_GAP = 2**16
+ORDER_LABEL_DENSITY = 1.5
+
+# IOS (and at this point, NXOS) banner parent lines; see ConfigList().bootstrap()
+BANNER_RE = re.compile(
+    "|".join(
+        [
+            *(rf"^(set\s+)*banner\s+{ii}" for ii in ("login", "motd", "incoming", "exec", "telnet", "lcd")),
+            # original ciscoconfparse Github issue #76
+            "aaa authentication fail-message",
+        ],
+    ),
+)
+# The banner type and delimiting banner character of a banner parent line
+BANNER_DELIMITER_RE = re.compile(r"^(?:(?P<btype>(?:set\s+)*banner\s\w+\s+)(?P<bchar>\S))")
+
 
 ENCODING = locale.getpreferredencoding()
 ACTIVE_LOGURU_HANDLERS = None
@@ -630,6 +712,18 @@ class ConfigList(UserList):
     dna: str = "ConfigList"
     current_checkpoint: int = 0
     commit_checkpoint: int = 0
+    mutation_counter: int = 0
+    text_mutation_counter: int = 0
+    linenum_counter: int = 0
+    cow_epoch: int = 0
+    cow_shared: bool = False
+    snapshots: list | None = None
+    journal: list | None = None
+    redo_journal: list | None = None
+    journal_replay: bool = False
+    intern_table: dict[str, str] | None = None
+    read_only: bool = False
+    family_index: tuple | None = None
 
     @logger.catch(reraise=True)
     @typechecked
@@ -645,6 +739,8 @@ class ConfigList(UserList):
         # ccp_ref should be an instance of CiscoConfParse
         ccp_ref: Any = None,
         debug: int = 0,
+        intern_table: dict[str, str] | None = None,
+        read_only: bool = False,
     ):
         """Initialize the class.
 
@@ -668,6 +764,10 @@ class ConfigList(UserList):
         :type auto_commit: bool
         :param debug: Debug level of this object.
         :type debug: int
+        :param intern_table: A dict which maps configuration text to a shared copy of the same text; identical lines in every ConfigList() which uses the same dict share one string.  Default to None (no interning).
+        :type intern_table: dict
+        :param read_only: Build an immutable ConfigList(); children are tuples, no commit checkpoint is computed and any modification raises :py:class:`~ciscoconfparse2.errors.ReadOnlyConfiguration`.  Default to False.
+        :type read_only: bool
 
         :return: A :py:class:`ConfigList` instance.
         :rtype: :py:class:`ConfigList`
@@ -698,6 +798,30 @@ class ConfigList(UserList):
                 The value of the current checkpoint; this will be updated with each ConfigList change
             commit_checkpoint : int
                 The value of the saved checkpoint; this will only be updated when a commit() is called
+            mutation_counter : int
+                A counter which is incremented each time objects are added to (or removed from) the ConfigList
+            text_mutation_counter : int
+                A counter which is incremented each time the text of an object in the ConfigList changes
+            linenum_counter : int
+                The value of mutation_counter when line numbers were last assigned
+            cow_epoch : int
+                The copy-on-write epoch; objects owned by this ConfigList() with an older epoch are shared with a snapshot
+            cow_shared : bool
+                Whether this ConfigList() shares objects with a snapshot (or is a snapshot)
+            snapshots : list
+                Weak references to the ConfigList() instances of snapshots taken from this ConfigList()
+            journal : list
+                The edits which :py:meth:`ConfigList.undo` can undo; each edit is a list of ``(operation, index, ...)`` tuples
+            redo_journal : list
+                The edits which :py:meth:`ConfigList.redo` can redo
+            journal_replay : bool
+                True while :py:meth:`ConfigList.undo` or :py:meth:`ConfigList.redo` are replaying edits
+            intern_table : dict
+                Maps configuration text to the shared string which configuration objects store, or None
+            read_only : bool
+                Whether this ConfigList() is immutable
+            family_index : tuple
+                ``(mutation_counter, family_ends, last_at_indent)``; see :py:meth:`ConfigList.family_end`
             data : BaseCfgLine
                 An internal sequence of BaseCfgLine instances used to maintain the contents of this python UserList subclass
         """
@@ -726,14 +850,20 @@ class ConfigList(UserList):
             logger.error(error)
             raise ValueError(error)
 
+        if intern_table is not None:
+            # Keep the interned strings instead of the caller's copies
+            initlist = [intern_table.setdefault(txt, txt) if isinstance(txt, str) else txt for txt in initlist]
+
         self.initlist = initlist
         self.comment_delimiters = comment_delimiters
         self.factory = factory
         self.ignore_blank_lines = ignore_blank_lines
         self.indent_width = indent_width
         self.syntax = syntax
-        self.auto_commit = auto_commit
+        # There is nothing to commit in a read-only ConfigList()
+        self.auto_commit = auto_commit and not read_only
         self.debug = debug
+        self.read_only = read_only
 
         self.ccp_ref = ccp_ref
         self.dna = "ConfigList"
@@ -745,6 +875,17 @@ class ConfigList(UserList):
         # commit checkpoint value and copy them when a commit
         # operation happens
         self.commit_checkpoint = 0
+        self.mutation_counter = 0
+        self.text_mutation_counter = 0
+        self.linenum_counter = 0
+        self.cow_epoch = 0
+        self.cow_shared = False
+        self.snapshots = []
+        self.journal = []
+        self.redo_journal = []
+        self.journal_replay = False
+        self.intern_table = intern_table
+        self.family_index = None
         self.data: list[BaseCfgLine] = []
 
         ####################################################################
@@ -753,6 +894,9 @@ class ConfigList(UserList):
         if len(initlist) > 0 and getattr(initlist, "__iter__", False):
             self.data = self.bootstrap(text_list=initlist, debug=debug)
 
+        if read_only is True:
+            self._freeze()
+
         if self.debug > 0:
             message = f"Created ConfigList() with {len(self.data)} elements"
             logger.info(message)
@@ -777,6 +921,7 @@ class ConfigList(UserList):
         """
         Rebuild the configuration, and renumber lines.  Return a list of string config lines.
         """
+        self._require_writable()
 
         # Rebuild the modified configuration...
         if len(self.data) == 0:
@@ -798,7 +943,9 @@ class ConfigList(UserList):
     # This method is on ConfigList()
     @logger.catch(reraise=True)
     def __iter__(self):
-        return iter(self.data)
+        if self.cow_shared is False:
+            return iter(self.data)
+        return self._iter_owned()
 
     # This method is on ConfigList()
     @logger.catch(reraise=True)
@@ -840,25 +987,46 @@ class ConfigList(UserList):
     def __getitem__(self, key: int | slice):
         if isinstance(key, slice):
             return self.__class__(self.data[key])
+        if self.cow_shared is True:
+            return self._own([self.data[key]])[0]
         return self.data[key]
 
     # This method is on ConfigList()
     @logger.catch(reraise=True)
     def __setitem__(self, key: int, value: Any) -> None:
+        self._require_writable()
         self.data[key] = value
+        self._reset_journal()
 
         # Rebuild / renumber items on the modified ConfigList()...
         self.rebuild_after_modification(commit=self.auto_commit)
 
     # This method is on ConfigList()
     @logger.catch(reraise=True)
-    def __delitem__(self, key: int) -> None:
+    def __delitem__(self, key: int | slice) -> None:
+        self._require_writable()
 
-        # Delete the requested line...
-        del self.data[key]
+        if isinstance(key, slice):
+            # Delete the requested lines from the bottom up, so the indices
+            #     of the remaining lines do not move; record them as one edit
+            edits = []
+            self.journal_replay = True
+            try:
+                for idx in sorted(range(*key.indices(len(self.data))), reverse=True):
+                    edits.append(("delete", idx, self._delete_object(idx)))
+            finally:
+                self.journal_replay = False
+            if len(edits) > 0:
+                self._record_edit(edits)
 
-        # Rebuild / renumber items on the modified ConfigList()...
-        self.rebuild_after_modification(commit=self.auto_commit)
+        else:
+            # Delete the requested line...
+            if key < 0:
+                key += len(self.data)
+            self._delete_object(key)
+
+        if bool(self.auto_commit):
+            self.ccp_ref.commit()
 
     # This method is on ConfigList()
     @logger.catch(reraise=True)
@@ -881,12 +1049,14 @@ class ConfigList(UserList):
     # This method is on ConfigList()
     @logger.catch(reraise=True)
     def __iadd__(self, other) -> Self:
+        self._require_writable()
         if isinstance(other, ConfigList):
             self.data += other.data
         elif isinstance(other, type(self.data)):
             self.data += other
         else:
             self.data += list(other)
+        self._reset_journal()
 
         # Rebuild / renumber items on the modified ConfigList()...
         self.rebuild_after_modification(commit=self.auto_commit)
@@ -921,7 +1091,9 @@ class ConfigList(UserList):
         self.data[0].confobj.ccp_ref.commit()
 
     # This method is on ConfigList()
-    @logger.catch(reraise=True)
+    # Every attribute read goes through __getattribute__(), including the
+    #     counter checks in BaseCfgLine().get_unique_identifier(); do not
+    #     wrap it in logger.catch()
     def __getattribute__(self, arg) -> Any:
         """Call arg on ConfigList() object, and if that fails, call arg from the ccp_ref attribute"""
         # Try a method call on ASAConfigList()
@@ -956,6 +1128,924 @@ class ConfigList(UserList):
                 raise NotImplementedError(error)
         return total
 
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _freeze(self) -> None:
+        """
+        Make a read-only ConfigList() immutable; store children as tuples and assign final line numbers, so the objects can be shared across threads.
+
+        :rtype: None
+        """
+        if self.linenum_counter != self.mutation_counter:
+            self.renumber()
+        for obj in self.data:
+            obj._children = tuple(obj._children)
+
+    # This method is on ConfigList()
+    def _require_writable(self) -> None:
+        """
+        Raise :py:class:`~ciscoconfparse2.errors.ReadOnlyConfiguration` if this ConfigList() is read-only.
+
+        :rtype: None
+        """
+        if self.read_only is True:
+            error = "This configuration was parsed with read_only=True; it cannot be modified"
+            logger.error(error)
+            raise ReadOnlyConfiguration(error)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def renumber(self) -> None:
+        """
+        Assign dense line numbers (zero through ``len(self) - 1``) to all objects in the ConfigList().
+
+        Inserts and deletes only maintain gapped order labels; :py:attr:`~ciscoconfparse2.ccp_abc.BaseCfgLine.linenum` calls this method the first time a line number is read after the ConfigList() changes.
+
+        :rtype: None
+        """
+        if self.cow_shared is True:
+            # Objects shared with another ConfigList() keep the line numbers
+            #     of the ConfigList() which owns them
+            for idx, obj in enumerate(self.data):
+                if obj.confobj is self and obj._linenum != idx:
+                    obj._linenum = idx
+                    obj._unique_id = None
+        else:
+            for idx, obj in enumerate(self.data):
+                if obj._linenum != idx:
+                    obj._linenum = idx
+                    obj._unique_id = None
+        self.linenum_counter = self.mutation_counter
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _object_index(self, obj: BaseCfgLine) -> int | None:
+        """
+        :param obj: The object to find in this ConfigList()
+        :type obj: BaseCfgLine
+        :return: The index of ``obj`` or None if it is not found.  Order labels are sorted, so this is a binary search; objects from before the last commit fall back to a linear search like :py:meth:`ConfigList.index`.
+        :rtype: Union[int,None]
+        """
+        idx = self._locate(obj)
+        if idx is not None:
+            return idx
+
+        unique_identifier = obj.get_unique_identifier()
+        for idx, each in enumerate(self.data):
+            if each.get_unique_identifier() == unique_identifier:
+                return idx
+        return None
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _family_index(self) -> tuple[dict[int, BaseCfgLine], dict[int, BaseCfgLine]]:
+        """
+        Build (once per change to the ConfigList()) the last descendant of every object, and the last object at every indent.
+
+        :return: A dict of the last descendant (or the object itself) keyed by ``id(obj)``, and a dict of the last object keyed by indent
+        :rtype: tuple[dict, dict]
+        """
+        family_index = self.family_index
+        if family_index is not None and family_index[0] == self.mutation_counter:
+            return family_index[1], family_index[2]
+
+        family_ends = {}
+        last_at_indent = {}
+        # Walk backwards; the first descendant seen is the last one
+        for obj in reversed(self.data):
+            last_at_indent.setdefault(obj.indent, obj)
+            if id(obj) in family_ends:
+                continue
+            family_ends[id(obj)] = obj
+            node = obj
+            while node.parent is not node:
+                node = node.parent
+                if id(node) in family_ends:
+                    break
+                family_ends[id(node)] = obj
+
+        self.family_index = (self.mutation_counter, family_ends, last_at_indent)
+        return family_ends, last_at_indent
+
+    # This method is on ConfigList()
+    def _take_family_index(self) -> tuple[dict[int, BaseCfgLine], dict[int, BaseCfgLine]] | None:
+        """
+        Detach the family index before an insert or delete; the edit updates it with :py:meth:`ConfigList._family_index_insert` or :py:meth:`ConfigList._family_index_delete`, which put it back.  An edit which rebuilds the ConfigList() leaves the index detached.
+
+        :return: The family index dicts, or None if the index is stale or a snapshot shares the objects
+        :rtype: Union[tuple[dict, dict],None]
+        """
+        family_index = self.family_index
+        self.family_index = None
+        if family_index is None or family_index[0] != self.mutation_counter or self.cow_shared is True:
+            return None
+        return family_index[1], family_index[2]
+
+    # This method is on ConfigList()
+    def _family_index_insert(self, family_index: tuple | None, obj: BaseCfgLine) -> None:
+        """
+        Add the new object ``obj``, which has no children, to ``family_index``; ``obj`` becomes the family end of each ancestor which ended before it.  This walks the ancestors of ``obj``, not the ConfigList().
+
+        :rtype: None
+        """
+        if family_index is None:
+            return
+        family_ends, last_at_indent = family_index
+        label = obj._order_label
+        family_ends[id(obj)] = obj
+        node = obj
+        while node.parent is not node:
+            node = node.parent
+            end = family_ends.get(id(node), None)
+            if end is None:
+                return
+            if end._order_label > label:
+                # The higher ancestors end after this one
+                break
+            family_ends[id(node)] = obj
+
+        last = last_at_indent.get(obj.indent, None)
+        if last is None or last._order_label < label:
+            last_at_indent[obj.indent] = obj
+        self.family_index = (self.mutation_counter, family_ends, last_at_indent)
+
+    # This method is on ConfigList()
+    def _family_index_delete(self, family_index: tuple | None, idx: int, obj: BaseCfgLine, ancestors: list[BaseCfgLine]) -> None:
+        """
+        Remove ``obj``, which had no children and was deleted from ``idx``, from ``family_index``; each of its ``ancestors`` (closest first) which ended with ``obj`` now ends with its last remaining child's family.
+
+        :rtype: None
+        """
+        if family_index is None:
+            return
+        family_ends, last_at_indent = family_index
+        family_ends.pop(id(obj), None)
+        for node in ancestors:
+            if family_ends.get(id(node), None) is not obj:
+                break
+            end = node
+            if len(node.children) > 0:
+                end = family_ends.get(id(node.children[-1]), None)
+                if end is None:
+                    return
+            family_ends[id(node)] = end
+
+        if last_at_indent.get(obj.indent, None) is obj:
+            del last_at_indent[obj.indent]
+            data = self.data
+            for prev_idx in range(idx - 1, -1, -1):
+                if data[prev_idx].indent == obj.indent:
+                    last_at_indent[obj.indent] = data[prev_idx]
+                    break
+        self.family_index = (self.mutation_counter, family_ends, last_at_indent)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def family_end(self, obj: BaseCfgLine) -> BaseCfgLine | None:
+        """
+        :return: The last descendant of ``obj`` (``obj`` itself if it has no children), or None if ``obj`` is not in this ConfigList().  Inserting or deleting a line without children updates the index along the ancestors of that line; other changes rebuild the index in O(n) on the next call.
+        :rtype: BaseCfgLine
+        """
+        family_ends, _ = self._family_index()
+        return family_ends.get(id(obj), None)
+
+    # This method is on ConfigList()
+    def _family_linenum(self, obj: BaseCfgLine) -> int:
+        """
+        :return: The line number of ``obj``; if the line numbers are stale, find ``obj`` by binary search on its order label instead of renumbering the whole ConfigList()
+        :rtype: int
+        """
+        if self.linenum_counter == self.mutation_counter or self.cow_shared is True:
+            return obj.linenum
+        idx = self._locate(obj)
+        if idx is None:
+            return obj.linenum
+        return idx
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def last_at_indent(self, indent: int) -> BaseCfgLine | None:
+        """
+        :return: The last object in this ConfigList() which is indented ``indent`` spaces, or None.
+        :rtype: BaseCfgLine
+        """
+        _, last_at_indent = self._family_index()
+        return last_at_indent.get(indent, None)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _locate(self, obj: BaseCfgLine) -> int | None:
+        """
+        :return: The index of ``obj`` (found by binary search on its order label) or None if ``obj`` is not in this ConfigList().
+        :rtype: Union[int,None]
+        """
+        data = self.data
+        label = obj._order_label
+        idx = bisect_left(data, label, key=attrgetter("_order_label"))
+        # Labels are only tied while _assign_order_label() is running
+        while idx < len(data) and data[idx]._order_label == label:
+            if data[idx] is obj:
+                return idx
+            idx += 1
+        return None
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _assign_order_label(self, idx: int) -> None:
+        """
+        Assign an order label to the object at ``idx``, between the labels of its neighbors.
+
+        If there is no gap between the neighbors, relabel the smallest aligned label range (around ``idx``) whose density is below ``ORDER_LABEL_DENSITY ** -level``.  This is the list-labeling algorithm from Bender, et al; inserts cost amortized O(log n) relabels.
+
+        :param idx: The index of the object to label
+        :type idx: int
+        :rtype: None
+        """
+        data = self.data
+        obj = data[idx]
+        prev_label = data[idx - 1]._order_label if idx > 0 else -1
+
+        if idx == len(data) - 1:
+            # Appending to the end of the ConfigList() always has room...
+            obj._order_label = prev_label + ORDER_LABEL_GAP
+            return
+
+        next_label = data[idx + 1]._order_label
+        if next_label - prev_label > 1:
+            obj._order_label = (prev_label + next_label) // 2
+            return
+
+        # Temporarily tie obj with the next label so the labels are still sorted
+        obj._order_label = next_label
+        key = attrgetter("_order_label")
+        last_label = data[-1]._order_label
+        level = 0
+        while True:
+            level += 1
+            size = 1 << level
+            start_label = (next_label >> level) << level
+            start = bisect_left(data, start_label, key=key)
+            stop = bisect_left(data, start_label + size, key=key)
+            count = stop - start
+
+            if count * ORDER_LABEL_DENSITY**level < size:
+                self._make_writable(start, stop)
+                step = size // count
+                for ii in range(start, stop):
+                    data[ii]._order_label = start_label + (ii - start) * step
+                return
+
+            if start_label == 0 and size > last_label:
+                # The whole label range is too dense; space everything out again...
+                self._make_writable(0, len(data))
+                for ii, each in enumerate(data):
+                    each._order_label = ii * ORDER_LABEL_GAP
+                return
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _requires_rebuild(self, obj: BaseCfgLine, neighbors: list[BaseCfgLine]) -> bool:
+        """
+        :return: Whether inserting or deleting ``obj`` next to the ``neighbors`` objects needs :py:meth:`ConfigList.rebuild_after_modification` instead of incremental parent / child updates.  Brace syntax, banners, macros and ignored blank lines are only handled by :py:meth:`ConfigList.bootstrap`.
+        :rtype: bool
+        """
+        if self.syntax in ALL_BRACE_SYNTAX:
+            return True
+
+        text = obj.text
+        if self.ignore_blank_lines is True and text.strip() == "":
+            return True
+
+        if text[0:11] == "macro name " or BANNER_RE.search(text):
+            return True
+
+        # Banner and macro families set blank_line_keep on their parent...
+        return any(each.blank_line_keep is True or each.parent.blank_line_keep is True for each in [obj, *neighbors])
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _detach_child(self, childobj: BaseCfgLine) -> None:
+        """
+        Remove ``childobj`` from the children of its parent; ``childobj`` becomes its own parent.
+
+        :rtype: None
+        """
+        oldparent = childobj.parent
+        if oldparent is not childobj:
+            for idx, obj in enumerate(oldparent.children):
+                if obj is childobj:
+                    del oldparent.children[idx]
+                    break
+            childobj.parent = childobj
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _adopt_child(self, parentobj: BaseCfgLine, childobj: BaseCfgLine) -> None:
+        """
+        Move ``childobj`` from its current parent (if any) to the children of ``parentobj``.
+
+        :rtype: None
+        """
+        self._detach_child(childobj)
+
+        children = parentobj.children
+        children.insert(
+            bisect_right(children, childobj._order_label, key=attrgetter("_order_label")),
+            childobj,
+        )
+        childobj.parent = parentobj
+        parentobj.child_indent = childobj.indent
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _link_parent(self, idx: int) -> None:
+        """
+        Walk backwards from ``idx`` and assign the parent of the object at ``idx``, using the same rules as :py:meth:`ConfigList.bootstrap`.
+
+        :rtype: None
+        """
+        data = self.data
+        obj = data[idx]
+        indent = obj.indent
+
+        parentobj = None
+        if indent == 0:
+            pass
+
+        elif obj.is_comment and idx > 0 and data[idx - 1].indent > indent:
+            # Comments are not children when the line above is indented more
+            pass
+
+        else:
+            for parent_idx in range(idx - 1, -1, -1):
+                candidate = data[parent_idx]
+                if candidate.indent < indent and candidate.is_config_line:
+                    parentobj = candidate
+                    break
+
+        if parentobj is None:
+            self._detach_child(obj)
+        elif parentobj is not obj.parent:
+            self._adopt_child(parentobj, obj)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _link_next_comment(self, idx: int) -> None:
+        """
+        Relink the object at ``idx`` if it is a comment; comment parents depend on the indent of the line above them.
+
+        :rtype: None
+        """
+        data = self.data
+        if idx < len(data) and data[idx].is_comment:
+            self._link_parent(idx)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _link_children(self, idx: int) -> None:
+        """
+        Walk forwards from ``idx`` and adopt the objects whose closest less-indented config line is now the object at ``idx``.
+
+        :rtype: None
+        """
+        data = self.data
+        obj = data[idx]
+        if not obj.is_config_line:
+            return
+
+        indent = obj.indent
+        min_indent = None
+        for child_idx in range(idx + 1, len(data)):
+            child = data[child_idx]
+            child_indent = child.indent
+            is_config_line = child.is_config_line
+            if is_config_line and child_indent <= indent:
+                break
+
+            if child_indent > indent and (min_indent is None or child_indent <= min_indent):
+                if not (child.is_comment and data[child_idx - 1].indent > child_indent):
+                    self._adopt_child(obj, child)
+
+            if is_config_line and (min_indent is None or child_indent < min_indent):
+                min_indent = child_indent
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _insert_object(self, idx: int, obj: BaseCfgLine) -> None:
+        """
+        Insert ``obj`` at ``idx``; assign its order label and parent / child relationships without reparsing the ConfigList().
+
+        :rtype: None
+        """
+        self._require_writable()
+        data = self.data
+        if idx < 0:
+            idx = max(0, len(data) + idx)
+        idx = min(idx, len(data))
+
+        family_index = self._take_family_index()
+        if self.cow_shared is True:
+            self._make_writable(*self._edit_span(idx, idx))
+
+        data.insert(idx, obj)
+        obj.confobj = self
+        obj._cow_epoch = self.cow_epoch
+        obj.parent = obj
+        obj.children = []
+        self.mutation_counter += 1
+        self._assign_order_label(idx)
+
+        if self._requires_rebuild(obj, data[max(0, idx - 1) : idx + 2]):
+            length = len(data)
+            self.rebuild_after_modification(commit=False)
+            if len(self.data) == length:
+                # ignore_blank_lines did not remove obj
+                self._record_edit([("insert", idx, obj)])
+            return
+
+        self._record_edit([("insert", idx, obj)])
+
+        following = data[idx + 1] if idx + 1 < len(data) else None
+        following_parent = following.parent if following is not None else None
+        self._link_parent(idx)
+        self._link_children(idx)
+        self._link_next_comment(idx + 1)
+
+        # Adopting children or relinking a comment moves other families
+        if len(obj.children) == 0 and (following is None or following.parent is following_parent):
+            self._family_index_insert(family_index, obj)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _delete_object(self, idx: int) -> BaseCfgLine:
+        """
+        Delete the object at ``idx`` without reparsing the ConfigList(); the children of the deleted object are linked to a new parent.
+
+        :return: The deleted object
+        :rtype: BaseCfgLine
+        """
+        self._require_writable()
+        data = self.data
+        family_index = self._take_family_index()
+        if self.cow_shared is True:
+            self._make_writable(*self._edit_span(idx, idx + 1))
+
+        obj = data.pop(idx)
+        self.mutation_counter += 1
+        self._record_edit([("delete", idx, obj)])
+
+        if self._requires_rebuild(obj, data[max(0, idx - 1) : idx + 1]):
+            self.rebuild_after_modification(commit=False)
+            return obj
+
+        ancestors = []
+        node = obj
+        while node.parent is not node:
+            node = node.parent
+            ancestors.append(node)
+        self._detach_child(obj)
+
+        had_children = len(obj.children) > 0
+        for child in list(obj.children):
+            if child.parent is obj:
+                child.parent = child
+                self._link_parent(self._object_index(child))
+
+        following = data[idx] if idx < len(data) else None
+        following_parent = following.parent if following is not None else None
+        self._link_next_comment(idx)
+
+        # Relinking children or a comment moves other families
+        if not had_children and (following is None or following.parent is following_parent):
+            self._family_index_delete(family_index, idx, obj, ancestors)
+
+        return obj
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _delete_family(self, obj: BaseCfgLine) -> None:
+        """
+        Delete ``obj`` and all of its children (recursively) without reparsing the ConfigList().
+
+        :rtype: None
+        """
+        self._require_writable()
+        data = self.data
+        if self.cow_shared is True:
+            idx = self._object_index(obj)
+            self._make_writable(*self._edit_span(idx, idx + 1))
+            obj = data[idx]
+
+        rebuild = False
+        # Banner children can be listed twice in all_children; de-duplicate
+        #     by id() and delete from the bottom of the family to the top
+        family = {id(each): each for each in [obj, *obj.all_children]}
+        followers = []
+        edits = []
+        for each in reversed(family.values()):
+            idx = self._object_index(each)
+            del data[idx]
+            edits.append(("delete", idx, each))
+            rebuild = rebuild or self._requires_rebuild(each, data[max(0, idx - 1) : idx + 1])
+            if idx < len(data):
+                followers.append(data[idx])
+        self.mutation_counter += 1
+        self._record_edit(edits)
+
+        if rebuild is True:
+            self.rebuild_after_modification(commit=False)
+            return
+
+        self._detach_child(obj)
+        for each in followers:
+            if each.is_comment:
+                self._link_parent(self._object_index(each))
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _new_cfgobj(self, new_val: str | BaseCfgLine) -> BaseCfgLine:
+        """
+        :return: A configuration object for ``new_val``, built according to ``syntax`` and ``factory``.
+        :rtype: BaseCfgLine
+        """
+        if isinstance(new_val, BaseCfgLine):
+            return new_val
+
+        if self.intern_table is not None:
+            new_val = self.intern_table.setdefault(new_val, new_val)
+
+        if self.factory is False:
+            return CFGLINE[self.syntax](
+                line=new_val,
+            )
+
+        elif self.factory is True:
+            return config_line_factory(
+                all_lines=ConfigLinesView(self),
+                line=new_val,
+                syntax=self.syntax,
+            )
+
+        error = f"Invalid CiscoConfParse().factory value - {self.factory}"
+        logger.error(error)
+        raise ValueError(error)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _record_edit(self, edits: list[tuple]) -> None:
+        """
+        Add ``edits`` (one user-visible edit) to the undo journal, unless undo() or redo() are replaying them.
+
+        :rtype: None
+        """
+        if self.journal_replay is False:
+            self.journal.append(edits)
+            self.redo_journal.clear()
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _record_text_change(self, obj: BaseCfgLine, old_text: str) -> None:
+        """
+        Journal a change of ``obj.text`` from ``old_text``; :py:attr:`~ciscoconfparse2.ccp_abc.BaseCfgLine.text` calls this after it changes ``obj``.
+
+        :rtype: None
+        """
+        if self.journal_replay is False and old_text != obj._text:
+            idx = self._locate(obj)
+            if idx is not None:
+                self._record_edit([("text", idx, old_text, obj._text)])
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _reset_journal(self) -> None:
+        """
+        Forget all undo and redo edits; this is called by operations which are not journaled, such as :py:meth:`ConfigList.sort`.
+
+        :rtype: None
+        """
+        self.journal.clear()
+        self.redo_journal.clear()
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _replace_text(self, idx: int, text: str) -> None:
+        """
+        Set the text of the object at ``idx``; relink the object if its indent (or whether it is a comment) changed.
+
+        :rtype: None
+        """
+        obj = self.data[idx]
+        old_text = obj.text
+        if len(old_text) - len(old_text.lstrip()) == len(text) - len(text.lstrip()) and old_text.lstrip()[0:1] == text.lstrip()[0:1]:
+            obj.text = text
+            return
+
+        self._delete_object(idx)
+        obj.text = text
+        self._insert_object(idx, obj)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _replay_edits(self, edits: list[tuple], undo: bool) -> list[tuple]:
+        """
+        Apply ``edits`` (or their inverse operations, in reverse order if ``undo`` is True) without reparsing the ConfigList().
+
+        :return: ``edits``, updated with the objects which were actually deleted; a commit replaces all objects in the ConfigList()
+        :rtype: List[tuple]
+        """
+        retval = list(edits)
+        self.journal_replay = True
+        try:
+            for pos in reversed(range(len(edits))) if undo is True else range(len(edits)):
+                edit = edits[pos]
+                operation, idx = edit[0], edit[1]
+                if operation == "text":
+                    self._replace_text(idx, edit[2] if undo is True else edit[3])
+                elif (operation == "insert") is undo:
+                    retval[pos] = (operation, idx, self._delete_object(idx))
+                else:
+                    self._insert_object(idx, edit[2])
+        finally:
+            self.journal_replay = False
+        return retval
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def undo(self, count: int = 1) -> int:
+        """
+        Undo the last ``count`` journaled edits (inserts, deletes, and changes to :py:attr:`~ciscoconfparse2.ccp_abc.BaseCfgLine.text`) without reparsing the configuration.
+
+        Edits which rebuild the whole ConfigList() (such as :py:meth:`ConfigList.sort`) clear the journal.
+
+        :param count: The number of edits to undo, default to 1.
+        :type count: int
+        :return: The number of edits which were undone
+        :rtype: int
+        """
+        self._require_writable()
+        retval = 0
+        while retval < count and len(self.journal) > 0:
+            edits = self._replay_edits(self.journal.pop(), undo=True)
+            self.redo_journal.append(edits)
+            retval += 1
+        return retval
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def redo(self, count: int = 1) -> int:
+        """
+        Redo the last ``count`` edits undone by :py:meth:`ConfigList.undo`.
+
+        :param count: The number of edits to redo, default to 1.
+        :type count: int
+        :return: The number of edits which were redone
+        :rtype: int
+        """
+        self._require_writable()
+        retval = 0
+        while retval < count and len(self.redo_journal) > 0:
+            edits = self._replay_edits(self.redo_journal.pop(), undo=False)
+            self.journal.append(edits)
+            retval += 1
+        return retval
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def snapshot(self, ccp_ref: Any = None) -> ConfigList:
+        """
+        Return a copy-on-write ConfigList() which shares all of its objects with this ConfigList().
+
+        The snapshot copies a configuration family (a parent and all of its children) the first time it hands out, or modifies, an object in that family.  This ConfigList() copies a family into its snapshots before it modifies an object in that family.
+
+        The snapshot of a read-only ConfigList() is writable; the read-only ConfigList() never changes, so it does not track its snapshots.
+
+        :param ccp_ref: The CiscoConfParse() instance which owns the snapshot
+        :type ccp_ref: CiscoConfParse
+        :return: A new writable ConfigList() with ``auto_commit=False``
+        :rtype: ConfigList
+        """
+        snap = ConfigList(
+            comment_delimiters=self.comment_delimiters,
+            factory=self.factory,
+            ignore_blank_lines=self.ignore_blank_lines,
+            syntax=self.syntax,
+            indent_width=self.indent_width,
+            auto_commit=False,
+            ccp_ref=ccp_ref,
+            debug=self.debug,
+            intern_table=self.intern_table,
+        )
+        snap.data = list(self.data)
+        snap.current_checkpoint = self.current_checkpoint
+        snap.commit_checkpoint = self.commit_checkpoint
+        snap.mutation_counter = 1
+        snap.cow_shared = True
+
+        if self.read_only is True:
+            # Do not modify a read-only ConfigList(), it may be shared
+            #     across threads
+            return snap
+
+        # Objects owned by this ConfigList() with an older epoch are shared
+        self.cow_epoch += 1
+        self.cow_shared = True
+        self._live_snapshots()
+        self.snapshots.append(weakref.ref(snap))
+        return snap
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _live_snapshots(self) -> list[ConfigList]:
+        """
+        :return: The snapshots of this ConfigList() which have not been garbage-collected
+        :rtype: List[ConfigList]
+        """
+        retval = []
+        live_refs = []
+        for ref in self.snapshots:
+            snap = ref()
+            if snap is not None:
+                retval.append(snap)
+                live_refs.append(ref)
+        self.snapshots[:] = live_refs
+        return retval
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _root_of(self, obj: BaseCfgLine) -> BaseCfgLine:
+        """
+        :return: The oldest ancestor of ``obj``
+        :rtype: BaseCfgLine
+        """
+        while obj.parent is not obj:
+            obj = obj.parent
+        return obj
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _family_members(self, root: BaseCfgLine) -> dict[int, BaseCfgLine]:
+        """
+        :return: ``root`` and all of its children (recursively), keyed by id(); banner children are only listed once
+        :rtype: Dict[int,BaseCfgLine]
+        """
+        family = {}
+        stack = [root]
+        while stack:
+            each = stack.pop()
+            if id(each) not in family:
+                family[id(each)] = each
+                stack.extend(each._children)
+        return family
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _clone_family(self, root: BaseCfgLine) -> dict[int, BaseCfgLine]:
+        """
+        Replace the family of ``root`` in this ConfigList() with copies owned by this ConfigList(); the copies keep the order labels of the original objects.
+
+        :return: The copies, keyed by the id() of the original object
+        :rtype: Dict[int,BaseCfgLine]
+        """
+        family = self._family_members(root)
+        clones = {}
+        for key, each in family.items():
+            # Copy without calling __init__() (or the loguru pickle workarounds)
+            clone = object.__new__(each.__class__)
+            clone.__dict__.update(each.__dict__)
+            clone.confobj = self
+            clone._cow_epoch = self.cow_epoch
+            clone._value_cache = None
+            clones[key] = clone
+
+        data = self.data
+        for key, each in family.items():
+            clone = clones[key]
+            clone.parent = clones.get(id(each.parent), clone)
+            clone._children = [clones[id(child)] for child in each._children]
+            idx = self._locate(each)
+            if idx is not None:
+                data[idx] = clone
+
+        # The copies still have the line numbers of the original objects
+        self.linenum_counter = -1
+        return clones
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _release_family(self, root: BaseCfgLine) -> None:
+        """
+        Copy the family of ``root`` into this snapshot (and its snapshots) before the ConfigList() which owns ``root`` modifies it.
+
+        :rtype: None
+        """
+        if self._locate(root) is not None:
+            self._clone_family(root)
+        for snap in self._live_snapshots():
+            snap._release_family(root)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _unshare_family(self, root: BaseCfgLine) -> None:
+        """
+        Stop sharing the family of ``root`` (owned by this ConfigList()) with all snapshots.
+
+        :rtype: None
+        """
+        for snap in self._live_snapshots():
+            snap._release_family(root)
+        for each in self._family_members(root).values():
+            each._cow_epoch = self.cow_epoch
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _unshare_object(self, obj: BaseCfgLine) -> None:
+        """
+        Stop sharing the family of ``obj`` with all snapshots; :py:meth:`~ciscoconfparse2.ccp_abc.BaseCfgLine.text` calls this before modifying ``obj`` in place.
+
+        :rtype: None
+        """
+        if obj.confobj is self and obj._cow_epoch != self.cow_epoch:
+            self._unshare_family(self._root_of(obj))
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _make_writable(self, start: int, stop: int) -> None:
+        """
+        Ensure that every family with an object in ``self.data[start:stop]`` may be modified in place; copy families owned by another ConfigList() and unshare families owned by this ConfigList().
+
+        :rtype: None
+        """
+        if self.cow_shared is False:
+            return
+
+        roots = {}
+        cow_epoch = self.cow_epoch
+        for each in self.data[max(0, start) : stop]:
+            if each.confobj is not self or each._cow_epoch != cow_epoch:
+                root = self._root_of(each)
+                roots[id(root)] = root
+
+        for root in roots.values():
+            if root.confobj is self:
+                self._unshare_family(root)
+            else:
+                self._clone_family(root)
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _edit_span(self, start: int, stop: int) -> tuple[int, int]:
+        """
+        :return: The ``(start, stop)`` index range of objects whose parent / child relationships may change when objects are inserted or deleted at ``self.data[start:stop]``.  The range extends to the closest config lines which are not indented.
+        :rtype: Tuple[int,int]
+        """
+        data = self.data
+        while start > 0:
+            start -= 1
+            each = data[start]
+            if each.indent == 0 and each.is_config_line:
+                break
+
+        while stop < len(data):
+            each = data[stop]
+            if each.indent == 0 and each.is_config_line:
+                break
+            stop += 1
+        return start, stop
+
+    # This method is on ConfigList()
+    @logger.catch(reraise=True)
+    def _own(self, objs: list[BaseCfgLine]) -> list[BaseCfgLine]:
+        """
+        :return: ``objs``, with objects owned by another ConfigList() replaced by copies owned by this ConfigList()
+        :rtype: List[BaseCfgLine]
+        """
+        if self.cow_shared is False:
+            return objs
+
+        clones = {}
+        for obj in objs:
+            if obj.confobj is not self and id(obj) not in clones:
+                clones.update(self._clone_family(self._root_of(obj)))
+        if len(clones) == 0:
+            return objs
+        return [clones.get(id(obj), obj) for obj in objs]
+
+    # This method is on ConfigList()
+    def _iter_owned(self) -> GeneratorType:
+        """
+        :return: All objects in this ConfigList(); objects owned by another ConfigList() are copied before they are returned
+        :rtype: BaseCfgLine
+        """
+        data = self.data
+        idx = 0
+        while idx < len(data):
+            obj = data[idx]
+            if obj.confobj is not self:
+                self._clone_family(self._root_of(obj))
+                obj = data[idx]
+            yield obj
+            idx += 1
+
     # This method is on ConfigList()
     @logger.catch(reraise=True)
     def auto_indent_config(self, indent_width=-1) -> bool:
@@ -969,6 +2059,7 @@ class ConfigList(UserList):
             logger.error(error)
             raise ValueError(error)
 
+        self._require_writable()
         for obj in self.data:
             if obj.indent != 0:
                 obj.indent = obj.parent.indent + indent_width
@@ -991,6 +2082,9 @@ class ConfigList(UserList):
 
         :rtype: bool
         """
+        if self.read_only is True:
+            # A read-only ConfigList() cannot change after it is parsed
+            return True
         return self.current_checkpoint == self.commit_checkpoint
 
     # This method is on ConfigList()
@@ -1000,6 +2094,9 @@ class ConfigList(UserList):
         :return: The result of the ConfigList() commit operation
         :rtype: bool
         """
+        if self.read_only is True:
+            # Nothing can change, so there is nothing to commit
+            return True
 
         try:
             # bootstrap the ConfigList() for any commit operation
@@ -1043,20 +2140,8 @@ class ConfigList(UserList):
         if self.debug >= 1:
             logger.debug(f"    ConfigList().append(line={line}) was called.")
 
-        if bool(self.factory) is False:
-            obj = CFGLINE[self.syntax](
-                all_lines=self.as_text,
-                line=line,
-            )
-        else:
-            obj = config_line_factory(
-                all_lines=self.as_text,
-                line=line,
-                syntax=self.syntax,
-            )
-
-        # self.data.append(obj)
-        self.data.insert(len(self.data), obj)
+        # Do not rebuild self.as_text here; that makes each append() O(n)
+        self._insert_object(len(self.data), self._new_cfgobj(line))
 
         if bool(self.auto_commit):
             # The config is not safe unless this is called after the append
@@ -1075,10 +2160,9 @@ class ConfigList(UserList):
         :return: The pop'd value
         :rtype: BaseCfgLine
         """
-        retval = self.data.pop(index)
-
-        # Rebuild / renumber items on the modified ConfigList()...
-        self.rebuild_after_modification(commit=self.auto_commit)
+        if index < 0:
+            index += len(self.data)
+        retval = self._delete_object(index)
 
         if bool(self.auto_commit):
             # The config is not safe unless this is called after the append
@@ -1100,20 +2184,16 @@ class ConfigList(UserList):
         """
 
         if isinstance(item, BaseCfgLine):
-            idx = self.data.index(item)
+            idx = self._object_index(item)
+            if idx is None:
+                # Raise ConfigListItemDoesNotExist()
+                self.index(item)
         else:
             error = f"item must be an instance of BaseCfgLine(), but we got {type(item)}"
             logger.critical(error)
             raise InvalidParameters(error)
 
-        # Remove all child objects...
-        for obj in self.data[idx].all_children:
-            self.data.remove(obj)
-        # Remove the parent...
-        self.data.pop(idx)
-
-        # Rebuild / renumber items on the modified ConfigList()...
-        self.rebuild_after_modification(commit=self.auto_commit)
+        self._delete_family(self.data[idx])
 
         if bool(self.auto_commit):
             # The config is not safe unless this is called after the append
@@ -1127,7 +2207,9 @@ class ConfigList(UserList):
 
         :rtype: None
         """
+        self._require_writable()
         self.data.clear()
+        self._reset_journal()
 
         self.data = self.bootstrap([])
 
@@ -1195,7 +2277,9 @@ class ConfigList(UserList):
 
         :rtype: None
         """
+        self._require_writable()
         self.data.reverse()
+        self._reset_journal()
 
         # Rebuild / renumber items on the modified ConfigList()...
         self.rebuild_after_modification(commit=self.auto_commit)
@@ -1227,7 +2311,9 @@ class ConfigList(UserList):
         :type reverse: bool
         :rtype: None
         """
+        self._require_writable()
         self.data.sort(cmp=cmp, key=key, reverse=reverse)
+        self._reset_journal()
 
         # Rebuild / renumber items on the modified ConfigList()...
         self.rebuild_after_modification(commit=self.auto_commit)
@@ -1244,6 +2330,7 @@ class ConfigList(UserList):
 
         :rtype: None
         """
+        self._require_writable()
         if isinstance(other, ConfigList):
             self.data.extend(other.data)
         elif isinstance(other, (list, tuple)):
@@ -1252,6 +2339,7 @@ class ConfigList(UserList):
             error = f"'other' must be a ConfigList, list or tuple, but we got {type(other)}"
             logger.critical(error)
             raise InvalidParameters(error)
+        self._reset_journal()
 
         # Rebuild / renumber items on the modified ConfigList()...
         self.rebuild_after_modification(commit=self.auto_commit)
@@ -1273,30 +2361,14 @@ class ConfigList(UserList):
             logger.error(error)
             raise ValueError(error)
 
-        idx = exist_val.linenum
+        idx = self._object_index(exist_val)
+        if idx is None:
+            # exist_val was replaced by a commit; use its last line number
+            idx = exist_val.linenum
+        self._insert_object(idx, self._new_cfgobj(new_val))
 
-        if self.factory is False:
-            new_obj = CFGLINE[self.syntax](
-                all_lines=self.data,
-                line=new_val,
-            )
-
-        elif self.factory is True:
-            new_obj = config_line_factory(
-                all_lines=self.data,
-                line=new_val,
-                syntax=self.syntax,
-            )
-
-        else:
-            error = f"Invalid CiscoConfParse().factory value - {self.factory}"
-            logger.error(error)
-            raise ValueError(error)
-
-        self.data.insert(idx, new_obj)
-
-        # Rebuild / renumber items on the modified ConfigList()...
-        self.rebuild_after_modification(commit=self.auto_commit)
+        if bool(self.auto_commit):
+            self.ccp_ref.commit()
 
         return self.data[idx]
 
@@ -1313,30 +2385,14 @@ class ConfigList(UserList):
             logger.error(error)
             raise ValueError(error)
 
-        idx = exist_val.linenum
-
-        if self.factory is False:
-            new_obj = CFGLINE[self.syntax](
-                all_lines=self.data,
-                line=new_val,
-            )
-
-        elif self.factory is True:
-            new_obj = config_line_factory(
-                all_lines=self.data,
-                line=new_val,
-                syntax=self.syntax,
-            )
-
-        else:
-            error = f"Invalid CiscoConfParse().factory value - {self.factory}"
-            logger.error(error)
-            raise ValueError(error)
-
-        self.data.insert(idx + 1, new_obj)
+        idx = self._object_index(exist_val)
+        if idx is None:
+            # exist_val was replaced by a commit; use its last line number
+            idx = exist_val.linenum
+        self._insert_object(idx + 1, self._new_cfgobj(new_val))
 
-        # Rebuild / renumber items on the modified ConfigList()...
-        self.rebuild_after_modification(commit=self.auto_commit)
+        if bool(self.auto_commit):
+            self.ccp_ref.commit()
 
         return self.data[idx]
 
@@ -1349,142 +2405,31 @@ class ConfigList(UserList):
             logger.error(error)
             raise ValueError(error)
 
-        if isinstance(new_val, BaseCfgLine):
-            new_obj = new_val
-
-        elif self.factory is False:
-            new_obj = CFGLINE[self.syntax](
-                all_lines=self.data,
-                line=new_val,
-            )
-
-        elif self.factory is True:
-            new_obj = config_line_factory(
-                all_lines=self.data,
-                line=new_val,
-                syntax=self.syntax,
-            )
-
-        else:
-            error = f"Invalid CiscoConfParse().factory value - {self.factory}"
-            logger.error(error)
-            raise ValueError(error)
-
-        self.data.insert(idx, new_obj)
+        if idx < 0:
+            # Use list.insert() semantics for negative indexes...
+            idx = max(0, len(self.data) + idx)
+        idx = min(idx, len(self.data))
+        self._insert_object(idx, self._new_cfgobj(new_val))
 
-        # Rebuild / renumber items on the modified ConfigList()...
-        self.rebuild_after_modification(commit=self.auto_commit)
+        if bool(self.auto_commit):
+            self.ccp_ref.commit()
 
         return self.data[idx]
 
     # This method is on ConfigList()
-    @logger.catch(reraise=True)
-    def _banner_mark_regex(self, regex: str | re.Pattern) -> None:
+    def _add_banner_child(self, parentobj: BaseCfgLine, childobj: BaseCfgLine) -> None:
         """
-        :param regex: Find banner object children with `regex`` and build references
-                      between banner parent / child objects.
-        :return: None
-        :rtype: None
-        """
-        # Build a list of all banner parent objects...
-        banner_objs = list(
-            filter(lambda obj: regex.search(obj.text), self.data),
-        )
+        Add ``childobj`` to the children of the IOS banner or macro ``parentobj``; banner and macro children are not indented.
 
-        banner_re_str = r"^(?:(?P<btype>(?:set\s+)*banner\s\w+\s+)(?P<bchar>\S))"
-        for parent in banner_objs:
-            # blank_line_keep for original ciscoconfparse Github Issue #229
-            parent.blank_line_keep = True
-
-            ## Parse out the banner type and delimiting banner character
-            mm = re.search(banner_re_str, parent.text)
-            if mm is not None:
-                mm_results = mm.groupdict()
-                banner_lead, bannerdelimit = (
-                    mm_results["btype"].rstrip(),
-                    mm_results["bchar"],
-                )
-            else:
-                banner_lead, bannerdelimit = ("", None)
-
-            if self.debug > 0:
-                logger.debug(f"banner_lead = '{banner_lead}'")
-                logger.debug(f"bannerdelimit = '{bannerdelimit}'")
-                logger.debug(f"{banner_lead} starts at line {parent.linenum}")
-
-            idx = parent.linenum
-            while bannerdelimit is not None:
-                ## Check whether the banner line has both begin and end delimter
-                if idx == parent.linenum:
-                    parts = parent.text.split(bannerdelimit)
-                    if len(parts) > 2:
-                        ## banner has both begin and end delimiter on one line
-                        if self.debug > 0:
-                            logger.debug(f"{banner_lead} ends at line {parent.linenum}")
-                        break
-
-                ## Use code below to identify children of the banner line
-                idx += 1
-                try:
-                    obj = self.data[idx]
-                    if obj.text is None:
-                        if self.debug > 0:
-                            logger.warning(f"found empty text while parsing '{obj}' in the banner")
-                    elif bannerdelimit in obj.text.strip():
-                        # Hit the bannerdelimit char... Exit banner parsing here...
-                        if self.debug > 0:
-                            logger.debug(f"{banner_lead} ends at line {obj.linenum}")
-                        # blank_line_keep for Github Issue #229
-                        parent.children.append(obj)
-                        parent.child_indent = 0
-                        obj.parent = parent
-                        break
-                    else:
-                        # all non-banner-parent lines should hit this condition
-                        if self.debug > 0:
-                            logger.debug(f"found banner child {obj}")
-
-                    parent.children.append(obj)
-                    parent.child_indent = 0
-                    obj.parent = parent
-                    obj.blank_line_keep = True
-
-                except IndexError:
-                    break
-
-        return
-
-    # This method is on ConfigList()
-    @logger.catch(reraise=True)
-    def _ciscoios_macro_mark_children(self, macro_parent_idx_list: list[BaseCfgLine]) -> None:
-        """
-        Set the blank_line_keep attribute for all Cisco IOS banner parent / child objs.
-
-        Macro blank lines are automatically kept.
-
-        :param macro_parent_idx_list: Cisco IOS configuration with *CfgLine() instances
-        :type macro_parent_idx_list: List[BaseCfgLine]
+        :param parentobj: The banner or macro parent
+        :type parentobj: BaseCfgLine
+        :param childobj: The banner or macro line
+        :type childobj: BaseCfgLine
         :rtype: None
         """
-        # Mark macro children appropriately...
-        for idx in macro_parent_idx_list:
-            pobj = self.data[idx]
-            # blank_line_keep for original ciscoconfparse Github Issue #229
-            pobj.blank_line_keep = True
-            pobj.child_indent = 0
-
-            # Walk the next configuration lines looking for the macro's children
-            finished = False
-            while not finished:
-                idx += 1
-                cobj = self.data[idx]
-                # blank_line_keep for original ciscoconfpasre Github Issue #229
-                cobj.blank_line_keep = True
-                cobj.parent = pobj
-                pobj.children.append(cobj)
-                # If we hit the end of the macro, break out of the loop
-                if cobj.text.rstrip() == "@":
-                    finished = True
+        parentobj.children.append(childobj)
+        parentobj.child_indent = 0
+        childobj.parent = parentobj
 
     # This method is on ConfigList()
     @logger.catch(reraise=True)
@@ -1604,15 +2549,35 @@ class ConfigList(UserList):
         if self.debug >= 1:
             logger.info("    ConfigList().bootstrap() was called.")
 
+        # Profiling costs one attribute lookup when it is disabled
+        profile = getattr(self.ccp_ref, "profile", False)
+        if profile:
+            bootstrap_start = time.perf_counter()
+
         retval = []
         idx = None
         syntax = self.syntax
 
+        # The new objects are numbered as they are built...
+        self.mutation_counter += 1
+        self.linenum_counter = self.mutation_counter
+
         max_indent = 0
-        macro_parent_idx_list = []
         # a dict of parents, indexed by int() child-indent...
         parent = None
         parents_cache = {}
+        intern_table = self.intern_table
+        # IOS banners and macros are marked in the same pass; lines between
+        #     the banner parent and its closing delimiter (or between
+        #     'macro name' and '@') are children of the banner / macro
+        mark_banners = syntax not in ALL_BRACE_SYNTAX
+        banner_parent = None
+        banner_delimiter = None
+        macro_parent = None
+        # Keep the objects which survive ignore_blank_lines; retval keeps
+        #     every object because parent lookups index into it
+        ignore_blank_lines = self.ignore_blank_lines
+        kept = []
         for idx, txt in enumerate(text_list):
             if self.debug >= 1:
                 logger.debug(f"    bootstrap() adding text cmd: '{txt}' at idx {idx}")
@@ -1622,6 +2587,9 @@ class ConfigList(UserList):
                 logger.error(error)
                 raise ValueError(error)
 
+            if intern_table is not None:
+                txt = intern_table.setdefault(txt, txt)
+
             # Assign a custom *CfgLine() based on factory...
             obj = cfgobj_from_text(
                 text_list,
@@ -1632,13 +2600,36 @@ class ConfigList(UserList):
                 factory=self.factory,
             )
             obj.confobj = self
+            obj._order_label = idx * ORDER_LABEL_GAP
+            obj._cow_epoch = self.cow_epoch
+            retval.append(obj)
+
+            if banner_parent is not None:
+                # blank_line_keep for original ciscoconfparse Github Issue #229
+                self._add_banner_child(banner_parent, obj)
+                if banner_delimiter in obj.text:
+                    # Hit the banner delimiter... the banner ends here
+                    if self.debug > 0:
+                        logger.debug(f"banner ends at line {idx}")
+                    banner_parent = None
+                else:
+                    obj.blank_line_keep = True
+                kept.append(obj)
+                continue
+
+            if macro_parent is not None:
+                # blank_line_keep for original ciscoconfparse Github Issue #229
+                self._add_banner_child(macro_parent, obj)
+                obj.blank_line_keep = True
+                # If we hit the end of the macro, stop marking macro children
+                if obj.text.rstrip() == "@":
+                    macro_parent = None
+                kept.append(obj)
+                continue
+
             indent = obj.indent
             is_config_line = obj.is_config_line
 
-            # list out macro parent line numbers...
-            if txt[0:11] == "macro name " and syntax == "ios":
-                macro_parent_idx_list.append(obj.linenum)
-
             parents_cache, parent = self._maintain_bootstrap_parent_cache(parents_cache, indent, max_indent, is_config_line)
 
             # If indented, walk backwards and find the parent...
@@ -1663,58 +2654,51 @@ class ConfigList(UserList):
             elif indent > max_indent:
                 max_indent = indent
 
-            retval.append(obj)
-
+            if mark_banners is True:
+                if BANNER_RE.search(obj.text):
+                    # blank_line_keep for original ciscoconfparse Github Issue #229
+                    obj.blank_line_keep = True
+                    mm = BANNER_DELIMITER_RE.search(obj.text)
+                    # The banner ends on this line if it has both the begin
+                    #     and end delimiter
+                    if mm is not None and len(obj.text.split(mm.group("bchar"))) <= 2:
+                        if self.debug > 0:
+                            logger.debug(f"{mm.group('btype').rstrip()} starts at line {idx}")
+                        banner_parent = obj
+                        banner_delimiter = mm.group("bchar")
+                elif txt[0:11] == "macro name " and syntax == "ios":
+                    obj.blank_line_keep = True
+                    obj.child_indent = 0
+                    macro_parent = obj
+
+            # change ignore_blank_lines behavior for Github Issue #229...
+            #    Always allow a blank line if it's in a banner or macro...
+            if ignore_blank_lines is True and obj.blank_line_keep is False and txt.strip() == "":
+                # Do not leave ignored blank lines in their parent's children
+                self._detach_child(obj)
+            else:
+                kept.append(obj)
+
+        if len(kept) < len(retval):
+            # Line numbers are no longer dense; renumber them lazily
+            self.mutation_counter += 1
+            # Journal indexes are no longer valid
+            self._reset_journal()
+            retval = kept
         self.data = retval
 
-        # Call _banner_mark_regex() to process banners in the returned obj
-        # list.
-        # Mark IOS banner begin and end config line objects...
-        #
-        # Build the banner_re regexp... at this point ios
-        #    and nxos share the same method...
-        if syntax not in ALL_BRACE_SYNTAX:
-            banner_re = self._build_banner_re_ios()
-            self._banner_mark_regex(banner_re)
-
-            # We need to use a different method for macros than banners because
-            #   macros don't specify a delimiter on their parent line, but
-            #   banners call out a delimiter.
-            self._ciscoios_macro_mark_children(macro_parent_idx_list)  # Process macros
-
-        # change ignore_blank_lines behavior for Github Issue #229...
-        #    Always allow a blank line if it's in a banner or macro...
-        if self.ignore_blank_lines is True:
-            retval = [obj for obj in self.data if obj.text.strip() != "" or obj.blank_line_keep is True]
-            self.data = retval
-
-        self.commit_checkpoint = self.get_checkpoint()
-        self.current_checkpoint = self.commit_checkpoint
-
-        return retval
+        if self.read_only is False:
+            if profile:
+                start = time.perf_counter()
+            self.commit_checkpoint = self.get_checkpoint()
+            self.current_checkpoint = self.commit_checkpoint
+            if profile:
+                self.ccp_ref._record_profile_phase("checkpoint", start, len(retval))
 
-    # This method is on ConfigList()
-    @logger.catch(reraise=True)
-    def _build_banner_re_ios(self) -> re.Pattern:
-        """
-        :return: A banner regexp for IOS (and at this point, NXOS).
-        :rtype: re.Pattern
-        """
-        banner_str = {
-            "login",
-            "motd",
-            "incoming",
-            "exec",
-            "telnet",
-            "lcd",
-        }
-        banner_all = [rf"^(set\s+)*banner\s+{ii}" for ii in banner_str]
-        banner_all.append(
-            "aaa authentication fail-message",
-        )  # original ciscoconfparse Github issue #76
-        banner_re = re.compile("|".join(banner_all))
+        if profile:
+            self.ccp_ref._record_profile_phase("bootstrap", bootstrap_start, len(retval))
 
-        return banner_re
+        return retval
 
     # This method is on ConfigList()
     @logger.catch(reraise=True)
@@ -1857,11 +2841,16 @@ class CiscoConfParse:
     auto_commit: bool = None
     factory: bool = False
     debug: int = 0
+    intern_table: dict[str, str] | None = None
+    read_only: bool = False
+    profile: bool | Callable = False
 
     # Attributes
     config_objs: Any = None
+    profile_stats: dict[str, dict] | None = None
     finished_config_parse: bool = False
     _index: int = -1
+    _route_tables: tuple[tuple[int, int], dict[str, RouteTable]] | None = None
 
     # This method is on CiscoConfParse()
     @logger.catch(reraise=True)
@@ -1881,6 +2870,9 @@ class CiscoConfParse:
         auto_commit: bool = True,
         factory: bool = False,
         debug: int = 0,
+        intern_table: dict[str, str] | None = None,
+        read_only: bool = False,
+        profile: bool | Callable = False,
     ):
         """
         Initialize CiscoConfParse.
@@ -1927,6 +2919,12 @@ class CiscoConfParse:
         :type factory: bool
         :param debug: Control CiscoConfParse debug output, default is 0.
         :type debug: int
+        :param intern_table: Default to None.  Pass the same dict to every CiscoConfParse() in a fleet-wide parse; identical configuration lines in all of them will share one string.
+        :type intern_table: dict
+        :param read_only: Default to False.  Build an immutable configuration for read-only audits; children are tuples, searches skip the commit checks, and any modification raises :py:class:`~ciscoconfparse2.errors.ReadOnlyConfiguration`.  A read-only configuration can be shared across threads; :py:meth:`~ciscoconfparse2.CiscoConfParse.snapshot` returns a writable copy of it.
+        :type read_only: bool
+        :param profile: Default to False.  Set True to record the wall time and object count of each parse phase in ``profile_stats``; set to a callable to also call it as ``profile(phase, seconds, objects)`` after each phase.
+        :type profile: Union[bool,Callable]
         :return: A CiscoConfParse object
         :rtype: :py:class:`~ciscoconfparse2.CiscoConfParse`
 
@@ -1966,6 +2964,8 @@ class CiscoConfParse:
                 A list of text configuration strings
             openargs : dict
                 Returns a dictionary of valid arguments for `open()` (these change based on the running python version).
+            profile_stats : dict
+                If ``profile`` is enabled, a dict of parse phases ('read_config', 'handle_ccp_brace_syntax', 'bootstrap', 'checkpoint' and 'commit'); each value is a dict with the number of ``calls``, the total ``seconds`` and the total ``objects`` the phase handled.  'bootstrap' includes banner and macro marking and the 'checkpoint' phase; 'commit' includes 'bootstrap'.
             syntax : str
                 A string holding the configuration type.  Default: 'ios'.  Must be one of: 'ios', 'nxos', 'iosxr', 'asa', 'junos'.  Use 'junos' for any brace-delimited network configuration (including F5, Palo Alto, etc...).
 
@@ -1975,7 +2975,12 @@ class CiscoConfParse:
         self.factory = bool(factory)
         self.ignore_blank_lines = False
         self.encoding = encoding or ENCODING
-        self.auto_commit = auto_commit
+        self.auto_commit = auto_commit and not read_only
+        self.intern_table = intern_table
+        self.read_only = read_only
+        self.profile = profile
+        self.profile_stats = {}
+        self._route_tables = None
 
         if factory:
             msg = "CiscoConfParse factory parameter is deprecated.  It should always be False."
@@ -2060,13 +3065,20 @@ class CiscoConfParse:
         self.debug = int(debug)
         self.linesplit_rgx = linesplit_rgx
 
+        if profile:
+            start = time.perf_counter()
         tmp_lines = self.read_config(config)
+        if profile:
+            self._record_profile_phase("read_config", start, len(tmp_lines))
+            start = time.perf_counter()
 
         ##################################################################
         # conditionally strip off junos-config braces and other syntax
         #     parsing issues...
         ##################################################################
         config_lines = self.handle_ccp_brace_syntax(tmp_lines=tmp_lines, syntax=syntax)
+        if profile:
+            self._record_profile_phase("handle_ccp_brace_syntax", start, len(config_lines))
         self.check_input_bad(config_lines=config_lines)
 
         if self.debug > 0:
@@ -2080,15 +3092,16 @@ class CiscoConfParse:
             ignore_blank_lines=ignore_blank_lines,
             syntax=syntax,
             ccp_ref=self,
-            auto_commit=auto_commit,
+            auto_commit=self.auto_commit,
+            intern_table=intern_table,
+            read_only=read_only,
         )
 
         ######################################################################
-        # Set the commit checkpoint after the initial parse... this
-        # avoids the need to manually call CiscoConfParse.commit()
-        # after parsing
+        # ConfigList().bootstrap() sets the commit checkpoint after the
+        # initial parse... calling CiscoConfParse.commit() here would
+        # parse the whole configuration a second time
         ######################################################################
-        self.commit()
 
         # Provide an index when iterating over CiscoConfParse() itself
         self._index = 0
@@ -2130,14 +3143,14 @@ class CiscoConfParse:
            >>>
         """
         # Returns the iterator object itself
-        return iter(self.config_objs.data)
+        return iter(self.config_objs)
 
     # This method is on CiscoConfParse()
     @logger.catch(reraise=True)
     def __next__(self):
         if self._index >= len(self.config_objs.data):
             raise StopIteration  # Signal the end of iteration
-        item = self.config_objs.data[self._index]
+        item = self.config_objs[self._index]
         self._index += 1
         return item
 
@@ -2167,8 +3180,92 @@ class CiscoConfParse:
            >>>
         """
         if isinstance(key, slice):
-            return self.config_objs.data[key]
-        return self.config_objs.data[key]
+            return self.config_objs._own(self.config_objs.data[key])
+        return self.config_objs[key]
+
+    # This method is on CiscoConfParse()
+    @logger.catch(reraise=True)
+    def undo(self, count: int = 1) -> int:
+        """
+        Undo the last ``count`` configuration edits without reparsing the configuration; see :py:meth:`ConfigList.undo`.
+
+        .. code-block:: python
+
+           >>> from ciscoconfparse2 import CiscoConfParse
+           >>> parse = CiscoConfParse(['interface Ethernet0/0', ' shutdown'])
+           >>> parse.find_objects('shutdown')[0].delete()
+           True
+           >>> parse.undo()
+           1
+           >>> parse.get_text()
+           ['interface Ethernet0/0', ' shutdown']
+           >>> parse.redo()
+           1
+           >>> parse.get_text()
+           ['interface Ethernet0/0']
+           >>>
+
+        :param count: The number of edits to undo, default to 1.
+        :type count: int
+        :return: The number of edits which were undone
+        :rtype: int
+        """
+        return self.config_objs.undo(count)
+
+    # This method is on CiscoConfParse()
+    @logger.catch(reraise=True)
+    def redo(self, count: int = 1) -> int:
+        """
+        Redo the last ``count`` configuration edits undone by :py:meth:`~ciscoconfparse2.CiscoConfParse.undo`; see :py:meth:`ConfigList.redo`.
+
+        :param count: The number of edits to redo, default to 1.
+        :type count: int
+        :return: The number of edits which were redone
+        :rtype: int
+        """
+        return self.config_objs.redo(count)
+
+    # This method is on CiscoConfParse()
+    @logger.catch(reraise=True)
+    def snapshot(self) -> CiscoConfParse:
+        """
+        Return a copy-on-write copy of this configuration; the snapshot does not reparse the configuration.
+
+        The snapshot shares all configuration objects with this CiscoConfParse() instance, until one of them copies a configuration family (a parent and all its children) to modify it.  The snapshot also copies a family the first time it returns an object from that family (i.e. from :py:meth:`~ciscoconfparse2.CiscoConfParse.find_objects`).  Changes to the snapshot are not visible in this instance, and vice versa.
+
+        Changes to the snapshot are not automatically committed; :py:meth:`~ciscoconfparse2.CiscoConfParse.commit` reparses (and copies) the whole snapshot.
+
+        The snapshot of a ``read_only=True`` configuration is writable, so it can be used for what-if edits of a shared read-only configuration.
+
+        .. code-block:: python
+
+           >>> from ciscoconfparse2 import CiscoConfParse
+           >>> config = [
+           ...     'interface Ethernet0/0',
+           ...     ' ip address 192.0.2.1 255.255.255.0',
+           ...     'interface Ethernet0/1',
+           ...     ' shutdown',
+           ...     ]
+           >>> parse = CiscoConfParse(config=config)
+           >>> what_if = parse.snapshot()
+           >>> what_if.find_objects('shutdown')[0].delete()
+           True
+           >>> what_if.get_text()
+           ['interface Ethernet0/0', ' ip address 192.0.2.1 255.255.255.0', 'interface Ethernet0/1']
+           >>> parse.get_text()
+           ['interface Ethernet0/0', ' ip address 192.0.2.1 255.255.255.0', 'interface Ethernet0/1', ' shutdown']
+           >>>
+
+        :return: A new writable CiscoConfParse() instance with ``auto_commit=False``
+        :rtype: CiscoConfParse
+        """
+        snap = self.__class__.__new__(self.__class__)
+        snap.__dict__.update(self.__dict__)
+        snap.auto_commit = False
+        snap.read_only = False
+        snap._index = 0
+        snap.config_objs = self.config_objs.snapshot(ccp_ref=snap)
+        return snap
 
     # This method is on CiscoConfParse()
     @logger.catch(reraise=True)
@@ -2209,24 +3306,20 @@ class CiscoConfParse:
     @logger.catch(reraise=True)
     def insert(self, idx: int, line: str | BaseCfgLine = None) -> None:
 
-        last_index = self.config_objs[-1].linenum
-
         if int(idx) == -1:
             self.append(line)
             return
 
         if idx < -1:
-            self.insert(last_index + (idx + 2), line)
+            self.insert(len(self.config_objs.data) + idx + 1, line)
             return
 
-        obj = None
-        for obj in self.objs:
-            if obj.linenum == int(idx):
-                obj.insert_before(line)
-                return
+        if isinstance(line, BaseCfgLine):
+            line = line.text
 
-        # Default to inserting after the last object...
-        obj.insert_after(line)
+        # Line numbers are list indexes; default to inserting after the
+        #     last object...
+        self.config_objs.insert(int(idx), line)
 
         return
 
@@ -2546,7 +3639,7 @@ class CiscoConfParse:
 
            The original ciscoconfparse ``ioscfg`@property has been renamed to ``get_text()``.
         """
-        return [ii.text for ii in self.config_objs]
+        return [ii.text for ii in self.config_objs.data]
 
     # This method is on CiscoConfParse()
     @property
@@ -2583,7 +3676,33 @@ class CiscoConfParse:
         """
 
         # perform a commit on the ConfigList()
-        self.config_objs.commit()
+        if self.profile:
+            start = time.perf_counter()
+            self.config_objs.commit()
+            self._record_profile_phase("commit", start, len(self.config_objs.data))
+        else:
+            self.config_objs.commit()
+
+    # This method is on CiscoConfParse()
+    def _record_profile_phase(self, phase: str, start: float, objects: int) -> None:
+        """
+        Add the wall time since ``start`` and the ``objects`` count of a parse ``phase`` to ``profile_stats``, and call the ``profile`` callback if there is one.
+
+        :param phase: The name of the parse phase
+        :type phase: str
+        :param start: The ``time.perf_counter()`` value when the phase started
+        :type start: float
+        :param objects: The number of lines or objects the phase handled
+        :type objects: int
+        :rtype: None
+        """
+        seconds = time.perf_counter() - start
+        stats = self.profile_stats.setdefault(phase, {"calls": 0, "seconds": 0.0, "objects": 0})
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+        stats["objects"] += objects
+        if callable(self.profile):
+            self.profile(phase, seconds, objects)
 
     # This method is on CiscoConfParse()
     #
@@ -2955,9 +4074,10 @@ debug={debug},
             retval = self._find_line_OBJ(linespec, exactmatch)
         elif isinstance(linespec, BaseCfgLine):
             retval = []
-            for obj in self.objs:
+            for obj in self.objs.data:
                 if obj == linespec:
                     retval.append(obj)
+            retval = self.objs._own(retval)
         else:
             error = f"linespec must be a string, re.Pattern, or BaseCfgLine instance; we got {type(linespec)}."
             logger.critical(error)
@@ -3571,7 +4691,7 @@ debug={debug},
         ##   this while I build the API
         #    raise NotImplementedError
 
-        for cobj in self.config_objs:
+        for cobj in self.config_objs.data:
             # Only process parent objects at the root of the tree...
             if cobj.parent is not cobj:
                 continue
@@ -3586,19 +4706,384 @@ debug={debug},
 
     # This method is on CiscoConfParse()
     @logger.catch(reraise=True)
-    def save_as(self, filepath):
+    def interface_facts(self) -> list[dict[str, Any]]:
+        r"""
+        Read the :py:meth:`~ciscoconfparse2.models_base.BaseFactoryInterfaceLine.facts` of every interface in the configuration; each interface family is walked once.  The configuration does not have to be parsed with ``factory=True``.
+
+        :return: A list of facts dicts, one per interface, in configuration order
+        :rtype: List[Dict[str,Any]]
+
+        .. code-block:: python
+
+           >>> from ciscoconfparse2 import CiscoConfParse
+           >>> config = [
+           ...     'interface GigabitEthernet1/1',
+           ...     ' shutdown',
+           ...     'interface GigabitEthernet1/2',
+           ...     ' switchport access vlan 10',
+           ...     ]
+           >>> parse = CiscoConfParse(config)
+           >>> [(facts["name"], facts["is_shutdown"], facts["access_vlan"]) for facts in parse.interface_facts()]
+           [('GigabitEthernet1/1', True, -1), ('GigabitEthernet1/2', False, 10)]
+           >>>
+        """
+        if self.syntax not in {"ios", "nxos", "iosxr"}:
+            error = f"interface_facts() does not support syntax='{self.syntax}'"
+            logger.error(error)
+            raise NotImplementedError(error)
+
+        retval = []
+        intf_class = {"ios": IOSIntfLine, "nxos": NXOSIntfLine, "iosxr": IOSXRIntfLine}[self.syntax]
+        for obj in self.find_objects(r"^interface\s"):
+            if not isinstance(obj, BaseFactoryInterfaceLine):
+                # factory=False parses interfaces as plain config lines;
+                #     read them through a detached interface object which
+                #     shares the text and children of obj
+                obj = intf_class(line=obj.text, children=list(obj.children), linenum=obj.linenum, confobj=obj.confobj)
+            retval.append(obj.facts())
+        return retval
+
+    # This method is on CiscoConfParse()
+    @logger.catch(reraise=True)
+    def interface_columns(self, columns: Sequence[str] | None = None, numpy: bool = False) -> dict[str, Any]:
+        r"""
+        Read interface attributes into columns instead of rows; each column is an ``array.array`` (a list for ``name``), so the columns of many configurations can be joined with :func:`~ciscoconfparse2.ccp_util.concat_interface_columns` without building an object per interface.
+
+        The columns are listed in :py:data:`~ciscoconfparse2.ccp_util.INTERFACE_COLUMNS`:
+
+        - ``name``: The interface name
+        - ``slot``, ``card``, ``port``, ``subinterface``: The interface number ordinals, or -1 if the interface does not have a numeric ordinal
+        - ``ipv4``: The primary IPv4 address as an unsigned 32-bit integer, or 0
+        - ``prefixlen``: The primary IPv4 prefix length, or -1
+        - ``vlan``: The switchport access vlan, or -1
+        - ``mtu``: The configured mtu, or -1
+        - ``shutdown``: 1 if the interface is shutdown, otherwise 0
+
+        The configuration does not have to be parsed with ``factory=True``; the values are the same as the interface properties of ``factory=True`` interface objects.
+
+        :param columns: The names of the columns to read, default all columns
+        :type columns: Sequence[str]
+        :param numpy: Set True to return numpy arrays instead; numpy must be installed.  The integer arrays share memory with the ``array.array`` columns, and ``shutdown`` is a bool array.
+        :type numpy: bool
+        :return: A dict of columns, keyed by column name, with one value per interface in configuration order
+        :rtype: Dict[str,Any]
+
+        .. code-block:: python
+
+           >>> from ciscoconfparse2 import CiscoConfParse
+           >>> config = [
+           ...     'interface GigabitEthernet1/0/1',
+           ...     ' ip address 192.0.2.1 255.255.255.0',
+           ...     ' mtu 9000',
+           ...     'interface GigabitEthernet1/0/2',
+           ...     ' switchport access vlan 10',
+           ...     ' shutdown',
+           ...     ]
+           >>> parse = CiscoConfParse(config)
+           >>> columns = parse.interface_columns(columns=['name', 'port', 'ipv4', 'vlan', 'shutdown'])
+           >>> columns['name'], columns['port'], columns['vlan'], columns['shutdown']
+           (['GigabitEthernet1/0/1', 'GigabitEthernet1/0/2'], array('i', [1, 2]), array('h', [-1, 10]), array('B', [0, 1]))
+           >>> columns['ipv4']
+           array('I', [3221225985, 0])
+           >>>
+        """
+        if self.syntax not in {"ios", "nxos", "iosxr"}:
+            error = f"interface_columns() does not support syntax='{self.syntax}'"
+            logger.error(error)
+            raise NotImplementedError(error)
+
+        retval = new_interface_columns(tuple(INTERFACE_COLUMNS) if columns is None else columns)
+
+        def ordinal(value):
+            # IOS-XR interface ordinals are strings, such as 'RP0'
+            if isinstance(value, str):
+                return int(value) if value.isdigit() else -1
+            return -1 if value is None else value
+
+        def ipv4(obj):
+            addr_obj = obj.ipv4_addr_object
+            return 0 if addr_obj.empty else addr_obj.as_int
+
+        getters = {
+            "name": attrgetter("name"),
+            "slot": lambda obj: ordinal(obj.cisco_interface_object.slot),
+            "card": lambda obj: ordinal(obj.cisco_interface_object.card),
+            "port": lambda obj: ordinal(obj.cisco_interface_object.port),
+            "subinterface": lambda obj: ordinal(obj.cisco_interface_object.subinterface),
+            "ipv4": ipv4,
+            "prefixlen": attrgetter("ipv4_masklength"),
+            "vlan": attrgetter("access_vlan"),
+            "mtu": attrgetter("manual_mtu"),
+            "shutdown": attrgetter("is_shutdown"),
+        }
+        appenders = [(values.append, getters[column]) for column, values in retval.items()]
+        intf_class = {"ios": IOSIntfLine, "nxos": NXOSIntfLine, "iosxr": IOSXRIntfLine}[self.syntax]
+
+        for obj in self.find_objects(r"^interface\s"):
+            if not isinstance(obj, BaseFactoryInterfaceLine):
+                # factory=False parses interfaces as plain config lines;
+                #     read them through a detached interface object which
+                #     shares the text and children of obj
+                obj = intf_class(line=obj.text, children=list(obj.children), linenum=obj.linenum, confobj=obj.confobj)
+            # Index the interface children once, as facts() does
+            with obj._keyword_index_scope():
+                for append, getter in appenders:
+                    append(getter(obj))
+
+        if numpy is True:
+            try:
+                import numpy as np
+            except ImportError:
+                error = "interface_columns(numpy=True) requires numpy; install it with `pip install numpy`"
+                logger.error(error)
+                raise RequirementFailure(error) from None
+            for column, values in retval.items():
+                if isinstance(values, list):
+                    retval[column] = np.asarray(values, dtype=str)
+                elif column == "shutdown":
+                    retval[column] = np.frombuffer(values, dtype=np.uint8).view(np.bool_)
+                else:
+                    retval[column] = np.frombuffer(values, dtype=values.typecode)
+        return retval
+
+    # This method is on CiscoConfParse()
+    @logger.catch(reraise=True)
+    def fhrp_groups(self) -> list[FHRPGroup]:
+        r"""
+        Walk each interface once and return an :class:`~ciscoconfparse2.models_cisco.FHRPGroup` record for every HSRP, VRRP and GLBP group, with its addresses, priority, preempt, timers, authentication and tracking.  CiscoConfParse(factory=True) is not required.
+
+        :return: The FHRPGroup() records, in interface order
+        :rtype: List[FHRPGroup]
+
+        .. code-block:: python
+
+           >>> from ciscoconfparse2 import CiscoConfParse
+           >>> config = [
+           ...     'interface Vlan10',
+           ...     ' ip address 192.0.2.2 255.255.255.0',
+           ...     ' standby 10 ip 192.0.2.1',
+           ...     ' standby 10 priority 110',
+           ...     ' standby 10 track 5 decrement 20',
+           ...     ' vrrp 20 ip 192.0.2.254',
+           ...     ]
+           >>> parse = CiscoConfParse(config)
+           >>> [(grp.protocol, grp.group, grp.ipv4, grp.priority, grp.preempt, grp.tracking) for grp in parse.fhrp_groups()]
+           [('hsrp', 10, '192.0.2.1', 110, False, (('5', 20),)), ('vrrp', 20, '192.0.2.254', 100, True, ())]
+           >>>
+        """
+        retval = []
+        for obj in self.find_objects(r"^interface\s"):
+            retval.extend(FHRPGroup.from_interface(obj))
+        return retval
+
+    # This method is on CiscoConfParse()
+    @logger.catch(reraise=True)
+    def route_table(self, vrf: str | None = None) -> RouteTable:
+        r"""
+        Parse every static route in the configuration in one pass and return the :class:`~ciscoconfparse2.ccp_util.RouteTable` of ``vrf``.  The tables of all VRFs are cached until the configuration changes.
+
+        IOS, NXOS and ASA style ``ip route`` / ``ipv6 route`` lines (including ``vrf context`` children), ASA ``route`` lines, IOS-XR ``router static`` and Junos ``routing-options static`` are supported.
+
+        :param vrf: The VRF name; None or '' is the global table.
+        :type vrf: str
+        :return: The static routes of ``vrf``; the table is empty if ``vrf`` has no static routes.
+        :rtype: RouteTable
+
+        .. code-block:: python
+
+           >>> from ciscoconfparse2 import CiscoConfParse
+           >>> config = [
+           ...     'ip route 0.0.0.0 0.0.0.0 192.0.2.1',
+           ...     'ip route 0.0.0.0 0.0.0.0 192.0.2.9 250',
+           ...     'ip route vrf RED 10.0.0.0 255.0.0.0 Null0',
+           ...     ]
+           >>> parse = CiscoConfParse(config)
+           >>> [(route.next_hop_addr, route.admin_distance) for route in parse.route_table().lookup('198.51.100.1')]
+           [('192.0.2.1', 1), ('192.0.2.9', 250)]
+           >>> parse.route_table(vrf='RED').lookup('10.1.1.1')[0].next_hop_interface
+           'Null0'
+           >>>
+        """
+        counters = (self.config_objs.mutation_counter, self.config_objs.text_mutation_counter)
+        if self._route_tables is None or self._route_tables[0] != counters:
+            self._route_tables = (counters, self._build_route_tables())
+
+        vrf = vrf or ""
+        tables = self._route_tables[1]
+        if vrf not in tables:
+            return RouteTable(vrf=vrf)
+        return tables[vrf]
+
+    # This method is on CiscoConfParse()
+    def _build_route_tables(self) -> dict[str, RouteTable]:
+        """Walk the configuration once and return a RouteTable() for each VRF with static routes"""
+        tables = {}
+
+        def add_route(words, vrf, obj, interface_first=False):
+            route = StaticRoute.from_words(words, vrf=vrf, linenum=obj.linenum, interface_first=interface_first)
+            if route is None:
+                return
+            if vrf not in tables:
+                tables[vrf] = RouteTable(vrf=vrf)
+            tables[vrf].add(route)
+
+        def add_routes_in(static_obj, vrf):
+            # IOS-XR address-family children or Junos static route lines;
+            #     a Junos route with braces has its next-hop as a child
+            for obj in static_obj.children:
+                words = obj.words
+                if self.syntax != "junos":
+                    add_route(words, vrf, obj)
+                elif words[0:1] == ("route",):
+                    words = list(words)
+                    for child in obj.all_children:
+                        words.extend(child.words)
+                    add_route(words[1:], vrf, obj)
+
+        def add_junos_routing_options(options_obj, vrf):
+            for obj in options_obj.children:
+                words = obj.words
+                if words[0:1] == ("static",):
+                    add_routes_in(obj, vrf)
+                elif words[0:1] == ("rib",):
+                    for rib_obj in obj.children:
+                        if rib_obj.words[0:1] == ("static",):
+                            add_routes_in(rib_obj, vrf)
+
+        for obj in self.config_objs.data:
+            words = obj.words
+            if len(words) < 2:
+                continue
+
+            if words[1] == "route" and (words[0] == "ip" or words[0] == "ipv6") and len(words) > 2:
+                vrf = ""
+                if words[2] == "vrf":
+                    if len(words) <= 3:
+                        # A truncated 'ip route vrf' line
+                        continue
+                    vrf = words[3]
+                    words = words[4:]
+                else:
+                    words = words[2:]
+                parent = obj.parent
+                if parent is not obj and parent.text[0:12] == "vrf context ":
+                    vrf = parent.words[2]
+                add_route(words, vrf, obj, interface_first=(self.syntax == "asa"))
+
+            elif self.syntax == "asa" and words[0] == "route" and obj.indent == 0:
+                add_route(words[1:], "", obj, interface_first=True)
+
+            elif self.syntax == "iosxr" and obj.text == "router static":
+                for child in obj.children:
+                    child_words = child.words
+                    if child_words[0:1] == ("address-family",):
+                        add_routes_in(child, "")
+                    elif child_words[0:1] == ("vrf",):
+                        for vrf_child in child.children:
+                            if vrf_child.words[0:1] == ("address-family",):
+                                add_routes_in(vrf_child, child_words[1])
+
+        if self.syntax == "junos":
+            for obj in self.find_objects(r"^routing-options$"):
+                add_junos_routing_options(obj, "")
+            for obj in self.find_objects(r"^routing-instances$"):
+                for instance_obj in obj.children:
+                    for options_obj in instance_obj.children:
+                        if options_obj.text.strip() == "routing-options":
+                            add_junos_routing_options(options_obj, instance_obj.text.strip())
+
+        return tables
+
+    # This method is on CiscoConfParse()
+    @logger.catch(reraise=True)
+    def save_as(self, filepath, compress: bool | None = None, fsync: str = "file"):
         """Save a text copy of the configuration at ``filepath``; this
         method uses the OperatingSystem's native line separators (such as
-        ``\\r\\n`` in Windows)."""
+        ``\\r\\n`` in Windows).
+
+        The configuration is written to a temporary file in the same directory, which replaces ``filepath`` after it is completely written; ``filepath`` is never left partially written.
+
+        :param filepath: The path of the saved configuration
+        :type filepath: Union[str,Path]
+        :param compress: Whether to gzip the saved configuration; default to True if ``filepath`` ends with '.gz'.
+        :type compress: Union[bool,None]
+        :param fsync: When to call ``os.fsync()``; 'none', 'file' (before replacing ``filepath``, the default), or 'directory' (also fsync the directory after replacing ``filepath``).
+        :type fsync: str
+        :return: True
+        :rtype: bool
+        """
+        if fsync not in {"none", "file", "directory"}:
+            error = f"save_as() fsync must be 'none', 'file', or 'directory', not {fsync!r}"
+            logger.error(error)
+            raise ValueError(error)
+
+        path = Path(filepath)
+        if compress is None:
+            compress = path.suffix == ".gz"
+
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{random.randrange(2**32):08x}.tmp")
         try:
-            with Path(filepath).open("w", encoding=self.encoding) as newconf:
-                for line in self.get_text():
-                    newconf.write(line + "\n")
+            with tmp_path.open("xb") as rawfile:
+                if compress is True:
+                    with gzip.GzipFile(filename=path.stem, mode="wb", fileobj=rawfile) as gzfile:
+                        self._write_encoded(gzfile)
+                else:
+                    self._write_encoded(rawfile)
+
+                rawfile.flush()
+                if fsync != "none":
+                    os.fsync(rawfile.fileno())
+
+            if path.exists():
+                # Keep the permissions of the file being replaced
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+
+            if fsync == "directory" and hasattr(os, "O_DIRECTORY"):
+                dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
             return True
+
         except BaseException as ee:
+            tmp_path.unlink(missing_ok=True)
             logger.error(str(ee))
             raise ee
 
+    # This method is on CiscoConfParse()
+    @logger.catch(reraise=True)
+    def _write_encoded(self, binaryfile) -> int:
+        """
+        Write the configuration to the binary file object ``binaryfile``, encoded with ``encoding`` and the OperatingSystem's native line separators.
+
+        :return: The number of lines written
+        :rtype: int
+        """
+        textfile = io.TextIOWrapper(binaryfile, encoding=self.encoding)
+        try:
+            return self.write_to(textfile)
+        finally:
+            textfile.flush()
+            # Do not let the TextIOWrapper() close binaryfile
+            textfile.detach()
+
+    # This method is on CiscoConfParse()
+    @logger.catch(reraise=True)
+    def write_to(self, stream) -> int:
+        """
+        Write the configuration to the text ``stream`` (such as ``sys.stdout`` or an open file) one line at a time; unlike :py:meth:`~ciscoconfparse2.CiscoConfParse.get_text`, this does not build a list of all configuration lines.
+
+        :param stream: A text stream with a ``writelines()`` method
+        :type stream: io.TextIOBase
+        :return: The number of lines written
+        :rtype: int
+        """
+        data = self.config_objs.data
+        stream.writelines(obj.text + "\n" for obj in data)
+        return len(data)
+
     ### The methods below are marked SEMI-PRIVATE because they return an object
     ###  or iterable of objects instead of the configuration text itself.
 
@@ -3623,8 +5108,8 @@ debug={debug},
             # Return objects whose text attribute matches linespec exactly
             linespec_re = re.compile(rf"^{linespec}$")
 
-        return list(
-            filter(lambda obj: linespec_re.search(obj.text), self.config_objs),
+        return self.config_objs._own(
+            list(filter(lambda obj: linespec_re.search(obj.text), self.config_objs.data)),
         )
 
     # This method is on CiscoConfParse()
@@ -3663,6 +5148,160 @@ debug={debug},
         return sorted(retval)
 
 
+@attrs.define(repr=False, slots=False)
+class ConfigBuilder:
+    """Build a configuration from text lines and blocks; :py:meth:`ConfigBuilder.build` parses the whole configuration once."""
+
+    syntax: str = "ios"
+    indent_width: int = 1
+    text_lines: list[str] | None = None
+
+    # This method is on ConfigBuilder()
+    @logger.catch(reraise=True)
+    @typechecked
+    def __init__(self, syntax: str = "ios", indent_width: int = 1):
+        """
+        Initialize the ConfigBuilder().
+
+        .. code-block:: python
+
+           >>> from ciscoconfparse2 import ConfigBuilder
+           >>> builder = ConfigBuilder(syntax="ios")
+           >>> builder.line("hostname Router1")
+           <ConfigBuilder: 1 lines / syntax: ios>
+           >>> builder.block("interface Ethernet0/0", ["ip address 192.0.2.1 255.255.255.0", "no shutdown"])
+           <ConfigBuilder: 4 lines / syntax: ios>
+           >>> parse = builder.build()
+           >>> parse.get_text()
+           ['hostname Router1', 'interface Ethernet0/0', ' ip address 192.0.2.1 255.255.255.0', ' no shutdown']
+           >>>
+
+        :param syntax: A valid configuration syntax, default to 'ios'.  Brace syntax (i.e. 'junos') is not supported.
+        :type syntax: str
+        :param indent_width: The number of spaces to indent each level of block children, default to 1.
+        :type indent_width: int
+        :return: A :py:class:`ConfigBuilder` instance.
+        :rtype: :py:class:`ConfigBuilder`
+        """
+        if syntax not in ALL_VALID_SYNTAX:
+            error = f"'{syntax}' is an unknown syntax"
+            logger.critical(error)
+            raise ValueError(error)
+
+        if syntax in ALL_BRACE_SYNTAX:
+            error = f"ConfigBuilder() does not support syntax='{syntax}'"
+            logger.error(error)
+            raise NotImplementedError(error)
+
+        if indent_width < 1:
+            error = f"ConfigBuilder() indent_width must be at least 1, not {indent_width}"
+            logger.error(error)
+            raise ValueError(error)
+
+        self.syntax = syntax
+        self.indent_width = indent_width
+        self.text_lines = []
+
+    # This method is on ConfigBuilder()
+    def __repr__(self) -> str:
+        return f"<ConfigBuilder: {len(self.text_lines)} lines / syntax: {self.syntax}>"
+
+    # This method is on ConfigBuilder()
+    def __len__(self) -> int:
+        return len(self.text_lines)
+
+    # This method is on ConfigBuilder()
+    @logger.catch(reraise=True)
+    def line(self, text: str) -> ConfigBuilder:
+        """
+        Append ``text`` (as-is, including any leading spaces) to the configuration.
+
+        :param text: A configuration line
+        :type text: str
+        :return: This ConfigBuilder() instance
+        :rtype: ConfigBuilder
+        """
+        if not isinstance(text, str):
+            error = f"ConfigBuilder().line() requires a str, not {type(text)}"
+            logger.error(error)
+            raise InvalidParameters(error)
+
+        self.text_lines.append(text)
+        return self
+
+    # This method is on ConfigBuilder()
+    @logger.catch(reraise=True)
+    def block(self, parent: str, children: Sequence[str | tuple] = (), indent: int = 0) -> ConfigBuilder:
+        """
+        Append ``parent`` and its ``children`` to the configuration.  Each child is a str or a nested ``(parent, children)`` tuple; children are indented ``indent_width`` spaces more than their parent.
+
+        .. code-block:: python
+
+           >>> from ciscoconfparse2 import ConfigBuilder
+           >>> builder = ConfigBuilder()
+           >>> builder.block("router bgp 65000", [
+           ...     "bgp router-id 192.0.2.1",
+           ...     ("address-family ipv4", ["network 192.0.2.0 mask 255.255.255.0"]),
+           ... ])
+           <ConfigBuilder: 4 lines / syntax: ios>
+           >>> builder.text_lines
+           ['router bgp 65000', ' bgp router-id 192.0.2.1', ' address-family ipv4', '  network 192.0.2.0 mask 255.255.255.0']
+           >>>
+
+        :param parent: The parent configuration line; leading spaces are replaced by ``indent``
+        :type parent: str
+        :param children: The child configuration lines; leading spaces are replaced by the child indent
+        :type children: Sequence[Union[str,tuple]]
+        :param indent: The number of spaces to indent ``parent``, default to 0.
+        :type indent: int
+        :return: This ConfigBuilder() instance
+        :rtype: ConfigBuilder
+        """
+        # Render the whole block before appending it, so an invalid child
+        #     does not leave a partial block behind
+        self.text_lines.extend(self._render_block(parent, children, indent, []))
+        return self
+
+    # This method is on ConfigBuilder()
+    @logger.catch(reraise=True)
+    def _render_block(self, parent: str, children: Sequence[str | tuple], indent: int, retval: list[str]) -> list[str]:
+        """
+        :return: ``retval``, with the text lines of ``parent`` and ``children`` appended
+        :rtype: List[str]
+        """
+        if not isinstance(parent, str):
+            error = f"ConfigBuilder().block() parent must be a str, not {type(parent)}"
+            logger.error(error)
+            raise InvalidParameters(error)
+
+        retval.append(" " * indent + parent.lstrip())
+
+        child_indent = indent + self.indent_width
+        for child in children:
+            if isinstance(child, str):
+                retval.append(" " * child_indent + child.lstrip())
+            elif isinstance(child, (tuple, list)) and len(child) == 2:
+                self._render_block(child[0], child[1], child_indent, retval)
+            else:
+                error = f"ConfigBuilder().block() children must be a str or a (parent, children) tuple, not {child!r}"
+                logger.error(error)
+                raise InvalidParameters(error)
+
+        return retval
+
+    # This method is on ConfigBuilder()
+    @logger.catch(reraise=True)
+    def build(self, **kwargs) -> CiscoConfParse:
+        """
+        Parse the configuration with a single :py:meth:`ConfigList.bootstrap`.
+
+        :param kwargs: Keyword arguments for :py:class:`CiscoConfParse`, other than ``config`` and ``syntax``
+        :return: The parsed configuration
+        :rtype: CiscoConfParse
+        """
+        return CiscoConfParse(config=list(self.text_lines), syntax=self.syntax, **kwargs)
+
+
 class Branch(UserList):
     """A Branch object for CiscoConfParse().find_object_branches()"""
 
@@ -4112,7 +5751,7 @@ class CiscoPassword(HasTraits):
 
 @logger.catch(reraise=True)
 def config_line_factory(
-    all_lines: list[str] | list[BaseCfgLine] | None = None,
+    all_lines: Sequence[str] | None = None,
     line: str | BaseCfgLine | None = None,
     index: int | None = None,
     comment_delimiters: list[str] | None = None,
@@ -4121,8 +5760,8 @@ def config_line_factory(
 ) -> BaseCfgLine:
     """A factory method to assign a custom BaseCfgLine() subclass.
 
-    :param all_lines: Sequence of string configuration commands
-    :type all_lines: List[str]
+    :param all_lines: Sequence of string configuration commands, such as a list or a :py:class:`~ciscoconfparse2.ccp_abc.ConfigLinesView`; it is only passed to ``is_object_for()``
+    :type all_lines: Sequence[str]
     :param line: Configuration command string
     :type line: str
     :param index: Index of the configuration command string (useful if the command is duplicated elsewhere)
@@ -4147,8 +5786,8 @@ def config_line_factory(
             logger.critical(error)
             raise NotImplementedError(error)
 
-    if not isinstance(all_lines, list):
-        error = f"config_line_factory(all_lines=`{all_lines}`) must be a list, but we got {type(all_lines)}"
+    if not isinstance(all_lines, Sequence) or isinstance(all_lines, str):
+        error = f"config_line_factory(all_lines=`{all_lines}`) must be a Sequence, but we got {type(all_lines)}"
         logger.error(error)
         raise InvalidParameters(error)
 
@@ -4197,11 +5836,24 @@ def config_line_factory(
         raise InvalidParameters(error)
 
     ##########################################################################
-    # Walk all the classes and return the first class that
+    # Split the line once, and only consider the factory classes which
+    # FACTORY_DISPATCH maps to the first word of the line
+    ##########################################################################
+    dispatch, keyword_lengths, candidate_classes = FACTORY_DISPATCH[syntax]
+    words = line.split(None, 1)
+    first_word = words[0].lower() if len(words) > 0 else ""
+    matches = [dispatch[first_word[:ii]] for ii in keyword_lengths if ii <= len(first_word) and first_word[:ii] in dispatch]
+    if len(matches) == 1:
+        candidate_classes = matches[0]
+    elif len(matches) > 1:
+        candidate_classes = tuple(_cls for _cls in factory_classes if any(_cls in ii for ii in matches))
+
+    ##########################################################################
+    # Walk the candidate classes and return the first class that
     # matches `.is_object_for(text)`.
     ##########################################################################
     try:
-        for _cls in factory_classes:
+        for _cls in candidate_classes:
             if debug > 0:
                 logger.debug(f"Consider config_line_factory() CLASS {_cls}")
             if _cls.is_object_for(all_lines=all_lines, line=line, index=index):
@@ -4212,6 +5864,13 @@ def config_line_factory(
                 )  # instance of the proper subclass
                 return basecfgline_subclass
 
+        # The last factory class matches every line without its keywords
+        if factory_classes[-1] not in candidate_classes:
+            return factory_classes[-1](
+                all_lines=all_lines,
+                line=line,
+            )
+
     except ValueError:
         error = f"ciscoconfparse2.py config_line_factory(all_lines={all_lines}, line=`{line}`, comment_delimiters=[`{comment_delimiters}`], syntax=`{syntax}`) could not find a subclass of BaseCfgLine()"
         logger.error(error)
@@ -13,7 +13,7 @@ from loguru import logger
 from rich.console import Console as RichConsole
 from typeguard import typechecked
 
-from ciscoconfparse2.ccp_util import EUI64Obj, IPv4Obj, IPv6Obj, MACObj
+from ciscoconfparse2.ccp_util import EUI64Obj, IPPrefixTrie, IPv4Obj, IPv6Obj, MACObj
 from ciscoconfparse2.ciscoconfparse2 import CiscoConfParse, Diff
 
 
@@ -745,11 +745,34 @@ class CliApplication:
         logger.critical(error)
         raise ValueError(error)
 
+    @logger.catch(reraise=True)
+    @typechecked
+    def find_ip46_subnet_match(
+        self,
+        word: str,
+        subnets: IPPrefixTrie,
+        versions: list[int],
+    ) -> IPv4Obj | IPv6Obj | None:
+        """Return the IPv4Obj / IPv6Obj of word if it is inside one of the subnets, or None"""
+        for version in versions:
+            try:
+                if version == 4:
+                    addr = IPv4Obj(word)
+                else:
+                    addr = IPv6Obj(word)
+            except Exception:
+                # We didn't get a proper address... try the next version
+                continue
+
+            if addr in subnets:
+                return addr
+        return None
+
     @logger.catch(reraise=True)
     @typechecked
     def find_ip46_addr_matches(
         self,
-        subnets: set[IPv4Obj | IPv6Obj],
+        subnets: set[IPv4Obj | IPv6Obj] | IPPrefixTrie,
         potential_matches: list[str],
         unique_matches: bool,
     ) -> list:
@@ -757,56 +780,53 @@ class CliApplication:
 
         retval = []
 
+        if not isinstance(subnets, IPPrefixTrie):
+            subnets = IPPrefixTrie(subnets)
+        versions = sorted({subnet.version for subnet in subnets})
+
         for tmp in potential_matches:
-            for subnet in subnets:
-                try:
-                    if subnet.version == 4:
-                        addr = IPv4Obj(tmp)
-                    else:
-                        addr = IPv6Obj(tmp)
-                except Exception:
-                    # We didn't get a proper address... bail on this iteration
+            addr = self.find_ip46_subnet_match(tmp, subnets=subnets, versions=versions)
+            if addr is None:
+                # Not an address, or not in any of the subnets
+                continue
+
+            if unique_matches:
+                append_addr = False
+
+                if self.show_cidr is False:
+                    if (self.show_networks is False and str(addr.ip) not in retval) or (self.show_networks is True and str(addr.as_cidr_net) not in retval):
+                        append_addr = True
+                else:
+                    if (self.show_networks is False and str(addr.as_cidr_addr) not in retval) or (self.show_networks is True and str(addr.as_cidr_net) not in retval):
+                        append_addr = True
+
+                # Append if not already in retval...
+                if append_addr:
+                    if self.check_ip46_host_exclusion_args(addr):
+                        continue
+                    if self.check_ip46_net_exclusion_args(addr):
+                        continue
+
+                    if self.show_networks:
+                        retval.append(addr.as_cidr_net)
+                    elif not self.show_cidr and not self.show_networks:
+                        retval.append(str(addr.ip))
+                    elif not self.show_networks and self.show_cidr:
+                        retval.append(addr.as_cidr_addr)
+
+            else:
+                if self.check_ip46_net_exclusion_args(addr):
+                    continue
+                if self.check_ip46_host_exclusion_args(addr):
                     continue
 
-                if (addr.version == subnet.version) and (addr in subnet):
-
-                    if unique_matches:
-                        append_addr = False
-
-                        if self.show_cidr is False:
-                            if (self.show_networks is False and str(addr.ip) not in retval) or (self.show_networks is True and str(addr.as_cidr_net) not in retval):
-                                append_addr = True
-                        else:
-                            if (self.show_networks is False and str(addr.as_cidr_addr) not in retval) or (self.show_networks is True and str(addr.as_cidr_net) not in retval):
-                                append_addr = True
-
-                        # Append if not already in retval...
-                        if append_addr:
-                            if self.check_ip46_host_exclusion_args(addr):
-                                continue
-                            if self.check_ip46_net_exclusion_args(addr):
-                                continue
-
-                            if self.show_networks:
-                                retval.append(addr.as_cidr_net)
-                            elif not self.show_cidr and not self.show_networks:
-                                retval.append(str(addr.ip))
-                            elif not self.show_networks and self.show_cidr:
-                                retval.append(addr.as_cidr_addr)
-
-                    else:
-                        if self.check_ip46_net_exclusion_args(addr):
-                            continue
-                        if self.check_ip46_host_exclusion_args(addr):
-                            continue
-
-                        # Append unconditionally...
-                        if self.show_networks:
-                            retval.append(addr.as_cidr_net)
-                        elif not self.show_cidr and not self.show_networks:
-                            retval.append(str(addr.ip))
-                        elif not self.show_networks and self.show_cidr:
-                            retval.append(addr.as_cidr_addr)
+                # Append unconditionally...
+                if self.show_networks:
+                    retval.append(addr.as_cidr_net)
+                elif not self.show_cidr and not self.show_networks:
+                    retval.append(str(addr.ip))
+                elif not self.show_networks and self.show_cidr:
+                    retval.append(addr.as_cidr_addr)
         return retval
 
     @logger.catch(reraise=True)
@@ -858,13 +878,17 @@ class CliApplication:
     @typechecked
     def find_ip46_line_matches(
         self,
-        subnets: set[IPv4Obj | IPv6Obj],
+        subnets: set[IPv4Obj | IPv6Obj] | IPPrefixTrie,
         potential_matches: list[str],
         unique_matches: bool,
     ) -> list:
         """Walk the IPv4 / IPv6 instances in potential_matches, return the list of lines with a word matching subnet"""
         retval = []
 
+        if not isinstance(subnets, IPPrefixTrie):
+            subnets = IPPrefixTrie(subnets)
+        versions = sorted({subnet.version for subnet in subnets})
+
         for line in potential_matches:
             append_line = False
             exclude_line = False
@@ -872,28 +896,21 @@ class CliApplication:
             # Split words on whitespace...
             words = re.split(self.word_delimiter, line)
             for word in words:
-                for subnet in subnets:
-                    try:
-                        if subnet.version == 4:
-                            addr = IPv4Obj(word)
-                        else:
-                            addr = IPv6Obj(word)
-
-                    except Exception:
-                        # We didn't get a proper address... bail on this iteration
-                        continue
+                if exclude_line:
+                    continue
 
-                    if exclude_line:
-                        continue
+                addr = self.find_ip46_subnet_match(word, subnets=subnets, versions=versions)
+                if addr is None:
+                    # Not an address, or not in any of the subnets
+                    continue
 
-                    if (addr.version == subnet.version) and (addr in subnet):
-                        if self.check_ip46_net_exclusion_args(addr) or self.check_ip46_host_exclusion_args(addr):
-                            exclude_line = True
-                            append_line = False
-                        else:
-                            # append the line with the matching text.  This appends on
-                            # the first match and breaks out of the loop
-                            append_line = True
+                if self.check_ip46_net_exclusion_args(addr) or self.check_ip46_host_exclusion_args(addr):
+                    exclude_line = True
+                    append_line = False
+                else:
+                    # append the line with the matching text.  This appends on
+                    # the first match and breaks out of the loop
+                    append_line = True
 
             if append_line:
                 retval.append(line)
@@ -178,6 +178,14 @@ class UntypedError(Exception):
         self.msg = msg
 
 
+class ReadOnlyConfiguration(Exception):
+    """Raise this error if a configuration parsed with read_only=True is modified"""
+
+    def __init__(self, msg=""):
+        super().__init__(msg)
+        self.msg = msg
+
+
 class InvalidPassword(Exception):
     """
     Exception to be thrown if an invalid password is submitted to be hashed.
@@ -34,8 +34,8 @@ from typing import Any
 import attrs
 from loguru import logger
 
-from ciscoconfparse2.ccp_abc import BaseCfgLine
-from ciscoconfparse2.ccp_util import IPv4Obj, IPv6Obj, L4Object
+from ciscoconfparse2.ccp_abc import BaseCfgLine, mutation_cached
+from ciscoconfparse2.ccp_util import IPPrefixTrie, IPv4Obj, IPv6Obj, L4Object
 from ciscoconfparse2.errors import InvalidParameters
 from ciscoconfparse2.protocol_values import ASA_IP_PROTOCOLS
 
@@ -44,7 +44,7 @@ from ciscoconfparse2.protocol_values import ASA_IP_PROTOCOLS
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASACfgLine(BaseCfgLine):
     """An object for a parsed ASA-style configuration line.
     :class:`~models_asa.ASACfgLine` objects contain references to other
@@ -79,22 +79,6 @@ class ASACfgLine(BaseCfgLine):
         # self.text = kwargs.get("line", None)
         self._mm_results = None
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        if other is None:
-            return False
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        if other is None:
-            return True
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -155,18 +139,6 @@ class BaseASAIntfLine(ASACfgLine):
         self.ifindex = None  # Optional, for user use
         self.default_ipv4_addr_object = IPv4Obj()
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @logger.catch(reraise=True)
     def __repr__(self):
         if not self.is_switchport:
@@ -197,7 +169,7 @@ class BaseASAIntfLine(ASACfgLine):
         """Return a string, such as 'GigabitEthernet0/1'"""
         if not self.is_intf:
             return ""
-        return " ".join(self.text.split()[1:])
+        return " ".join(self.words[1:])
 
     @property
     @logger.catch(reraise=True)
@@ -328,8 +300,8 @@ class BaseASAIntfLine(ASACfgLine):
     @logger.catch(reraise=True)
     def ipv6_standby_addr(self):
         for cobj in self.children:
-            cmd_parts = cobj.text.split()
-            if len(cmd_parts) == 5 and cmd_parts[0:2] == ["ipv6", "address"] and cmd_parts[3] == "standby":
+            cmd_parts = cobj.words
+            if len(cmd_parts) == 5 and cmd_parts[0:2] == ("ipv6", "address") and cmd_parts[3] == "standby":
                 return cmd_parts[4]
         return ""
 
@@ -440,9 +412,13 @@ class BaseASAIntfLine(ASACfgLine):
     # This method is on BaseIOSIntfLine()
     @logger.catch(reraise=True)
     def in_ipv4_subnets(self, subnets=None):
-        """Accept a set or list of ccp_util.IPv4Obj objects, and return a boolean for whether this interface is within the requested subnets."""
+        """Accept a set or list of ccp_util.IPv4Obj objects or a ccp_util.IPPrefixTrie, and return a boolean for whether this interface is within the requested subnets."""
         if subnets is None:
             raise ValueError("A python list or set of ccp_util.IPv4Obj objects must be supplied")
+        if isinstance(subnets, IPPrefixTrie):
+            if self.ipv4_addr_object.empty is True:
+                return None
+            return self.ipv4_addr_object in subnets
         for subnet in subnets:
             tmp = self.in_ipv4_subnet(ipv4network=subnet)
             if self.ipv4_addr_object in subnet:
@@ -502,7 +478,7 @@ _RE_NAMEOBJECT_STR = r"^name\s+(?P<addr>\d+\.\d+\.\d+\.\d+)\s(?P<name>\S+)"
 _RE_NAMEOBJECT = re.compile(_RE_NAMEOBJECT_STR, re.VERBOSE)
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASAName(ASACfgLine):
     name: str = None
     addr: str = None
@@ -521,18 +497,6 @@ class ASAName(ASACfgLine):
         self.name = self._mm_results["name"]
         self.addr = self._mm_results["addr"]
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -554,7 +518,7 @@ class ASAName(ASACfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASAObjNetwork(ASACfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
@@ -562,18 +526,6 @@ class ASAObjNetwork(ASACfgLine):
         attributes"""
         super().__init__(*args, **kwargs)
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -585,7 +537,7 @@ class ASAObjNetwork(ASACfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASAObjService(ASACfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
@@ -593,18 +545,6 @@ class ASAObjService(ASACfgLine):
         attributes"""
         super().__init__(*args, **kwargs)
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -623,7 +563,7 @@ _RE_NETOBJECT_STR = r"""(?:                         # Non-capturing parenthesis
 _RE_NETOBJECT = re.compile(_RE_NETOBJECT_STR, re.VERBOSE)
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASAObjGroupNetwork(ASACfgLine):
     name: str = None
 
@@ -635,18 +575,6 @@ class ASAObjGroupNetwork(ASACfgLine):
 
         self.name = self.re_match_typed(r"^object-group\s+network\s+(\S+)", group=1, result_type=str)
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -731,6 +659,13 @@ class ASAObjGroupNetwork(ASACfgLine):
 
         return retval
 
+    @property
+    @mutation_cached
+    @logger.catch(reraise=True)
+    def network_trie(self):
+        """Return an IPPrefixTrie() of the networks allowed by this object-group; use it to check many addresses against a large object-group"""
+        return IPPrefixTrie(self.networks)
+
 
 ##
 # -------------  ASA object-group service
@@ -745,7 +680,7 @@ _RE_PORTOBJ_STR = r"""(?:                            # Non-capturing parentesis
 _RE_PORTOBJECT = re.compile(_RE_PORTOBJ_STR, re.VERBOSE)
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASAObjGroupService(ASACfgLine):
     name: str = None
     protocol_type: Any = None
@@ -773,18 +708,6 @@ class ASAObjGroupService(ASACfgLine):
         else:
             self.L4Objects_are_directional = False
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -859,7 +782,7 @@ class ASAObjGroupService(ASACfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASAIntfLine(BaseASAIntfLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
@@ -867,18 +790,6 @@ class ASAIntfLine(BaseASAIntfLine):
         attributes"""
         super().__init__(*args, **kwargs)
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -891,25 +802,13 @@ class ASAIntfLine(BaseASAIntfLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASAIntfGlobal(BaseCfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.feature = "interface global"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @logger.catch(reraise=True)
     def __repr__(self):
         return f"<{self.classname} # {self.linenum} '{self.text}'>"
@@ -925,25 +824,13 @@ class ASAIntfGlobal(BaseCfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASAHostnameLine(BaseCfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.feature = "hostname"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @logger.catch(reraise=True)
     def __repr__(self):
         return f"<{self.classname} # {self.linenum} '{self.hostname}'>"
@@ -970,18 +857,6 @@ class BaseASARouteLine(BaseCfgLine):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @logger.catch(reraise=True)
     def __repr__(self):
         return f"<{self.classname} # {self.linenum} '{self.network}' info: '{self.routeinfo}'>"
@@ -1036,7 +911,7 @@ class BaseASARouteLine(BaseCfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASARouteLine(BaseASARouteLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
@@ -1046,18 +921,6 @@ class ASARouteLine(BaseASARouteLine):
         else:
             self.feature = "ip route"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -1269,7 +1132,7 @@ _RE_ACLOBJECT_STR = rf"""(?:                         # Non-capturing parenthesis
 _RE_ACLOBJECT = re.compile(_RE_ACLOBJECT_STR, re.VERBOSE)
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class ASAAclLine(ASACfgLine):
     _mm_results: dict = None
 
@@ -1295,18 +1158,6 @@ class ASAAclLine(ASACfgLine):
         else:
             raise ValueError(f"[FATAL] ASAAclLine() cannot parse text:'{text}'")
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
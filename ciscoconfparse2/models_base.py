@@ -12,6 +12,7 @@ from ciscoconfparse2.ccp_util import (
     CiscoIOSInterface,
     CiscoIOSXRInterface,
     CiscoRange,
+    CiscoVlanSet,
     IPv4Obj,
     IPv6Obj,
 )
@@ -57,7 +58,7 @@ _VIRTUAL_INTF_REGEX = re.compile(_VIRTUAL_INTF_REGEX_STR, re.I)
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseFactoryLine(BaseCfgLine):
     """A base class for all factory class implementations.
 
@@ -89,22 +90,6 @@ class BaseFactoryLine(BaseCfgLine):
         r"""Accept an IOS line number and initialize family relationship attributes"""
         super().__init__(*args, **kwargs)
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other) -> bool:
-        if other is None:
-            return False
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other) -> bool:
-        if other is None:
-            return True
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self) -> int:
-        return self.get_unique_identifier()
-
     @classmethod
     def from_list(cls, all_lines: list[str], line: str) -> BaseCfgLine:
         """Helper-method to allow strictly positional *arg calls .i.e. IOSCfgLine([], 'hostname Foo')"""
@@ -238,12 +223,68 @@ class BaseFactoryLine(BaseCfgLine):
 #    default -> def
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseFactoryInterfaceLine(BaseFactoryLine):
     ifindex: str = None
     default_ipv4_addr_object: Any = None
     default_ipv6_addr_object: Any = None
 
+    # The interface properties which facts() reads
+    FACTS = (
+        "name",
+        "port_type",
+        "interface_number",
+        "subinterface_number",
+        "is_ethernet_intf",
+        "is_loopback_intf",
+        "is_subintf",
+        "is_virtual_intf",
+        "description",
+        "is_shutdown",
+        "vrf",
+        "ipv4_addr",
+        "ipv4_netmask",
+        "ipv4_masklength",
+        "ipv4_addr_object",
+        "ip_secondary_addresses",
+        "ipv6_addr",
+        "ip_helper_addresses",
+        "ip_accessgroup_in",
+        "ip_accessgroup_out",
+        "ipv6_trafficfilter_in",
+        "ipv6_trafficfilter_out",
+        "manual_bandwidth",
+        "manual_delay",
+        "manual_mtu",
+        "manual_ip_mtu",
+        "manual_ipv6_mtu",
+        "manual_mpls_mtu",
+        "manual_speed",
+        "manual_duplex",
+        "manual_carrierdelay",
+        "manual_clock_rate",
+        "manual_encapsulation",
+        "manual_holdqueue_in",
+        "manual_holdqueue_out",
+        "manual_arp_timeout",
+        "has_mpls",
+        "has_no_icmp_unreachables",
+        "has_no_icmp_redirects",
+        "has_no_ip_proxyarp",
+        "has_ip_pim_dense_mode",
+        "has_ip_pim_sparse_mode",
+        "has_manual_disable_cdp",
+        "is_switchport",
+        "has_manual_switch_access",
+        "has_manual_switch_trunk",
+        "access_vlan",
+        "native_vlan",
+        "trunk_vlans_allowed",
+        "has_ip_hsrp",
+        "hsrp_ip_addr",
+        "hsrp_priority",
+    )
+
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -287,6 +328,32 @@ class BaseFactoryInterfaceLine(BaseFactoryLine):
         """
         raise NotImplementedError()
 
+    # This method is on BaseFactoryInterfaceLine()
+    @logger.catch(reraise=True)
+    def facts(self) -> dict[str, Any]:
+        r"""
+        Read every interface property in ``FACTS`` with one walk of the interface children; the children are indexed once by their first word, and each property only checks the children which start with its keyword.
+
+        :return: A dict of property values, keyed by the property names in ``FACTS``; the values are the same as reading each property.
+        :rtype: Dict[str,Any]
+
+        .. code-block:: python
+
+           >>> from ciscoconfparse2 import CiscoConfParse
+           >>> config = [
+           ...     'interface GigabitEthernet1/1',
+           ...     ' description Uplink',
+           ...     ' ip address 192.0.2.1 255.255.255.0',
+           ...     ]
+           >>> parse = CiscoConfParse(config, factory=True)
+           >>> facts = parse.objs[0].facts()
+           >>> facts["description"], facts["ipv4_addr"], facts["is_shutdown"]
+           ('Uplink', '192.0.2.1', False)
+           >>>
+        """
+        with self._keyword_index_scope():
+            return {name: getattr(self, name) for name in self.FACTS}
+
     # This method is on BaseFactoryInterfaceLine()
     @property
     @logger.catch(reraise=True)
@@ -951,6 +1018,16 @@ class BaseFactoryInterfaceLine(BaseFactoryLine):
         """
         raise NotImplementedError()
 
+    # This method is on BaseFactoryInterfaceLine()
+    @property
+    @logger.catch(reraise=True)
+    def trunk_vlan_set(self) -> CiscoVlanSet:
+        r"""
+        :return: A CiscoVlanSet() bitset of the allowed vlan numbers; it has the same vlans as ``trunk_vlans_allowed``, with O(1) membership and whole-set union / intersection / difference.
+        :rtype: CiscoVlanSet
+        """
+        raise NotImplementedError()
+
     # This method is on BaseFactoryInterfaceLine()
     @property
     @logger.catch(reraise=True)
@@ -1201,7 +1278,7 @@ class BaseFactoryInterfaceLine(BaseFactoryLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSIntfLine(BaseFactoryInterfaceLine):
 
     # This method is on IOSIntfLine()
@@ -1217,21 +1294,6 @@ class IOSIntfLine(BaseFactoryInterfaceLine):
         super().__init__(*args, **kwargs)
         self.feature = "interface"
 
-    # This method is on IOSIntfLine()
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    # This method is on IOSIntfLine()
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    # This method is on IOSIntfLine()
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     # This method is on IOSIntfLine()
     @classmethod
     @logger.catch(reraise=True)
@@ -1244,7 +1306,7 @@ class IOSIntfLine(BaseFactoryInterfaceLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSIntfGlobal(BaseFactoryLine):
     # This method is on IOSIntGlobal()
     @logger.catch(reraise=True)
@@ -1252,21 +1314,6 @@ class IOSIntfGlobal(BaseFactoryLine):
         super(IOSIntfGlobal).__init__(*args, **kwargs)
         self.feature = "interface global"
 
-    # This method is on IOSIntGlobal()
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    # This method is on IOSIntGlobal()
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    # This method is on IOSIntGlobal()
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     # This method is on IOSIntGlobal()
     @classmethod
     @logger.catch(reraise=True)
@@ -1309,7 +1356,7 @@ class IOSIntfGlobal(BaseFactoryLine):
 #
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSAccessLine(BaseFactoryLine):
 
     # This method is on IOSAccessLine()
@@ -1318,21 +1365,6 @@ class IOSAccessLine(BaseFactoryLine):
         super().__init__(*args, **kwargs)
         self.feature = "access line"
 
-    # This method is on IOSAccessLine()
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    # This method is on IOSAccessLine()
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    # This method is on IOSAccessLine()
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     # This method is on IOSAccessLine()
     @logger.catch(reraise=True)
     def __repr__(self):
@@ -1390,7 +1422,7 @@ class IOSAccessLine(BaseFactoryLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseIOSRouteLine(BaseFactoryLine):
     # This method is on BaseIOSRouteLine()
     @logger.catch(reraise=True)
@@ -1508,7 +1540,7 @@ _RE_IPV6_ROUTE = re.compile(
 )
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSRouteLine(BaseFactoryLine):
     _address_family: str = None
     route_info: dict = None
@@ -1519,21 +1551,6 @@ class IOSRouteLine(BaseFactoryLine):
         super().__init__(*args, **kwargs)
         pass
 
-    # This method is on IOSRouteLine()
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    # This method is on IOSRouteLine()
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    # This method is on IOSRouteLine()
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     # This method is on IOSRouteLine()
     @classmethod
     @logger.catch(reraise=True)
@@ -4,7 +4,7 @@ from typing import Any
 import attrs
 from loguru import logger
 
-from ciscoconfparse2.ccp_abc import BaseCfgLine
+from ciscoconfparse2.ccp_abc import BaseCfgLine, mutation_cached
 from ciscoconfparse2.ccp_util import (
     _IPV6_REGEX_STR_COMPRESSED1,
     _IPV6_REGEX_STR_COMPRESSED2,
@@ -12,6 +12,8 @@ from ciscoconfparse2.ccp_util import (
     CiscoIOSInterface,
     CiscoIOSXRInterface,
     CiscoRange,
+    CiscoVlanSet,
+    IPPrefixTrie,
     IPv4Obj,
     IPv6Obj,
 )
@@ -61,7 +63,7 @@ MAX_VLAN = 4094
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class TrackingInterface(BaseCfgLine):
     grp: int = None
     intf: BaseCfgLine = None
@@ -176,7 +178,7 @@ class TrackingInterface(BaseCfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class HSRPInterfaceGroup(BaseCfgLine):
     grp: int = 0
     parent_obj: BaseCfgLine = None
@@ -300,7 +302,7 @@ class HSRPInterfaceGroup(BaseCfgLine):
             error = "HSRPInterfaceGroup() parent interface is None"
             logger.critical(error)
             raise ValueError(error)
-        return " ".join(self.parent.text.strip().split()[1:])
+        return " ".join(self.parent.words[1:])
 
     # This method is on HSRPInterfaceGroup()
     @property
@@ -556,12 +558,211 @@ class HSRPInterfaceGroup(BaseCfgLine):
         pass
 
 
+##
+# -------------  FHRP (HSRP, VRRP, GLBP) group records
+##
+
+# The first word of an interface child which configures a FHRP group
+FHRP_PROTOCOLS = {"standby": "hsrp", "hsrp": "hsrp", "vrrp": "vrrp", "glbp": "glbp"}
+# Defaults for FHRPGroup() values which are not configured
+FHRP_DEFAULTS = {
+    "hsrp": {"version": 1, "priority": 100, "preempt": False, "hello_timer": 3, "hold_timer": 10},
+    "vrrp": {"version": 2, "priority": 100, "preempt": True, "hello_timer": 1, "hold_timer": None},
+    "glbp": {"version": 1, "priority": 100, "preempt": False, "hello_timer": 3, "hold_timer": 10},
+}
+# Interface-wide 'standby' / 'hsrp' keywords, which do not belong to a group
+_FHRP_INTERFACE_KEYWORDS = {"version", "use-bia", "delay", "mac-refresh", "bfd", "redirect"}
+# The default decrement of a tracked interface or object
+_FHRP_TRACK_DECREMENT = 10
+
+
+@attrs.define(frozen=True)
+class FHRPGroup:
+    """A compact, immutable record of one HSRP, VRRP or GLBP group on an interface.
+
+    :py:meth:`~ciscoconfparse2.CiscoConfParse.fhrp_groups` builds these with one walk of each interface; compare them across devices with ``==`` or ``attrs.asdict()``; ``linenum`` is not part of ``==`` or ``hash()``, so the same group on different lines compares equal.  ``tracking`` is a tuple of ``(tracked_interface_or_object, decrement)`` tuples.
+    """
+
+    protocol: str
+    interface_name: str
+    group: int
+    version: int = 1
+    ipv4: str = ""
+    ipv4_secondary: tuple[str, ...] = ()
+    ipv6: tuple[str, ...] = ()
+    priority: int = 100
+    preempt: bool = False
+    preempt_delay: int = 0
+    hello_timer: int | float = 3
+    hold_timer: int | float | None = 10
+    authentication: str = ""
+    use_bia: bool = False
+    name: str = ""
+    tracking: tuple[tuple[str, int | None], ...] = ()
+    linenum: int = attrs.field(default=-1, eq=False)
+
+    # This method is on FHRPGroup()
+    @classmethod
+    @logger.catch(reraise=True)
+    def from_interface(cls, intf_obj: BaseCfgLine) -> list["FHRPGroup"]:
+        """
+        Walk the children of ``intf_obj`` once and build an FHRPGroup() for each HSRP, VRRP and GLBP group.  IOS 'standby 1 ip ...' lines, NXOS 'hsrp 1' / 'vrrp 1' blocks and IOS-XE 'vrrp 1 address-family ipv4' blocks are supported.
+
+        :return: The FHRPGroup() instances, sorted by protocol and group
+        :rtype: List[FHRPGroup]
+        """
+        interface_name = " ".join(intf_obj.words[1:])
+        hsrp_settings = {}
+        groups = {}
+
+        for obj in intf_obj.children:
+            words = list(obj.words)
+            negated = words[0:1] == ["no"]
+            if negated:
+                words = words[1:]
+            if not words or words[0] not in FHRP_PROTOCOLS:
+                continue
+            protocol = FHRP_PROTOCOLS[words[0]]
+
+            if len(words) > 1 and words[1] in _FHRP_INTERFACE_KEYWORDS:
+                # standby version 2 / standby use-bia
+                if not negated:
+                    hsrp_settings[words[1]] = words[2:]
+                continue
+
+            if obj.children:
+                # A nested group block, such as NXOS 'hsrp 10' or IOS-XE
+                #     'vrrp 10 address-family ipv4'; read each child as if
+                #     it was written 'hsrp 10 <child words>'
+                prefix = words[0:2]
+                block_words = [prefix + list(child.words) for child in obj.all_children]
+                if len(words) > 3 and words[2] == "address-family":
+                    block_words.insert(0, [*prefix, "version", "3"])
+            else:
+                block_words = [words]
+
+            for group_words in block_words:
+                rest = group_words[1:]
+                group = 0
+                if rest and rest[0].isdigit():
+                    group = int(rest[0])
+                    rest = rest[1:]
+                if not rest:
+                    # A group block opener such as 'hsrp 10' adds the group
+                    groups.setdefault((protocol, group), {})
+                    continue
+                values = groups.setdefault((protocol, group), {})
+                cls._read_group_words(protocol, rest, values, negated)
+
+        retval = []
+        for (protocol, group), values in sorted(groups.items()):
+            fields = dict(FHRP_DEFAULTS[protocol])
+            fields.update(values)
+            if protocol == "hsrp":
+                if "version" in hsrp_settings:
+                    fields["version"] = int(hsrp_settings["version"][0])
+                fields["use_bia"] = "use-bia" in hsrp_settings
+            for field in ("ipv4_secondary", "ipv6", "tracking"):
+                fields[field] = tuple(fields.get(field, ()))
+            retval.append(
+                cls(
+                    protocol=protocol,
+                    interface_name=interface_name,
+                    group=group,
+                    linenum=intf_obj.linenum,
+                    **fields,
+                )
+            )
+        return retval
+
+    # This method is on FHRPGroup()
+    @staticmethod
+    def _read_group_words(protocol: str, rest: list[str], values: dict[str, Any], negated: bool = False) -> None:
+        """Update the FHRPGroup() field ``values`` from the words after 'standby 10', 'vrrp 10' or 'glbp 10'"""
+        keyword = rest[0]
+
+        if negated:
+            if keyword == "preempt":
+                values["preempt"] = False
+            return
+
+        if keyword in {"ip", "address"}:
+            if len(rest) < 2:
+                return
+            if ":" in rest[1]:
+                values.setdefault("ipv6", []).append(rest[1])
+            elif "secondary" in rest[2:]:
+                values.setdefault("ipv4_secondary", []).append(rest[1])
+            else:
+                values["ipv4"] = rest[1]
+
+        elif keyword == "ipv6" and len(rest) > 1:
+            values.setdefault("ipv6", []).append(rest[1])
+
+        elif keyword == "priority" and len(rest) > 1:
+            values["priority"] = int(rest[1])
+
+        elif keyword == "preempt":
+            values["preempt"] = True
+            # preempt delay minimum 15 / preempt delay 15
+            if "minimum" in rest and rest.index("minimum") + 1 < len(rest):
+                values["preempt_delay"] = max(values.get("preempt_delay", 0), int(rest[rest.index("minimum") + 1]))
+            elif len(rest) > 2 and rest[1] == "delay" and rest[2].isdigit():
+                values["preempt_delay"] = max(values.get("preempt_delay", 0), int(rest[2]))
+
+        elif keyword == "timers":
+            timers = []
+            msec = False
+            for word in rest[1:]:
+                if word == "msec":
+                    msec = True
+                elif word.isdigit():
+                    timers.append(int(word) / 1000.0 if msec else int(word))
+                    msec = False
+                elif word != "advertise":
+                    # glbp timers redirect ...
+                    return
+            if protocol == "vrrp" and values.get("version") == 3 and timers and "msec" not in rest:
+                # VRRPv3 advertisement timers are in milliseconds
+                timers[0] = timers[0] / 1000.0
+            if timers:
+                values["hello_timer"] = timers[0]
+            if len(timers) > 1:
+                values["hold_timer"] = timers[1]
+
+        elif keyword == "version" and len(rest) > 1 and rest[1].isdigit():
+            values["version"] = int(rest[1])
+
+        elif keyword == "track" or rest[0:2] == ["weighting", "track"]:
+            track_words = rest[1:] if keyword == "track" else rest[2:]
+            if not track_words:
+                return
+            decrement = _FHRP_TRACK_DECREMENT
+            if "decrement" in track_words:
+                idx = track_words.index("decrement")
+                decrement = int(track_words[idx + 1]) if idx + 1 < len(track_words) else decrement
+                track_words = track_words[0:idx]
+            elif "shutdown" in track_words:
+                decrement = None
+                track_words = track_words[0 : track_words.index("shutdown")]
+            elif len(track_words) > 1 and track_words[-1].isdigit():
+                decrement = int(track_words[-1])
+                track_words = track_words[0:-1]
+            values.setdefault("tracking", []).append((" ".join(track_words), decrement))
+
+        elif keyword == "authentication":
+            values["authentication"] = " ".join(rest[1:])
+
+        elif keyword == "name" and len(rest) > 1:
+            values["name"] = rest[1]
+
+
 ##
 # -------------  IOS Configuration line object
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSCfgLine(BaseFactoryLine):
     """An object for a parsed IOS-style configuration line.
     :class:`~ciscoconfparse2.models_cisco.IOSCfgLine` objects contain
@@ -601,22 +802,6 @@ class IOSCfgLine(BaseFactoryLine):
         r"""Accept an IOS line number and initialize family relationship attributes"""
         super().__init__(*args, **kwargs)
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other) -> bool:
-        if other is None:
-            return False
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other) -> bool:
-        if other is None:
-            return True
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self) -> int:
-        return self.get_unique_identifier()
-
     @classmethod
     def from_list(cls, *list_of_args) -> BaseCfgLine:
         """Helper-method to allow strictly positional *arg calls .i.e. IOSCfgLine([], 'hostname Foo')"""
@@ -905,7 +1090,7 @@ class IOSCfgLine(BaseFactoryLine):
 #    default -> def
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
     ifindex: str = None
     default_ipv4_addr_object: Any = None
@@ -960,7 +1145,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         retval = set()
         for obj in self.children:
             # Get each HSRP group number...
-            tmp = obj.text.split()
+            tmp = obj.words
 
             if tmp[0] == "standby" and tmp[1] == "ip":
                 retval.add(HSRPInterfaceGroup(grp=0, parent_obj=self))
@@ -1004,6 +1189,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def abbvs(self) -> set[str]:
         r"""A python set of valid abbreviations (lowercased) for the interface"""
@@ -1013,6 +1199,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
     _INTF_NAME_REGEX = re.compile(_INTF_NAME_RE_STR)
 
     @property
+    @mutation_cached
     def cisco_interface_object(self) -> CiscoIOSInterface | CiscoIOSXRInterface:
         """Return a CiscoIOSInterface() instance for this interface
 
@@ -1023,10 +1210,11 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
             error = f"`{self.text}` is not a valid Cisco interface"
             logger.error(error)
             raise InvalidCiscoInterface(error)
-        return CiscoIOSInterface("".join(self.text.split()[1:]))
+        return CiscoIOSInterface("".join(self.words[1:]))
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def name(self) -> str:
         r"""
@@ -1065,10 +1253,11 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
            'ATM2/0.100'
            >>>
         """
-        return " ".join(self.text.split()[1:])
+        return " ".join(self.words[1:])
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def port(self) -> int:
         r"""
@@ -1108,6 +1297,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def port_type(self) -> str:
         r"""
@@ -1149,6 +1339,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def ordinal_list(self) -> tuple[int, ...]:
         r"""
@@ -1212,6 +1403,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def interface_number(self) -> str:
         r"""
@@ -1260,6 +1452,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def subinterface_number(self) -> str:
         r"""
@@ -1385,22 +1578,21 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def ipv4_addr_object(self) -> IPv4Obj:
         r"""
         :return: A :class:`ccp_util.IPv4Obj` object representing the address on this interface, default to IPv4Obj()
         :rtype: IPv4Obj
         """
-        retval = self.re_match_iter_typed(
-            r"^\s+ip\s+address\s+(?P<v4addr>\S+)\s+(?P<v4netmask>\d+\.\d+\.\d+\.\d+)",
-            groupdict={"v4addr": str, "v4netmask": str},
-            default="",
+        # The IPv4Obj() is cached on the address line until its text changes
+        return self.re_match_iter_typed(
+            r"^\s+ip\s+address\s+(\d+\.\d+\.\d+\.\d+\s+\d+\.\d+\.\d+\.\d+)",
+            result_type=IPv4Obj,
+            default=self.default_ipv4_addr_object,
+            untyped_default=True,
         )
 
-        if retval["v4addr"] == "" or retval["v4addr"] == "dhcp" or retval["v4addr"] == "negotiated":
-            return self.default_ipv4_addr_object
-        return IPv4Obj(f"{retval['v4addr']}/{retval['v4netmask']}")
-
     # This method is on BaseIOSIntfLine()
     @property
     @logger.catch(reraise=True)
@@ -1476,6 +1668,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def ipv4_network_object(self) -> IPv4Obj:
         r"""
@@ -1814,13 +2007,19 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSIntfLine()
     @logger.catch(reraise=True)
-    def in_ipv4_subnets(self, subnets: set[IPv4Obj] | list[IPv4Obj] | tuple[IPv4Obj, ...] | None = None) -> bool:
+    def in_ipv4_subnets(self, subnets: set[IPv4Obj] | list[IPv4Obj] | tuple[IPv4Obj, ...] | IPPrefixTrie | None = None) -> bool:
         r"""
-        :return: Whether the interface is in a sequence or set of ccp_util.IPv4Obj objects
+        :return: Whether the interface is in a sequence or set of ccp_util.IPv4Obj objects, or in a ccp_util.IPPrefixTrie
         :rtype: bool
+
+        Build an :class:`~ciscoconfparse2.ccp_util.IPPrefixTrie` once when checking many interfaces against many subnets; each interface is then checked in O(prefix length) instead of once per subnet.
         """
         if subnets is None:
             raise ValueError("A python list or set of ccp_util.IPv4Obj objects must be supplied")
+        if isinstance(subnets, IPPrefixTrie):
+            if self.ipv4_addr_object.empty is True:
+                return False
+            return self.ipv4_addr_object in subnets
         for subnet in subnets:
             if subnet.empty is True:
                 continue
@@ -1979,7 +2178,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         if self.ipv4_addr == "":
             return False
 
-        return any(_obj.text.strip().split()[0:3] == ["ip", "pim", "sparse-dense-mode"] for _obj in self.children)
+        return any(_obj.words[0:3] == ("ip", "pim", "sparse-dense-mode") for _obj in self.children)
 
     # This method is on BaseIOSIntfLine()
     @property
@@ -2052,13 +2251,14 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def is_switchport(self) -> bool:
         r"""
         :return: Whether the interface is a switchport
         :rtype: bool
         """
-        return any(_obj.text.strip().split()[0] == "switchport" for _obj in self.children)
+        return any(_obj.words[0] == "switchport" for _obj in self.children)
 
     # This method is on BaseIOSIntfLine()
     @property
@@ -2068,7 +2268,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         :return: Whether the interface is manually configured as an access switchport
         :rtype: bool
         """
-        return any(_obj.strip().split()[0:3] == ["switchport", "mode", "access"] for _obj in self.children)
+        return any(_obj.words[0:3] == ("switchport", "mode", "access") for _obj in self.children)
 
     # This method is on BaseIOSIntfLine()
     @property
@@ -2089,8 +2289,8 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         :rtype: str
         """
         for _obj in self.children:
-            _parts = _obj.text.strip().split()
-            if len(_parts) == 4 and _parts[0:3] == ["switchport", "trunk", "encap"]:
+            _parts = _obj.words
+            if len(_parts) == 4 and _parts[0:3] == ("switchport", "trunk", "encap"):
                 return _parts[3]
         return ""
 
@@ -2102,7 +2302,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         :return: Whether this interface is manually configured as a trunk switchport
         :rtype: bool
         """
-        return any(_obj.text.strip().split()[0:3] == ["switchport", "mode", "trunk"] for _obj in self.children)
+        return any(_obj.words[0:3] == ("switchport", "mode", "trunk") for _obj in self.children)
 
     # This method is on BaseIOSIntfLine()
     @property
@@ -2117,7 +2317,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         ## IMPORTANT: Cisco IOS will not enable port-security on the port
         ##    unless 'switch port-security' (with no other options)
         ##    is in the configuration
-        return any(_obj.strip().split()[0:2] == ["switchport", "port-security"] for _obj in self.children)
+        return any(_obj.words[0:2] == ("switchport", "port-security") for _obj in self.children)
 
     # This method is on BaseIOSIntfLine()
     @property
@@ -2131,7 +2331,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         if not self.is_switchport:
             return False
 
-        return any(_obj.text.strip().split()[0:1] == ["storm-control"] for _obj in self.children)
+        return any(_obj.words[0:1] == ("storm-control",) for _obj in self.children)
 
     # This method is on BaseIOSIntfLine()
     @property
@@ -2167,8 +2367,8 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
             default_val = -1
 
         for _obj in self.children:
-            if _obj.text.strip().split()[0:3] == ["switchport", "access", "vlan"]:
-                return int(_obj.text.strip().split()[3])
+            if _obj.words[0:3] == ("switchport", "access", "vlan"):
+                return int(_obj.words[3])
         return default_val
 
     # This method is on BaseIOSIntfLine()
@@ -2179,12 +2379,22 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         :return: A CiscoRange() with the list of allowed vlan numbers (as int).
         :rtype: CiscoRange
         """
+        return self.trunk_vlan_set.as_cisco_range()
+
+    # This method is on BaseIOSIntfLine()
+    @property
+    @logger.catch(reraise=True)
+    def trunk_vlan_set(self) -> CiscoVlanSet:
+        r"""
+        :return: A CiscoVlanSet() bitset of the allowed vlan numbers; it has the same vlans as ``trunk_vlans_allowed``, with O(1) membership and whole-set union / intersection / difference.
+        :rtype: CiscoVlanSet
+        """
         # The default value for retval...
         if self.is_switchport and not self.has_manual_switch_access:
-            retval = CiscoRange(result_type=int)
+            retval = CiscoVlanSet()
         else:
-            # Default to an empty CiscoRange()
-            return CiscoRange(result_type=int)
+            # Default to an empty CiscoVlanSet()
+            return CiscoVlanSet()
 
         _all_vlans = "1-4094"
         _max_number_vlans = 4094
@@ -2199,13 +2409,13 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         ## Iterate over switchport trunk statements
         for obj in self.children:
 
-            if obj.text.split()[0:5] == [
+            if obj.words[0:5] == (
                 "switchport",
                 "trunk",
                 "allowed",
                 "vlan",
                 "add",
-            ]:
+            ):
                 add_str = obj.re_match_typed(
                     r"^\s+switchport\s+trunk\s+allowed\s+vlan\s+add\s+(\d[\d\-\,\s]*)$",
                     default="_nomatch_",
@@ -2217,13 +2427,13 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
                     else:
                         vdict["add"] += f",{add_str}"
 
-            elif obj.text.split()[0:5] == [
+            elif obj.words[0:5] == (
                 "switchport",
                 "trunk",
                 "allowed",
                 "vlan",
                 "except",
-            ]:
+            ):
                 exc_str = obj.re_match_typed(
                     r"^\s+switchport\s+trunk\s+allowed\s+vlan\s+except\s+(\d[\d\-\,\s]*)$",
                     default="_nomatch_",
@@ -2235,13 +2445,13 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
                     else:
                         vdict["except"] += f",{exc_str}"
 
-            elif obj.text.split()[0:5] == [
+            elif obj.words[0:5] == (
                 "switchport",
                 "trunk",
                 "allowed",
                 "vlan",
                 "remove",
-            ]:
+            ):
                 rem_str = obj.re_match_typed(
                     r"^\s+switchport\s+trunk\s+allowed\s+vlan\s+remove\s+(\d[\d\-\,\s]*)$",
                     default="_nomatch_",
@@ -2253,7 +2463,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
                     else:
                         vdict["remove"] += f",{rem_str}"
 
-            elif obj.text.split()[0:4] == ["switchport", "trunk", "allowed", "vlan"]:
+            elif obj.words[0:4] == ("switchport", "trunk", "allowed", "vlan"):
                 ## For every child object, check whether the vlan list is modified
                 allowed_str = obj.re_match_typed(
                     # switchport trunk allowed vlan
@@ -2279,11 +2489,11 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         if isinstance(vdict["allowed"], str):
             if vdict["allowed"] == _all_vlans:
                 if len(retval) != _max_number_vlans:
-                    retval = CiscoRange(f"1-{MAX_VLAN}", result_type=int)
+                    retval = CiscoVlanSet(f"1-{MAX_VLAN}")
             elif vdict["allowed"] == "":
-                retval = CiscoRange(result_type=int)
+                retval = CiscoVlanSet()
             elif vdict["allowed"] != "_nomatch_":
-                retval = CiscoRange(vdict["allowed"], result_type=int)
+                retval = CiscoVlanSet(vdict["allowed"])
 
         # Inspect vdict keys in a specific order to ensure best results...
         for key in ["allowed", "add", "except", "remove"]:
@@ -2301,22 +2511,22 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
                 ## allowed in the key overrides previous values
                 if key == "allowed":
                     # When considering 'allowed', reset retval to be empty...
-                    retval = CiscoRange(result_type=int)
+                    retval = CiscoVlanSet()
                     if _value.lower() == "none":
                         continue
                     if _value.lower() == "all":
-                        retval = CiscoRange(text=f"1-{MAX_VLAN}", result_type=int)
+                        retval = CiscoVlanSet(f"1-{MAX_VLAN}")
                     elif isinstance(re.search(r"^\d[\d\-\,\s]*", _value), re.Match):
-                        retval = retval + CiscoRange(_value, result_type=int)
+                        retval = retval | CiscoVlanSet(_value)
                     else:
                         error = f"Could not derive a vlan range for {_value}"
                         logger.error(error)
                         raise InvalidCiscoEthernetVlan(error)
 
                 elif key == "add":
-                    retval = retval + CiscoRange(_value, result_type=int)
+                    retval = retval | CiscoVlanSet(_value)
                 elif key == "except" or key == "remove":
-                    retval = retval - CiscoRange(_value, result_type=int)
+                    retval = retval - CiscoVlanSet(_value)
                 else:
                     error = f"{key} is an invalid Cisco switched dot1q ethernet trunk action."
                     logger.error(error)
@@ -2336,13 +2546,13 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         else:
             default_val = -1
         for _obj in self.children:
-            _parts = _obj.text.strip().split()
-            if len(_parts) == 5 and _parts[0:4] == [
+            _parts = _obj.words
+            if len(_parts) == 5 and _parts[0:4] == (
                 "switchport",
                 "trunk",
                 "native",
                 "vlan",
-            ]:
+            ):
                 # return the vlan integer from 'switchport trunk native vlan 911'
                 return int(_parts[4])
         return default_val
@@ -2358,12 +2568,12 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
         :rtype: bool
         """
         for _obj in self.children:
-            _parts = _obj.text.strip().split()
-            if len(_parts) == 3 and _parts[0:3] == [
+            _parts = _obj.words
+            if len(_parts) == 3 and _parts[0:3] == (
                 "no",
                 "cdp",
                 "enable",
-            ]:
+            ):
                 return True
         return False
 
@@ -2660,7 +2870,7 @@ class BaseIOSIntfLine(IOSCfgLine, BaseFactoryInterfaceLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSIntfLine(BaseIOSIntfLine):
 
     # This method is on IOSIntfLine()
@@ -2676,18 +2886,6 @@ class IOSIntfLine(BaseIOSIntfLine):
         super().__init__(*args, **kwargs)
         self.feature = "interface"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     # This method is on IOSIntfLine()
     @classmethod
     @logger.catch(reraise=True)
@@ -2700,7 +2898,7 @@ class IOSIntfLine(BaseIOSIntfLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSIntfGlobal(IOSCfgLine):
     # This method is on IOSIntGlobal()
     @logger.catch(reraise=True)
@@ -2708,18 +2906,6 @@ class IOSIntfGlobal(IOSCfgLine):
         super().__init__(*args, **kwargs)
         self.feature = "interface global"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -2761,25 +2947,13 @@ class IOSIntfGlobal(IOSCfgLine):
 #
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSAccessLine(IOSCfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.feature = "access line"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     def __repr__(self):
         return f"<{self.classname} # {self.linenum} '{self.name}' info: '{self.range_str}'>"
 
@@ -2844,7 +3018,7 @@ class IOSAccessLine(IOSCfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseIOSRouteLine(IOSCfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
@@ -2947,7 +3121,7 @@ _RE_IPV6_ROUTE = re.compile(
 )
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSRouteLine(IOSCfgLine):
     _address_family: str = None
     route_info: dict = None
@@ -2989,18 +3163,6 @@ class IOSRouteLine(IOSCfgLine):
         else:
             raise ValueError(f"Could not parse '{self.text}'")
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -4,7 +4,7 @@ from typing import Any
 import attrs
 from loguru import logger
 
-from ciscoconfparse2.ccp_abc import BaseCfgLine
+from ciscoconfparse2.ccp_abc import BaseCfgLine, mutation_cached
 from ciscoconfparse2.ccp_util import (
     _IPV6_REGEX_STR_COMPRESSED1,
     _IPV6_REGEX_STR_COMPRESSED2,
@@ -12,6 +12,8 @@ from ciscoconfparse2.ccp_util import (
     CiscoIOSInterface,
     CiscoIOSXRInterface,
     CiscoRange,
+    CiscoVlanSet,
+    IPPrefixTrie,
     IPv4Obj,
     IPv6Obj,
 )
@@ -60,7 +62,7 @@ MAX_VLAN = 4094
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSXRCfgLine(BaseFactoryLine):
     """An object for a parsed IOSXR-style configuration line.
     :class:`ciscoconfparse2.models_iosxr.IOSXRCfgLine` objects contain references to other
@@ -110,22 +112,6 @@ class IOSXRCfgLine(BaseFactoryLine):
         r"""Accept an IOSXR line number and initialize family relationship attributes"""
         super().__init__(*args, **kwargs)
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other) -> bool:
-        if other is None:
-            return False
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other) -> bool:
-        if other is None:
-            return True
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self) -> int:
-        return self.get_unique_identifier()
-
     @classmethod
     def from_list(cls, *list_of_args) -> BaseCfgLine:
         """Helper-method to allow strictly positional *arg calls .i.e. IOSXRCfgLine([], 'hostname Foo')"""
@@ -414,7 +400,7 @@ class IOSXRCfgLine(BaseFactoryLine):
 #    default -> def
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
     ifindex: str = None
     default_ipv4_addr_object: Any = None
@@ -470,7 +456,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         for obj in self.children:
             # Get each HSRP group number...
             if re.search(r"standby\s+(?P<group>\d+)\s+ip", obj.text.strip()):
-                group = int(obj.text.split()[1])
+                group = int(obj.words[1])
                 retval.add(HSRPInterfaceGroup(group=group, parent=self))
         # Return a sorted list of HSRPInterfaceGroup() instances...
         intf_groups = sorted(retval, key=lambda x: x.group, reverse=False)
@@ -502,6 +488,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def abbvs(self) -> set[str]:
         r"""A python set of valid abbreviations (lowercased) for the interface"""
@@ -511,6 +498,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
     _INTF_NAME_REGEX = re.compile(_INTF_NAME_RE_STR)
 
     @property
+    @mutation_cached
     def cisco_interface_object(self) -> CiscoIOSInterface | CiscoIOSXRInterface:
         """Return a CiscoIOSInterface() instance for this interface
 
@@ -521,10 +509,11 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
             error = f"`{self.text}` is not a valid Cisco interface"
             logger.error(error)
             raise InvalidCiscoInterface(error)
-        return CiscoIOSXRInterface("".join(self.text.split()[1:]))
+        return CiscoIOSXRInterface("".join(self.words[1:]))
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def name(self) -> str:
         r"""
@@ -563,10 +552,11 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
            'ATM2/0.100'
            >>>
         """
-        return " ".join(self.text.split()[1:])
+        return " ".join(self.words[1:])
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def port(self) -> int:
         r"""
@@ -606,6 +596,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def port_type(self) -> str:
         r"""
@@ -647,6 +638,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def ordinal_list(self) -> tuple[int, ...]:
         r"""
@@ -710,6 +702,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def interface_number(self) -> str:
         r"""
@@ -758,6 +751,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def subinterface_number(self) -> str:
         r"""
@@ -883,22 +877,21 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def ipv4_addr_object(self) -> IPv4Obj:
         r"""
         :return: A :class:`ccp_util.IPv4Obj` object representing the address on this interface, default to IPv4Obj()
         :rtype: IPv4Obj
         """
-        retval = self.re_match_iter_typed(
-            r"^\s+ip\s+address\s+(?P<v4addr>\S+)\s+(?P<v4netmask>\d+\.\d+\.\d+\.\d+)",
-            groupdict={"v4addr": str, "v4netmask": str},
-            default="",
+        # The IPv4Obj() is cached on the address line until its text changes
+        return self.re_match_iter_typed(
+            r"^\s+ip\s+address\s+(\d+\.\d+\.\d+\.\d+\s+\d+\.\d+\.\d+\.\d+)",
+            result_type=IPv4Obj,
+            default=self.default_ipv4_addr_object,
+            untyped_default=True,
         )
 
-        if retval["v4addr"] == "" or retval["v4addr"] == "dhcp" or retval["v4addr"] == "negotiated":
-            return self.default_ipv4_addr_object
-        return IPv4Obj(f"{retval['v4addr']}/{retval['v4netmask']}")
-
     # This method is on BaseIOSXRIntfLine()
     @property
     @logger.catch(reraise=True)
@@ -974,6 +967,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def ipv4_network_object(self) -> IPv4Obj:
         r"""
@@ -1312,13 +1306,19 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSXRIntfLine()
     @logger.catch(reraise=True)
-    def in_ipv4_subnets(self, subnets: set[IPv4Obj] | list[IPv4Obj] | tuple[IPv4Obj, ...] | None = None) -> bool:
+    def in_ipv4_subnets(self, subnets: set[IPv4Obj] | list[IPv4Obj] | tuple[IPv4Obj, ...] | IPPrefixTrie | None = None) -> bool:
         r"""
-        :return: Whether the interface is in a sequence or set of ccp_util.IPv4Obj objects
+        :return: Whether the interface is in a sequence or set of ccp_util.IPv4Obj objects, or in a ccp_util.IPPrefixTrie
         :rtype: bool
+
+        Build an :class:`~ciscoconfparse2.ccp_util.IPPrefixTrie` once when checking many interfaces against many subnets; each interface is then checked in O(prefix length) instead of once per subnet.
         """
         if subnets is None:
             raise ValueError("A python list or set of ccp_util.IPv4Obj objects must be supplied")
+        if isinstance(subnets, IPPrefixTrie):
+            if self.ipv4_addr_object.empty is True:
+                return False
+            return self.ipv4_addr_object in subnets
         for subnet in subnets:
             if subnet.empty is True:
                 continue
@@ -1477,7 +1477,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         if self.ipv4_addr == "":
             return False
 
-        return any(_obj.text.strip().split()[0:3] == ["ip", "pim", "sparse-dense-mode"] for _obj in self.children)
+        return any(_obj.words[0:3] == ("ip", "pim", "sparse-dense-mode") for _obj in self.children)
 
     # This method is on BaseIOSXRIntfLine()
     @property
@@ -1550,13 +1550,14 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseIOSXRIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def is_switchport(self) -> bool:
         r"""
         :return: Whether the interface is a switchport
         :rtype: bool
         """
-        return any(_obj.text.strip().split()[0] == "switchport" for _obj in self.children)
+        return any(_obj.words[0] == "switchport" for _obj in self.children)
 
     # This method is on BaseIOSXRIntfLine()
     @property
@@ -1566,7 +1567,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         :return: Whether the interface is manually configured as an access switchport
         :rtype: bool
         """
-        return any(_obj.text.strip().split()[0:3] == ["switchport", "mode", "access"] for _obj in self.children)
+        return any(_obj.words[0:3] == ("switchport", "mode", "access") for _obj in self.children)
 
     # This method is on BaseIOSXRIntfLine()
     @property
@@ -1587,8 +1588,8 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         :rtype: str
         """
         for _obj in self.children:
-            _parts = _obj.text.strip().split()
-            if len(_parts) == 4 and _parts[0:3] == ["switchport", "trunk", "encap"]:
+            _parts = _obj.words
+            if len(_parts) == 4 and _parts[0:3] == ("switchport", "trunk", "encap"):
                 return _parts[3]
         return ""
 
@@ -1600,7 +1601,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         :return: Whether this interface is manually configured as a trunk switchport
         :rtype: bool
         """
-        return any(_obj.text.strip().split()[0:3] == ["switchport", "mode", "trunk"] for _obj in self.children)
+        return any(_obj.words[0:3] == ("switchport", "mode", "trunk") for _obj in self.children)
 
     # This method is on BaseIOSXRIntfLine()
     @property
@@ -1615,7 +1616,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         ## IMPORTANT: Cisco IOSXR will not enable port-security on the port
         ##    unless 'switch port-security' (with no other options)
         ##    is in the configuration
-        return any(_obj.text.strip().split()[0:2] == ["switchport", "port-security"] for _obj in self.children)
+        return any(_obj.words[0:2] == ("switchport", "port-security") for _obj in self.children)
 
     # This method is on BaseIOSXRIntfLine()
     @property
@@ -1627,7 +1628,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         """
         if not self.is_switchport:
             return False
-        return any(_obj.text.strip().split()[0:1] == ["storm-control"] for _obj in self.children)
+        return any(_obj.words[0:1] == ("storm-control",) for _obj in self.children)
 
     # This method is on BaseIOSXRIntfLine()
     @property
@@ -1663,8 +1664,8 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
             default_val = -1
 
         for _obj in self.children:
-            if _obj.text.strip().split()[0:3] == ["switchport", "access", "vlan"]:
-                return int(_obj.text.strip().split()[3])
+            if _obj.words[0:3] == ("switchport", "access", "vlan"):
+                return int(_obj.words[3])
         return default_val
 
     # This method is on BaseIOSXRIntfLine()
@@ -1675,12 +1676,22 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         :return: A CiscoRange() with the list of allowed vlan numbers (as int).
         :rtype: CiscoRange
         """
+        return self.trunk_vlan_set.as_cisco_range()
+
+    # This method is on BaseIOSXRIntfLine()
+    @property
+    @logger.catch(reraise=True)
+    def trunk_vlan_set(self) -> CiscoVlanSet:
+        r"""
+        :return: A CiscoVlanSet() bitset of the allowed vlan numbers; it has the same vlans as ``trunk_vlans_allowed``, with O(1) membership and whole-set union / intersection / difference.
+        :rtype: CiscoVlanSet
+        """
         # The default value for retval...
         if self.is_switchport and not self.has_manual_switch_access:
-            retval = CiscoRange(result_type=int)
+            retval = CiscoVlanSet()
         else:
-            # Default to an empty CiscoRange()
-            return CiscoRange(result_type=int)
+            # Default to an empty CiscoVlanSet()
+            return CiscoVlanSet()
 
         _all_vlans = "1-4094"
         _max_number_vlans = 4094
@@ -1695,13 +1706,13 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         ## Iterate over switchport trunk statements
         for obj in self.children:
 
-            if obj.text.split()[0:5] == [
+            if obj.words[0:5] == (
                 "switchport",
                 "trunk",
                 "allowed",
                 "vlan",
                 "add",
-            ]:
+            ):
                 add_str = obj.re_match_typed(
                     r"^\s+switchport\s+trunk\s+allowed\s+vlan\s+add\s+(\d[\d\-\,\s]*)$",
                     default="_nomatch_",
@@ -1713,13 +1724,13 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
                     else:
                         vdict["add"] += f",{add_str}"
 
-            elif obj.text.split()[0:5] == [
+            elif obj.words[0:5] == (
                 "switchport",
                 "trunk",
                 "allowed",
                 "vlan",
                 "except",
-            ]:
+            ):
                 exc_str = obj.re_match_typed(
                     r"^\s+switchport\s+trunk\s+allowed\s+vlan\s+except\s+(\d[\d\-\,\s]*)$",
                     default="_nomatch_",
@@ -1731,13 +1742,13 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
                     else:
                         vdict["except"] += f",{exc_str}"
 
-            elif obj.text.split()[0:5] == [
+            elif obj.words[0:5] == (
                 "switchport",
                 "trunk",
                 "allowed",
                 "vlan",
                 "remove",
-            ]:
+            ):
                 rem_str = obj.re_match_typed(
                     r"^\s+switchport\s+trunk\s+allowed\s+vlan\s+remove\s+(\d[\d\-\,\s]*)$",
                     default="_nomatch_",
@@ -1749,7 +1760,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
                     else:
                         vdict["remove"] += f",{rem_str}"
 
-            elif obj.text.split()[0:4] == ["switchport", "trunk", "allowed", "vlan"]:
+            elif obj.words[0:4] == ("switchport", "trunk", "allowed", "vlan"):
                 ## For every child object, check whether the vlan list is modified
                 allowed_str = obj.re_match_typed(
                     # switchport trunk allowed vlan
@@ -1775,11 +1786,11 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         if isinstance(vdict["allowed"], str):
             if vdict["allowed"] == _all_vlans:
                 if len(retval) != _max_number_vlans:
-                    retval = CiscoRange(f"1-{MAX_VLAN}", result_type=int)
+                    retval = CiscoVlanSet(f"1-{MAX_VLAN}")
             elif vdict["allowed"] == "":
-                retval = CiscoRange(result_type=int)
+                retval = CiscoVlanSet()
             elif vdict["allowed"] != "_nomatch_":
-                retval = CiscoRange(vdict["allowed"], result_type=int)
+                retval = CiscoVlanSet(vdict["allowed"])
 
         # Inspect vdict keys in a specific order to ensure best results...
         for key in ["allowed", "add", "except", "remove"]:
@@ -1797,22 +1808,22 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
                 ## allowed in the key overrides previous values
                 if key == "allowed":
                     # When considering 'allowed', reset retval to be empty...
-                    retval = CiscoRange(result_type=int)
+                    retval = CiscoVlanSet()
                     if _value.lower() == "none":
                         continue
                     if _value.lower() == "all":
-                        retval = CiscoRange(text=f"1-{MAX_VLAN}", result_type=int)
+                        retval = CiscoVlanSet(f"1-{MAX_VLAN}")
                     elif isinstance(re.search(r"^\d[\d\-\,\s]*", _value), re.Match):
-                        retval = retval + CiscoRange(_value, result_type=int)
+                        retval = retval | CiscoVlanSet(_value)
                     else:
                         error = f"Could not derive a vlan range for {_value}"
                         logger.error(error)
                         raise InvalidCiscoEthernetVlan(error)
 
                 elif key == "add":
-                    retval = retval + CiscoRange(_value, result_type=int)
+                    retval = retval | CiscoVlanSet(_value)
                 elif key == "except" or key == "remove":
-                    retval = retval - CiscoRange(_value, result_type=int)
+                    retval = retval - CiscoVlanSet(_value)
                 else:
                     error = f"{key} is an invalid Cisco switched dot1q ethernet trunk action."
                     logger.error(error)
@@ -1832,13 +1843,13 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         else:
             default_val = -1
         for _obj in self.children:
-            _parts = _obj.text.strip().split()
-            if len(_parts) == 5 and _parts[0:4] == [
+            _parts = _obj.words
+            if len(_parts) == 5 and _parts[0:4] == (
                 "switchport",
                 "trunk",
                 "native",
                 "vlan",
-            ]:
+            ):
                 # return the vlan integer from 'switchport trunk native vlan 911'
                 return int(_parts[4])
         return default_val
@@ -1854,12 +1865,12 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
         :rtype: bool
         """
         for _obj in self.children:
-            _parts = _obj.text.strip().split()
-            if len(_parts) == 3 and _parts[0:3] == [
+            _parts = _obj.words
+            if len(_parts) == 3 and _parts[0:3] == (
                 "no",
                 "cdp",
                 "enable",
-            ]:
+            ):
                 return True
         return False
 
@@ -2157,7 +2168,7 @@ class BaseIOSXRIntfLine(IOSXRCfgLine, BaseFactoryInterfaceLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSXRIntfLine(BaseIOSXRIntfLine):
 
     # This method is on IOSXRIntfLine()
@@ -2173,18 +2184,6 @@ class IOSXRIntfLine(BaseIOSXRIntfLine):
         super().__init__(*args, **kwargs)
         self.feature = "interface"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     # This method is on IOSXRIntfLine()
     @classmethod
     @logger.catch(reraise=True)
@@ -2197,7 +2196,7 @@ class IOSXRIntfLine(BaseIOSXRIntfLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSXRIntfGlobal(IOSXRCfgLine):
     # This method is on IOSXRIntGlobal()
     @logger.catch(reraise=True)
@@ -2205,18 +2204,6 @@ class IOSXRIntfGlobal(IOSXRCfgLine):
         super(IOSXRIntfGlobal).__init__(*args, **kwargs)
         self.feature = "interface global"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -2251,24 +2238,12 @@ class IOSXRIntfGlobal(IOSXRCfgLine):
 ##
 # -------------  IOSXR vPC line
 ##
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSXRvPCLine(BaseCfgLine):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.feature = "vpc"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     def __repr__(self):
         return f"<{self.classname} # {self.linenum} '{self.vpc_domain_id}'>"
 
@@ -2373,25 +2348,13 @@ class IOSXRvPCLine(BaseCfgLine):
 #
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSXRAccessLine(IOSXRCfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.feature = "access line"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     def __repr__(self):
         return f"<{self.classname} # {self.linenum} '{self.name}' info: '{self.range_str}'>"
 
@@ -2455,7 +2418,7 @@ class IOSXRAccessLine(IOSXRCfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseIOSXRRouteLine(IOSXRCfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
@@ -2558,7 +2521,7 @@ _RE_IPV6_ROUTE = re.compile(
 )
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class IOSXRRouteLine(IOSXRCfgLine):
     _address_family: str = None
     route_info: dict = None
@@ -2583,18 +2546,6 @@ class IOSXRRouteLine(IOSXRCfgLine):
             else:
                 raise ValueError(f"Could not parse '{self.text}'")
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -43,7 +43,7 @@ DEFAULT_IPV4_ADDR_OBJ = IPv4Obj("0.0.0.1/32", strict=False)
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class JunosCfgLine(BaseCfgLine):
     r"""An object for a parsed Junos-style configuration line.
     :class:`ciscoconfparse2.models_junos.JunosCfgLine` objects contain references to other
@@ -97,22 +97,6 @@ class JunosCfgLine(BaseCfgLine):
     def is_object_for_interface(cls, all_lines, line, index=None, re=re):
         return False
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other) -> bool:
-        if other is None:
-            return False
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other) -> bool:
-        if other is None:
-            return True
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @property
     @logger.catch(reraise=True)
     def name(self):
@@ -344,7 +328,7 @@ class JunosCfgLine(BaseCfgLine):
 #    default -> def
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseJunosIntfLine(JunosCfgLine):
 
     # This method is on BaseJunosIntfLine()
@@ -436,10 +420,10 @@ class BaseJunosIntfLine(JunosCfgLine):
         ######################################################################
         # Return an empty IPv4Obj() unless tihs is an interface unit line
         ######################################################################
-        if len(self.text.split()) > 0:
-            if self.text.split()[0] != "unit":
+        if len(self.words) > 0:
+            if self.words[0] != "unit":
                 return IPv4Obj()
-        elif len(self.text.split()) == 0:
+        elif len(self.words) == 0:
             return IPv4Obj()
 
         ######################################################################
@@ -447,10 +431,10 @@ class BaseJunosIntfLine(JunosCfgLine):
         #     for it
         ######################################################################
         for obj in self.children:
-            if obj.text.split()[0:2] == ["family", "inet"]:
+            if obj.words[0:2] == ("family", "inet"):
                 for cobj in obj.children:
-                    if cobj.text.split()[0] == "address":
-                        return IPv4Obj(cobj.text.split()[1].strip(";"))
+                    if cobj.words[0] == "address":
+                        return IPv4Obj(cobj.words[1].strip(";"))
         return IPv4Obj()
 
     # This method is on BaseJunosIntfLine()
@@ -461,7 +445,7 @@ class BaseJunosIntfLine(JunosCfgLine):
         ######################################################################
         # Return an empty IPv6Obj() unless tihs is an interface unit line
         ######################################################################
-        if self.text.split()[0] != "unit":
+        if self.words[0] != "unit":
             return IPv6Obj()
 
         ######################################################################
@@ -469,17 +453,17 @@ class BaseJunosIntfLine(JunosCfgLine):
         #     for it
         ######################################################################
         for obj in self.children:
-            if obj.text.split()[0:2] == ["family", "inet6"]:
+            if obj.words[0:2] == ("family", "inet6"):
                 for cobj in obj.children:
-                    if cobj.text.split()[0] == "address":
-                        return IPv6Obj(cobj.text.split()[1].strip(";"))
+                    if cobj.words[0] == "address":
+                        return IPv6Obj(cobj.words[1].strip(";"))
         return IPv6Obj()
 
     # This method is on JunosIntfLine()
     @property
     @logger.catch(reraise=True)
     def is_switchport(self):
-        return any(obj.parent.text.split()[0] == "unit" and obj.text.split()[0:2] == ["family", "ethernet-switching"] for obj in self.parent.all_children)
+        return any(obj.parent.words[0] == "unit" and obj.words[0:2] == ("family", "ethernet-switching") for obj in self.parent.all_children)
 
     # This method is on BaseJunosIntfLine()
     @property
@@ -661,7 +645,7 @@ class BaseJunosIntfLine(JunosCfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class JunosIntfLine(BaseJunosIntfLine):
 
     # This method is on JunosIntfLine()
@@ -689,7 +673,7 @@ class JunosIntfLine(BaseJunosIntfLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseJunosRouteLine(BaseCfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
@@ -753,7 +737,7 @@ class BaseJunosRouteLine(BaseCfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class JunosRouteLine(BaseJunosRouteLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
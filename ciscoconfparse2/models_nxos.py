@@ -4,7 +4,7 @@ from typing import Any
 import attrs
 from loguru import logger
 
-from ciscoconfparse2.ccp_abc import BaseCfgLine
+from ciscoconfparse2.ccp_abc import BaseCfgLine, mutation_cached
 from ciscoconfparse2.ccp_util import (
     _IPV6_REGEX_STR_COMPRESSED1,
     _IPV6_REGEX_STR_COMPRESSED2,
@@ -12,6 +12,8 @@ from ciscoconfparse2.ccp_util import (
     CiscoIOSInterface,
     CiscoIOSXRInterface,
     CiscoRange,
+    CiscoVlanSet,
+    IPPrefixTrie,
     IPv4Obj,
     IPv6Obj,
 )
@@ -60,7 +62,7 @@ MAX_VLAN = 4094
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class NXOSCfgLine(BaseFactoryLine):
     """An object for a parsed NXOS-style configuration line.
     :class:`ciscoconfparse2.models_nxos.NXOSCfgLine` objects contain references to other
@@ -99,22 +101,6 @@ class NXOSCfgLine(BaseFactoryLine):
         r"""Accept an NXOS line number and initialize family relationship attributes"""
         super().__init__(*args, **kwargs)
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other) -> bool:
-        if other is None:
-            return False
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other) -> bool:
-        if other is None:
-            return True
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self) -> int:
-        return self.get_unique_identifier()
-
     @classmethod
     def from_list(cls, *list_of_args) -> BaseCfgLine:
         """Helper-method to allow strictly positional *arg calls .i.e. NXOSCfgLine([], 'hostname Foo')"""
@@ -403,7 +389,7 @@ class NXOSCfgLine(BaseFactoryLine):
 #    default -> def
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
     ifindex: str = None
     default_ipv4_addr_object: Any = None
@@ -459,7 +445,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         for obj in self.children:
             # Get each HSRP group number...
             if re.search(r"standby\s+(?P<group>\d+)\s+ip", obj.text.strip()):
-                group = int(obj.text.split()[1])
+                group = int(obj.words[1])
                 retval.add(HSRPInterfaceGroup(group=group, parent=self))
         # Return a sorted list of HSRPInterfaceGroup() instances...
         intf_groups = sorted(retval, key=lambda x: x.group, reverse=False)
@@ -491,6 +477,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def abbvs(self) -> set[str]:
         r"""A python set of valid abbreviations (lowercased) for the interface"""
@@ -500,6 +487,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
     _INTF_NAME_REGEX = re.compile(_INTF_NAME_RE_STR)
 
     @property
+    @mutation_cached
     def cisco_interface_object(self) -> CiscoIOSInterface | CiscoIOSXRInterface:
         """Return a CiscoIOSInterface() instance for this interface
 
@@ -510,10 +498,11 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
             error = f"`{self.text}` is not a valid Cisco interface"
             logger.error(error)
             raise InvalidCiscoInterface(error)
-        return CiscoIOSInterface("".join(self.text.split()[1:]))
+        return CiscoIOSInterface("".join(self.words[1:]))
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def name(self) -> str:
         r"""
@@ -552,10 +541,11 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
            'ATM2/0.100'
            >>>
         """
-        return " ".join(self.text.split()[1:])
+        return " ".join(self.words[1:])
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def port(self) -> int:
         r"""
@@ -595,6 +585,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def port_type(self) -> str:
         r"""
@@ -636,6 +627,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def ordinal_list(self) -> tuple[int, ...]:
         r"""
@@ -699,6 +691,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def interface_number(self) -> str:
         r"""
@@ -747,6 +740,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def subinterface_number(self) -> str:
         r"""
@@ -872,22 +866,21 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def ipv4_addr_object(self) -> IPv4Obj:
         r"""
         :return: A :class:`ccp_util.IPv4Obj` object representing the address on this interface, default to IPv4Obj()
         :rtype: IPv4Obj
         """
-        retval = self.re_match_iter_typed(
-            r"^\s+ip\s+address\s+(?P<v4addr>\S+)\s+(?P<v4netmask>\d+\.\d+\.\d+\.\d+)",
-            groupdict={"v4addr": str, "v4netmask": str},
-            default="",
+        # The IPv4Obj() is cached on the address line until its text changes
+        return self.re_match_iter_typed(
+            r"^\s+ip\s+address\s+(\d+\.\d+\.\d+\.\d+\s+\d+\.\d+\.\d+\.\d+)",
+            result_type=IPv4Obj,
+            default=self.default_ipv4_addr_object,
+            untyped_default=True,
         )
 
-        if retval["v4addr"] == "" or retval["v4addr"] == "dhcp" or retval["v4addr"] == "negotiated":
-            return self.default_ipv4_addr_object
-        return IPv4Obj(f"{retval['v4addr']}/{retval['v4netmask']}")
-
     # This method is on BaseNXOSIntfLine()
     @property
     @logger.catch(reraise=True)
@@ -963,6 +956,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def ipv4_network_object(self) -> IPv4Obj:
         r"""
@@ -1301,13 +1295,19 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseNXOSIntfLine()
     @logger.catch(reraise=True)
-    def in_ipv4_subnets(self, subnets: set[IPv4Obj] | list[IPv4Obj] | tuple[IPv4Obj, ...] | None = None) -> bool:
+    def in_ipv4_subnets(self, subnets: set[IPv4Obj] | list[IPv4Obj] | tuple[IPv4Obj, ...] | IPPrefixTrie | None = None) -> bool:
         r"""
-        :return: Whether the interface is in a sequence or set of ccp_util.IPv4Obj objects
+        :return: Whether the interface is in a sequence or set of ccp_util.IPv4Obj objects, or in a ccp_util.IPPrefixTrie
         :rtype: bool
+
+        Build an :class:`~ciscoconfparse2.ccp_util.IPPrefixTrie` once when checking many interfaces against many subnets; each interface is then checked in O(prefix length) instead of once per subnet.
         """
         if subnets is None:
             raise ValueError("A python list or set of ccp_util.IPv4Obj objects must be supplied")
+        if isinstance(subnets, IPPrefixTrie):
+            if self.ipv4_addr_object.empty is True:
+                return False
+            return self.ipv4_addr_object in subnets
         for subnet in subnets:
             if subnet.empty is True:
                 continue
@@ -1466,7 +1466,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         if self.ipv4_addr == "":
             return False
 
-        return any(_obj.text.strip().split()[0:3] == ["ip", "pim", "sparse-dense-mode"] for _obj in self.children)
+        return any(_obj.words[0:3] == ("ip", "pim", "sparse-dense-mode") for _obj in self.children)
 
     # This method is on BaseNXOSIntfLine()
     @property
@@ -1539,13 +1539,14 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 
     # This method is on BaseNXOSIntfLine()
     @property
+    @mutation_cached
     @logger.catch(reraise=True)
     def is_switchport(self) -> bool:
         r"""
         :return: Whether the interface is a switchport
         :rtype: bool
         """
-        return any(_obj.text.strip().split()[0] == "switchport" for _obj in self.children)
+        return any(_obj.words[0] == "switchport" for _obj in self.children)
 
     # This method is on BaseNXOSIntfLine()
     @property
@@ -1555,7 +1556,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         :return: Whether the interface is manually configured as an access switchport
         :rtype: bool
         """
-        return any(_obj.text.strip().split()[0:3] == ["switchport", "mode", "access"] for _obj in self.children)
+        return any(_obj.words[0:3] == ("switchport", "mode", "access") for _obj in self.children)
 
     # This method is on BaseNXOSIntfLine()
     @property
@@ -1576,8 +1577,8 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         :rtype: str
         """
         for _obj in self.children:
-            _parts = _obj.text.strip().split()
-            if len(_parts) == 4 and _parts[0:3] == ["switchport", "trunk", "encap"]:
+            _parts = _obj.words
+            if len(_parts) == 4 and _parts[0:3] == ("switchport", "trunk", "encap"):
                 return _parts[3]
         return ""
 
@@ -1589,7 +1590,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         :return: Whether this interface is manually configured as a trunk switchport
         :rtype: bool
         """
-        return any(_obj.text.strip().split()[0:3] == ["switchport", "mode", "trunk"] for _obj in self.children)
+        return any(_obj.words[0:3] == ("switchport", "mode", "trunk") for _obj in self.children)
 
     # This method is on BaseNXOSIntfLine()
     @property
@@ -1604,7 +1605,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         ## IMPORTANT: Cisco NXOS will not enable port-security on the port
         ##    unless 'switch port-security' (with no other options)
         ##    is in the configuration
-        return any(_obj.text.strip().split()[0:2] == ["switchport", "port-security"] for _obj in self.children)
+        return any(_obj.words[0:2] == ("switchport", "port-security") for _obj in self.children)
 
     # This method is on BaseNXOSIntfLine()
     @property
@@ -1616,7 +1617,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         """
         if not self.is_switchport:
             return False
-        return any(_obj.text.strip().split()[0:1] == ["storm-control"] for _obj in self.children)
+        return any(_obj.words[0:1] == ("storm-control",) for _obj in self.children)
 
     # This method is on BaseNXOSIntfLine()
     @property
@@ -1652,8 +1653,8 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
             default_val = -1
 
         for _obj in self.children:
-            if _obj.text.strip().split()[0:3] == ["switchport", "access", "vlan"]:
-                return int(_obj.text.strip().split()[3])
+            if _obj.words[0:3] == ("switchport", "access", "vlan"):
+                return int(_obj.words[3])
         return default_val
 
     # This method is on BaseNXOSIntfLine()
@@ -1664,12 +1665,22 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         :return: A CiscoRange() with the list of allowed vlan numbers (as int).
         :rtype: CiscoRange
         """
+        return self.trunk_vlan_set.as_cisco_range()
+
+    # This method is on BaseNXOSIntfLine()
+    @property
+    @logger.catch(reraise=True)
+    def trunk_vlan_set(self) -> CiscoVlanSet:
+        r"""
+        :return: A CiscoVlanSet() bitset of the allowed vlan numbers; it has the same vlans as ``trunk_vlans_allowed``, with O(1) membership and whole-set union / intersection / difference.
+        :rtype: CiscoVlanSet
+        """
         # The default value for retval...
         if self.is_switchport and not self.has_manual_switch_access:
-            retval = CiscoRange(result_type=int)
+            retval = CiscoVlanSet()
         else:
-            # Default to an empty CiscoRange()
-            return CiscoRange(result_type=int)
+            # Default to an empty CiscoVlanSet()
+            return CiscoVlanSet()
 
         _all_vlans = "1-4094"
         _max_number_vlans = 4094
@@ -1684,13 +1695,13 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         ## Iterate over switchport trunk statements
         for obj in self.children:
 
-            if obj.text.split()[0:5] == [
+            if obj.words[0:5] == (
                 "switchport",
                 "trunk",
                 "allowed",
                 "vlan",
                 "add",
-            ]:
+            ):
                 add_str = obj.re_match_typed(
                     r"^\s+switchport\s+trunk\s+allowed\s+vlan\s+add\s+(\d[\d\-\,\s]*)$",
                     default="_nomatch_",
@@ -1702,13 +1713,13 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
                     else:
                         vdict["add"] += f",{add_str}"
 
-            elif obj.text.split()[0:5] == [
+            elif obj.words[0:5] == (
                 "switchport",
                 "trunk",
                 "allowed",
                 "vlan",
                 "except",
-            ]:
+            ):
                 exc_str = obj.re_match_typed(
                     r"^\s+switchport\s+trunk\s+allowed\s+vlan\s+except\s+(\d[\d\-\,\s]*)$",
                     default="_nomatch_",
@@ -1720,13 +1731,13 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
                     else:
                         vdict["except"] += f",{exc_str}"
 
-            elif obj.text.split()[0:5] == [
+            elif obj.words[0:5] == (
                 "switchport",
                 "trunk",
                 "allowed",
                 "vlan",
                 "remove",
-            ]:
+            ):
                 rem_str = obj.re_match_typed(
                     r"^\s+switchport\s+trunk\s+allowed\s+vlan\s+remove\s+(\d[\d\-\,\s]*)$",
                     default="_nomatch_",
@@ -1738,7 +1749,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
                     else:
                         vdict["remove"] += f",{rem_str}"
 
-            elif obj.text.split()[0:4] == ["switchport", "trunk", "allowed", "vlan"]:
+            elif obj.words[0:4] == ("switchport", "trunk", "allowed", "vlan"):
                 ## For every child object, check whether the vlan list is modified
                 allowed_str = obj.re_match_typed(
                     # switchport trunk allowed vlan
@@ -1764,11 +1775,11 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         if isinstance(vdict["allowed"], str):
             if vdict["allowed"] == _all_vlans:
                 if len(retval) != _max_number_vlans:
-                    retval = CiscoRange(f"1-{MAX_VLAN}", result_type=int)
+                    retval = CiscoVlanSet(f"1-{MAX_VLAN}")
             elif vdict["allowed"] == "":
-                retval = CiscoRange(result_type=int)
+                retval = CiscoVlanSet()
             elif vdict["allowed"] != "_nomatch_":
-                retval = CiscoRange(vdict["allowed"], result_type=int)
+                retval = CiscoVlanSet(vdict["allowed"])
 
         # Inspect vdict keys in a specific order to ensure best results...
         for key in ["allowed", "add", "except", "remove"]:
@@ -1786,22 +1797,22 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
                 ## allowed in the key overrides previous values
                 if key == "allowed":
                     # When considering 'allowed', reset retval to be empty...
-                    retval = CiscoRange(result_type=int)
+                    retval = CiscoVlanSet()
                     if _value.lower() == "none":
                         continue
                     if _value.lower() == "all":
-                        retval = CiscoRange(text=f"1-{MAX_VLAN}", result_type=int)
+                        retval = CiscoVlanSet(f"1-{MAX_VLAN}")
                     elif isinstance(re.search(r"^\d[\d\-\,\s]*", _value), re.Match):
-                        retval = retval + CiscoRange(_value, result_type=int)
+                        retval = retval | CiscoVlanSet(_value)
                     else:
                         error = f"Could not derive a vlan range for {_value}"
                         logger.error(error)
                         raise InvalidCiscoEthernetVlan(error)
 
                 elif key == "add":
-                    retval = retval + CiscoRange(_value, result_type=int)
+                    retval = retval | CiscoVlanSet(_value)
                 elif key == "except" or key == "remove":
-                    retval = retval - CiscoRange(_value, result_type=int)
+                    retval = retval - CiscoVlanSet(_value)
                 else:
                     error = f"{key} is an invalid Cisco switched dot1q ethernet trunk action."
                     logger.error(error)
@@ -1821,13 +1832,13 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         else:
             default_val = -1
         for _obj in self.children:
-            _parts = _obj.text.strip().split()
-            if len(_parts) == 5 and _parts[0:4] == [
+            _parts = _obj.words
+            if len(_parts) == 5 and _parts[0:4] == (
                 "switchport",
                 "trunk",
                 "native",
                 "vlan",
-            ]:
+            ):
                 # return the vlan integer from 'switchport trunk native vlan 911'
                 return int(_parts[4])
         return default_val
@@ -1843,12 +1854,12 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
         :rtype: bool
         """
         for _obj in self.children:
-            _parts = _obj.text.strip().split()
-            if len(_parts) == 3 and _parts[0:3] == [
+            _parts = _obj.words
+            if len(_parts) == 3 and _parts[0:3] == (
                 "no",
                 "cdp",
                 "enable",
-            ]:
+            ):
                 return True
         return False
 
@@ -2144,7 +2155,7 @@ class BaseNXOSIntfLine(NXOSCfgLine, BaseFactoryInterfaceLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class NXOSIntfLine(BaseNXOSIntfLine):
 
     # This method is on NXOSIntfLine()
@@ -2160,18 +2171,6 @@ class NXOSIntfLine(BaseNXOSIntfLine):
         super().__init__(*args, **kwargs)
         self.feature = "interface"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     # This method is on NXOSIntfLine()
     @classmethod
     @logger.catch(reraise=True)
@@ -2184,7 +2183,7 @@ class NXOSIntfLine(BaseNXOSIntfLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class NXOSIntfGlobal(NXOSCfgLine):
     # This method is on NXOSIntGlobal()
     @logger.catch(reraise=True)
@@ -2192,18 +2191,6 @@ class NXOSIntfGlobal(NXOSCfgLine):
         super(NXOSIntfGlobal).__init__(*args, **kwargs)
         self.feature = "interface global"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -2238,24 +2225,12 @@ class NXOSIntfGlobal(NXOSCfgLine):
 ##
 # -------------  NXOS vPC line
 ##
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class NXOSvPCLine(BaseCfgLine):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.feature = "vpc"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     def __repr__(self):
         return f"<{self.classname} # {self.linenum} '{self.vpc_domain_id}'>"
 
@@ -2360,25 +2335,13 @@ class NXOSvPCLine(BaseCfgLine):
 #
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class NXOSAccessLine(NXOSCfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.feature = "access line"
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     def __repr__(self):
         return f"<{self.classname} # {self.linenum} '{self.name}' info: '{self.range_str}'>"
 
@@ -2442,7 +2405,7 @@ class NXOSAccessLine(NXOSCfgLine):
 ##
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class BaseNXOSRouteLine(NXOSCfgLine):
     @logger.catch(reraise=True)
     def __init__(self, *args, **kwargs):
@@ -2545,7 +2508,7 @@ _RE_IPV6_ROUTE = re.compile(
 )
 
 
-@attrs.define(repr=False, slots=False)
+@attrs.define(repr=False, slots=False, eq=False)
 class NXOSRouteLine(NXOSCfgLine):
     _address_family: str = None
     route_info: dict = None
@@ -2570,18 +2533,6 @@ class NXOSRouteLine(NXOSCfgLine):
             else:
                 raise ValueError(f"Could not parse '{self.text}'")
 
-    @logger.catch(reraise=True)
-    def __eq__(self, other):
-        return self.get_unique_identifier() == other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __ne__(self, other):
-        return self.get_unique_identifier() != other.get_unique_identifier()
-
-    @logger.catch(reraise=True)
-    def __hash__(self):
-        return self.get_unique_identifier()
-
     @classmethod
     @logger.catch(reraise=True)
     def is_object_for(cls, all_lines, line, index=None, re=re):
@@ -0,0 +1,52 @@
+r"""perf_append_to_family.py - Time BaseCfgLine().append_to_family() on a large configuration
+
+Build the configuration with ``tests/fixtures/configs/build_big_config.py 1``
+and append a child to every interface; the last timing interleaves each
+append with family_endpoint and last_family_linenum reads.
+
+Usage: python perf_append_to_family.py [count]
+"""
+
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from loguru import logger  # noqa: E402
+
+from ciscoconfparse2 import CiscoConfParse  # noqa: E402
+
+BUILD_SCRIPT = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "configs", "build_big_config.py")
+
+logger.remove()
+
+config = subprocess.run([sys.executable, BUILD_SCRIPT, "1"], capture_output=True, check=True, text=True).stdout.splitlines()
+
+start = perf_counter()
+parse = CiscoConfParse(config, auto_commit=False)
+print(f"PARSE {len(config)} lines", round(perf_counter() - start, 3))
+
+interfaces = parse.find_objects(r"^interface")
+if len(sys.argv) > 1:
+    interfaces = interfaces[: int(sys.argv[1])]
+
+start = perf_counter()
+for intf in interfaces:
+    intf.append_to_family(" carrier-delay msec 500", auto_indent=None)
+print(f"APPEND_TO_FAMILY {len(interfaces)} interfaces", round(perf_counter() - start, 3))
+
+start = perf_counter()
+for intf in interfaces:
+    intf.family_endpoint
+    intf.last_family_linenum
+print(f"FAMILY_ENDPOINT / LAST_FAMILY_LINENUM {len(interfaces)} interfaces", round(perf_counter() - start, 3))
+
+# Interleave edits with reads; each read follows a change to the ConfigList()
+start = perf_counter()
+for intf in interfaces:
+    intf.append_to_family(" load-interval 30", auto_indent=None)
+    intf.family_endpoint
+    intf.last_family_linenum
+print(f"APPEND_TO_FAMILY + FAMILY_ENDPOINT {len(interfaces)} interfaces", round(perf_counter() - start, 3))
@@ -0,0 +1,46 @@
+r"""perf_factory_parse.py - Compare CiscoConfParse(factory=True) and factory=False parse times
+
+Parse every ios, nxos, iosxr, asa and junos fixture configuration, and the large
+configuration built by ``tests/fixtures/configs/build_big_config.py``.
+
+Usage: python perf_factory_parse.py [iterations]
+"""
+
+import glob
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from loguru import logger  # noqa: E402
+
+from ciscoconfparse2 import CiscoConfParse  # noqa: E402
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "configs")
+BUILD_SCRIPT = os.path.join(CONFIG_DIR, "build_big_config.py")
+
+logger.remove()
+
+iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+configs = []
+for syntax in ("ios", "nxos", "iosxr", "asa", "junos"):
+    for filepath in sorted(glob.glob(os.path.join(CONFIG_DIR, f"sample_*.{syntax}"))):
+        with open(filepath, encoding="utf-8") as fh:
+            configs.append((os.path.basename(filepath), syntax, fh.read().splitlines()))
+big_config = subprocess.run([sys.executable, BUILD_SCRIPT, "1"], capture_output=True, check=True, text=True).stdout.splitlines()
+configs.append(("build_big_config.py", "ios", big_config))
+
+for factory in (False, True):
+    total = 0.0
+    for name, syntax, config in configs:
+        start = perf_counter()
+        for _ in range(iterations):
+            CiscoConfParse(config, syntax=syntax, factory=factory)
+        elapsed = perf_counter() - start
+        total += elapsed
+        if name == "build_big_config.py":
+            print(f"factory={factory} {name} {len(config)} lines", round(elapsed / iterations, 4))
+    print(f"factory={factory} all configs", round(total / iterations, 4))
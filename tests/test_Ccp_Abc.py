@@ -1,9 +1,11 @@
+import re
+import subprocess
 import sys
 
 import pytest
 
-from ciscoconfparse2.ccp_abc import BaseCfgLine, get_brace_termination
-from ciscoconfparse2.ccp_util import IPv6Obj
+from ciscoconfparse2.ccp_abc import REGEX_REGISTRY, BaseCfgLine, ConfigLinesView, RegexRegistry, get_brace_termination
+from ciscoconfparse2.ccp_util import IPv4Obj, IPv6Obj
 from ciscoconfparse2.ciscoconfparse2 import CiscoConfParse
 from ciscoconfparse2.errors import ConfigListItemDoesNotExist
 from ciscoconfparse2.models_cisco import IOSCfgLine
@@ -261,6 +263,37 @@ def testVal_BaseCfgLine_family_endpoint_01():
     assert obj01.family_endpoint == 3
 
 
+def testVal_BaseCfgLine_family_cache_01():
+    """Test that BaseCfgLine().all_children, all_parents and lineage are cached until the configuration changes"""
+    parse = CiscoConfParse(
+        [
+            "interface GigabitEthernet1/1",
+            " ip address 192.0.2.1 255.255.255.0",
+            " service-policy input QOS",
+            "!",
+        ],
+        syntax="ios",
+        auto_commit=False,
+    )
+    intf = parse.objs[0]
+    qos = parse.objs[2]
+
+    assert [obj.text for obj in intf.all_children] == [" ip address 192.0.2.1 255.255.255.0", " service-policy input QOS"]
+    assert intf._value_cache["all_children"][1] == intf.all_children
+    # Modifying the returned list does not modify the cache
+    intf.all_children.clear()
+    assert len(intf.all_children) == 2
+
+    assert qos.all_parents == [intf]
+    assert qos.lineage == [intf, qos]
+
+    # Structural changes drop the cached family views
+    qos.append_to_family("  class-default", indent=2)
+    assert [obj.text for obj in intf.all_children][-1] == "  class-default"
+    assert qos.lineage == [intf, qos, parse.objs[3]]
+    assert parse.objs[3].all_parents == [intf, qos]
+
+
 def testVal_BaseCfgLine_has_child_with_01():
     """Test BaseCfgLine().has_child_with()"""
     parse = CiscoConfParse(
@@ -1466,3 +1499,206 @@ def testVal_BaseCfgLine_indent_01():
     assert uut_child.text == " some-random-feature"
     assert len(uut_parent.children) == 2
     assert len(uut_parent.all_children) == 2
+
+
+def testVal_BaseCfgLine_unique_id_01():
+    """Test that BaseCfgLine().get_unique_identifier() is cached and cleared when text or linenum changes"""
+    parse = CiscoConfParse(
+        [
+            "interface GigabitEthernet1/1",
+            " ip address 192.0.2.1 255.255.255.0",
+            "interface GigabitEthernet1/2",
+            " shutdown",
+        ],
+        syntax="ios",
+        auto_commit=False,
+    )
+    intf = parse.objs[2]
+    uid = intf.get_unique_identifier()
+    assert uid == hash(2) * hash("interface GigabitEthernet1/2")
+    assert intf._unique_id == uid
+    assert intf == parse.objs[2]
+    assert intf != "interface GigabitEthernet1/2"
+    assert intf != None  # noqa: E711
+
+    # Changing the text clears the cached value
+    intf.text = "interface GigabitEthernet1/3"
+    assert intf._unique_id is None
+    assert intf.get_unique_identifier() == hash(2) * hash("interface GigabitEthernet1/3")
+
+    # Renumbering clears the cached value
+    parse.insert(0, "hostname Router01")
+    assert intf.get_unique_identifier() == hash(3) * hash("interface GigabitEthernet1/3")
+    assert len(set(parse.objs) & {intf}) == 1
+
+
+def testVal_BaseCfgLine_indent_words_01():
+    """Test that BaseCfgLine().indent and BaseCfgLine().words are updated when text or indent changes"""
+    parse = CiscoConfParse(
+        [
+            "interface GigabitEthernet1/1",
+            " switchport trunk allowed vlan 1-5",
+        ],
+        syntax="ios",
+        auto_commit=False,
+    )
+    obj = parse.objs[1]
+    assert obj.indent == 1
+    assert obj._words is None
+    assert obj.words == ("switchport", "trunk", "allowed", "vlan", "1-5")
+    assert obj.words is obj.words
+
+    obj.text = "   switchport trunk native vlan 3"
+    assert obj.indent == 3
+    assert obj.words == ("switchport", "trunk", "native", "vlan", "3")
+
+    obj.indent = 2
+    assert obj.text == "  switchport trunk native vlan 3"
+    assert obj.indent == 2
+    assert obj.words == ("switchport", "trunk", "native", "vlan", "3")
+
+
+def testVal_BaseCfgLine_all_lines_01():
+    """Test that BaseCfgLine().all_lines is a view of the ConfigList() text, and that objects do not store the text list"""
+    config = [
+        "interface GigabitEthernet1/1",
+        " shutdown",
+    ]
+    parse = CiscoConfParse(config, syntax="ios", auto_commit=False)
+    obj = parse.objs[1]
+    assert "all_lines" not in obj.__dict__
+    assert isinstance(obj.all_lines, ConfigLinesView)
+    assert list(obj.all_lines) == config
+    assert obj.all_text[0:1] == ["interface GigabitEthernet1/1"]
+
+    # The view follows changes to the configuration
+    parse.objs[0].text = "interface GigabitEthernet1/2"
+    assert obj.all_lines[0] == "interface GigabitEthernet1/2"
+
+    assert IOSCfgLine(all_lines=config, line="hostname Router01").all_lines is None
+
+
+def testVal_BaseCfgLine_family_endpoint_02():
+    """Test BaseCfgLine().family_endpoint and BaseCfgLine().last_family_linenum as the configuration changes"""
+    config = [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        "interface GigabitEthernet1/2",
+        " shutdown",
+        "end",
+    ]
+    parse = CiscoConfParse(config, syntax="ios", auto_commit=False)
+    intf1, intf2 = parse.objs[0], parse.objs[2]
+    assert intf1.family_endpoint == 1
+    assert intf1.last_family_linenum == 4
+    assert parse.objs[1].last_family_linenum == 3
+
+    intf1.append_to_family(" no shutdown", auto_indent=None)
+    assert intf1.family_endpoint == 2
+    assert intf2.family_endpoint == 4
+
+    # Changing the indent drops the family index
+    assert parse.objs.family_index is not None
+    parse.objs[1].indent = 2
+    assert parse.objs.family_index is None
+    assert parse.objs[1].last_family_linenum == 1
+
+
+def testVal_BaseCfgLine_family_endpoint_03():
+    """Test that inserting and deleting lines without children updates the family index instead of dropping it"""
+    config = [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        "interface GigabitEthernet1/2",
+        " shutdown",
+        "end",
+    ]
+    parse = CiscoConfParse(config, syntax="ios", auto_commit=False)
+    intf1, intf2 = parse.objs[0], parse.objs[2]
+    assert intf1.family_endpoint == 1
+    family_index = parse.objs.family_index
+
+    for count in range(1, 4):
+        intf1.append_to_family(f" description {count}", auto_indent=None)
+        # The same index dicts are updated in place, without renumbering
+        assert parse.objs.family_index[1] is family_index[1]
+        assert intf1.family_endpoint == 1 + count
+        assert intf2.family_endpoint == 3 + count
+        assert parse.objs[1].last_family_linenum == 3 + count
+        assert parse.objs.linenum_counter != parse.objs.mutation_counter
+
+    del parse.objs[4]
+    assert parse.objs.family_index[1] is family_index[1]
+    assert intf1.family_endpoint == 3
+    assert intf2.family_endpoint == 5
+    assert intf1.family_endpoint == parse.objs.family_end(intf1).linenum
+
+
+def testVal_BaseCfgLine_typed_cache_01():
+    """Test that BaseCfgLine().re_match_typed() caches typed values until the text changes"""
+    config = [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+    ]
+    parse = CiscoConfParse(config, syntax="ios", factory=True, auto_commit=False)
+    intf, addr = parse.objs[0], parse.objs[1]
+    assert intf.ipv4_addr_object == IPv4Obj("192.0.2.1/24")
+    assert intf.ipv4_addr_object is not intf.ipv4_addr_object
+    assert addr.re_match_typed(r"address\s+(\S+)", result_type=IPv4Obj) == addr.re_match_typed(r"address\s+(\S+)", result_type=IPv4Obj)
+    # Modifying a returned value does not change the cached value
+    addr.re_match_typed(r"address\s+(\S+)", result_type=IPv4Obj).masklen = 8
+    assert addr.re_match_typed(r"address\s+(\S+)", result_type=IPv4Obj) == IPv4Obj("192.0.2.1/32")
+    assert addr.re_match_typed(r"^(no)?\s+ip", result_type=str, default="x") == "x"
+    assert addr.re_match_typed(r"foo(\S+)", result_type=int, default=-1) == -1
+
+    # Changing the text clears the cache
+    addr.text = " ip address 192.0.2.2 255.255.255.0"
+    assert intf.ipv4_addr_object == IPv4Obj("192.0.2.2/24")
+    assert intf.re_list_iter_typed(r"address\s+(\S+)\s", result_type=IPv4Obj) == [IPv4Obj("192.0.2.2/32")]
+
+
+def testVal_BaseCfgLine_regex_registry_01():
+    """Test that typed searches compile string regexes once in REGEX_REGISTRY, and use re.Pattern regexes as-is"""
+    config = [
+        "interface GigabitEthernet1/1",
+        " mtu 9000",
+    ]
+    parse = CiscoConfParse(config, syntax="ios", factory=True)
+    intf = parse.objs[0]
+    assert intf.manual_mtu == 9000
+    assert isinstance(REGEX_REGISTRY[r"^\s*mtu\s+(\d+)$"], re.Pattern)
+
+    regex = re.compile(r"^\s+mtu\s+(?P<mtu>\d+)")
+    assert intf.re_match_iter_typed(regex, result_type=int) == 9000
+    assert intf.re_match_iter_typed(regex, groupdict={"mtu": int}) == {"mtu": 9000}
+    assert intf.re_list_iter_typed(regex, result_type=int) == [9000]
+    assert regex not in REGEX_REGISTRY
+
+    registry = RegexRegistry(maxsize=2)
+    assert registry["a"] is registry["a"]
+    registry["b"]
+    registry["c"]
+    assert list(registry) == ["c"]
+
+
+def testVal_import_time_budget_01():
+    """Test that import ciscoconfparse2 does not compile any REGEX_REGISTRY regexes, and the modules which hold the model regexes stay within their share of the import time"""
+    script = "import ciscoconfparse2; from ciscoconfparse2.ccp_abc import REGEX_REGISTRY; print(len(REGEX_REGISTRY))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", script], capture_output=True, check=True, text=True, cwd="..")
+    assert int(result.stdout) == 0
+
+    # 'import time: <self us> | <cumulative us> | <module>'
+    model_us, total_us = 0, 0
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        module = fields[2].strip()
+        if module == "ciscoconfparse2":
+            total_us = int(fields[1])
+        elif module == "ciscoconfparse2.ccp_abc" or module.startswith("ciscoconfparse2.models_"):
+            model_us += int(fields[0])
+    assert total_us > 0
+    # Compiling the model regexes at import took about 12% of the import
+    #     time; with lazy compilation it is about 7%
+    assert model_us / total_us < 0.10
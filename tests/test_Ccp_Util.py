@@ -49,16 +49,25 @@ from macaddress import EUI48, EUI64, MAC, OUI
 from ciscoconfparse2.ccp_util import (
     _RGX_IPV4ADDR,
     _RGX_IPV6ADDR,
+    CISCO_INTERFACE_ABBREVIATIONS,
+    IOS_INTERFACE_NAME_CACHE,
+    IOSXR_INTERFACE_NAME_CACHE,
     CiscoIOSInterface,
+    CiscoIOSXRInterface,
     CiscoRange,
+    CiscoVlanSet,
     EUI64Obj,
+    IPPrefixTrie,
     IPv4Obj,
     IPv6Obj,
     L4Object,
     MACObj,
+    StaticRoute,
+    canonical_interface_name,
     collapse_addresses as ccp_collapse_addresses,
     ip_factory,
 )
+from ciscoconfparse2.errors import InvalidCiscoInterface
 
 sys.path.insert(0, "..")
 
@@ -979,6 +988,72 @@ def test_CiscoIOSInterface_10():
     assert uut.interface_class == "multipoint"
 
 
+def test_CiscoIOSInterface_name_cache_01():
+    """Check that CiscoIOSInterface() reuses the parsed components of a name, and that the cached components are not shared"""
+    IOS_INTERFACE_NAME_CACHE.clear()
+    uut1 = CiscoIOSInterface(" Serial1/3/42.5:9 multipoint")
+    assert "Serial1/3/42.5:9 multipoint" in IOS_INTERFACE_NAME_CACHE
+    uut2 = CiscoIOSInterface("Serial1/3/42.5:9 multipoint")
+    assert uut1 == uut2
+    assert uut2.as_dict() == uut1.as_dict()
+    uut2.port = 41
+    assert CiscoIOSInterface("Serial1/3/42.5:9 multipoint").port == 42
+    assert uut1.port == 42
+
+    with pytest.raises(InvalidCiscoInterface):
+        CiscoIOSInterface("Serial1/1,2")
+    assert "Serial1/1,2" not in IOS_INTERFACE_NAME_CACHE
+
+
+def test_CiscoIOSInterface_name_cache_02():
+    """Check that an interface with an interface_class does not use, or fill, the name cache; a name without a class takes the class of that interface"""
+    for interface_type, name_cache, name in [
+        (CiscoIOSInterface, IOS_INTERFACE_NAME_CACHE, "Serial1/1"),
+        (CiscoIOSXRInterface, IOSXR_INTERFACE_NAME_CACHE, "GigabitEthernet0/0/0/1"),
+    ]:
+        name_cache.clear()
+        uut = interface_type("Serial1/0" if interface_type is CiscoIOSInterface else "GigabitEthernet0/0/0/0")
+        assert uut.interface_class is None
+        assert len(name_cache) == 1
+
+        # No interface_class: the cache is used
+        assert uut.parse_single_interface(name)["interface_class"] is None
+        assert name in name_cache
+
+        # With an interface_class: the cache is bypassed
+        name_cache.clear()
+        uut.interface_class = "point-to-point"
+        assert uut.parse_single_interface(name)["interface_class"] == "point-to-point"
+        assert name not in name_cache
+        assert interface_type(name).interface_class is None
+
+
+@pytest.mark.parametrize(
+    "interface_name, result_correct",
+    [
+        ("Gi1/0/1", "GigabitEthernet1/0/1"),
+        ("gig 1/0/1", "GigabitEthernet1/0/1"),
+        ("GigabitEthernet1/0/1", "GigabitEthernet1/0/1"),
+        ("Te1/1/4.100", "TenGigabitEthernet1/1/4.100"),
+        ("Twe1/0/1", "TwentyFiveGigE1/0/1"),
+        ("Tw1/0/1", "TwoGigabitEthernet1/0/1"),
+        ("Eth1/49", "Ethernet1/49"),
+        ("Po10", "Port-channel10"),
+        ("Vl10", "Vlan10"),
+        ("Se0/0/0:1", "Serial0/0/0:1"),
+        ("Serial1/0 point-to-point", "Serial1/0 point-to-point"),
+        ("Fo1/1", "FortyGigabitEthernet1/1"),
+        ("F1/1", "F1/1"),
+        ("Foo1/1", "Foo1/1"),
+        ("Vlan", "Vlan"),
+    ],
+)
+def test_canonical_interface_name_01(interface_name, result_correct):
+    """Check that canonical_interface_name() expands interface name abbreviations, and leaves unknown prefixes alone"""
+    assert canonical_interface_name(interface_name) == result_correct
+    assert CISCO_INTERFACE_ABBREVIATIONS["gi"] == "GigabitEthernet"
+
+
 def test_CiscoRange_01():
     """Basic vlan range test"""
     result_correct = {1, 2, 3}
@@ -1255,6 +1330,81 @@ def test_CiscoRange_insert_03():
     assert uut.data[-1] == CiscoIOSInterface("Ethernet1/100")
 
 
+def test_CiscoVlanSet_01():
+    """Check that CiscoVlanSet() parses text exactly like CiscoRange(result_type=int)"""
+    uut_str = "1,2, 3, 6, 7,  8 , 9, 911,4000-4094"
+    uut = CiscoVlanSet(uut_str)
+    assert uut.as_list(result_type=int) == CiscoRange(uut_str, result_type=int).as_list(result_type=int)
+    assert uut.as_compressed_str() == "1-3,6-9,911,4000-4094"
+    assert uut == CiscoRange(uut_str, result_type=int)
+    assert CiscoRange(uut_str, result_type=int) == uut
+
+
+def test_CiscoVlanSet_02():
+    """Check CiscoVlanSet() membership and set operations"""
+    uut = CiscoVlanSet("1-4094") - CiscoVlanSet("2-3000")
+    assert len(uut) == 1095
+    assert 1 in uut
+    assert 2 not in uut
+    uut.add(5)
+    uut.discard(4094)
+    assert uut.as_compressed_str() == "1,5,3001-4093"
+    assert (uut & CiscoVlanSet("1-10")).as_set(result_type=int) == {1, 5}
+    assert (CiscoVlanSet("1,3") | CiscoVlanSet("2")).as_compressed_str() == "1-3"
+    assert CiscoVlanSet("3,1").as_cisco_range().data == [1, 3]
+
+
+def test_CiscoVlanSet_03():
+    """Check that CiscoVlanSet() compares with vlan CiscoRange() instances, and is not equal to interface CiscoRange() instances"""
+    assert CiscoVlanSet("1-3") == CiscoRange("1-3", result_type=int)
+    assert CiscoRange("1-3", result_type=int) == CiscoVlanSet("1-3")
+    assert CiscoVlanSet("") == CiscoRange("", result_type=int)
+    assert (CiscoVlanSet("1-3") == CiscoRange("Gi1/1-3")) is False
+    assert (CiscoRange("Gi1/1-3") == CiscoVlanSet("1-3")) is False
+    assert CiscoVlanSet("1-3") != CiscoRange("Gi1/1-3")
+    with pytest.raises(TypeError):
+        CiscoVlanSet("1-3") | CiscoRange("Gi1/1-3")
+
+
+def test_IPPrefixTrie_01():
+    """Check IPPrefixTrie() longest-prefix match for IPv4Obj, IPv6Obj and string prefixes"""
+    uut = IPPrefixTrie([IPv4Obj("10.0.0.0/8"), "10.1.0.0/16", IPv6Obj("2001:db8::/32")])
+    assert len(uut) == 3
+    assert uut.longest_match("10.1.2.3") == IPv4Obj("10.1.0.0/16")
+    assert uut.longest_match(IPv4Obj("10.2.0.1/24")) == IPv4Obj("10.0.0.0/8")
+    assert uut.longest_match("2001:db8:1::1") == IPv6Obj("2001:db8::/32")
+    assert uut.longest_match("192.0.2.1") is None
+    # A prefix shorter than the stored prefixes is not contained in them
+    assert "10.0.0.0/7" not in uut
+    uut.add("0.0.0.0/0", value="default")
+    assert uut.lookup("192.0.2.1") == "default"
+    assert uut.lookup("2001:db9::1", default="none") == "none"
+    assert [prefix.as_cidr_net for prefix in uut] == ["0.0.0.0/0", "10.0.0.0/8", "10.1.0.0/16", "2001:db8::/32"]
+
+
+def test_IPPrefixTrie_02():
+    """Check that IPPrefixTrie() membership matches IPv4Obj() and IPv6Obj() __contains__()"""
+    subnets = [IPv4Obj("172.16.0.0/12"), IPv4Obj("172.16.1.0/30"), IPv4Obj("192.0.2.128/25"), IPv6Obj("fe80::/10")]
+    uut = IPPrefixTrie(subnets)
+    for addr_str in ["172.16.1.2", "172.16.1.0/24", "172.15.0.1", "192.0.2.200/26", "192.0.2.0/24", "fe80::1/64", "2001:db8::1"]:
+        addr = IPv6Obj(addr_str) if ":" in addr_str else IPv4Obj(addr_str)
+        expected = any(addr in subnet for subnet in subnets if subnet.version == addr.version)
+        assert (addr in uut) is expected, addr_str
+
+
+def test_StaticRoute_01():
+    """Check StaticRoute().from_words() with IOS, NXOS, IOS-XR, ASA and Junos word order"""
+    uut = StaticRoute.from_words("10.0.0.0 255.0.0.0 Serial0 192.0.2.1 200 name WAN permanent".split())
+    assert (uut.prefix, uut.next_hop_interface, uut.next_hop_addr, uut.admin_distance, uut.name, uut.permanent) == (IPv4Obj("10.0.0.0/8"), "Serial0", "192.0.2.1", 200, "WAN", True)
+    uut = StaticRoute.from_words("192.0.2.0/24 port-channel80.1 10.10.200.134 vrf BLUE tag 5".split(), vrf="RED")
+    assert (uut.vrf, uut.next_hop_vrf, uut.tag) == ("RED", "BLUE", 5)
+    uut = StaticRoute.from_words("INSIDE 10.0.0.0 255.0.0.0 192.0.2.2 1 track 3".split(), interface_first=True)
+    assert (uut.next_hop_interface, uut.next_hop_addr, uut.track) == ("INSIDE", "192.0.2.2", "3")
+    uut = StaticRoute.from_words("0.0.0.0/0 next-hop 172.16.12.1 preference 200".split())
+    assert (uut.next_hop_addr, uut.admin_distance) == ("172.16.12.1", 200)
+    assert StaticRoute.from_words("static bfd GigabitEthernet0/1 192.0.2.1".split()) is None
+
+
 # pragma warning restore S1192
 # pragma warning restore S1313
 # pragma warning restore S5843
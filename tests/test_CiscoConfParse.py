@@ -19,6 +19,8 @@ If you need to contact the author, you can do so by emailing:
 mike [~at~] pennington [.dot.] net
 """
 
+import gzip
+import io
 import os
 import pickle
 from collections.abc import Iterator
@@ -34,15 +36,20 @@ from passlib.hash import cisco_type7
 from ciscoconfparse2.ccp_abc import BaseCfgLine
 from ciscoconfparse2.ccp_util import IPv4Obj
 from ciscoconfparse2.ciscoconfparse2 import (
+    ALL_ASA_FACTORY_CLASSES,
+    ALL_IOS_FACTORY_CLASSES,
+    ALL_IOSXR_FACTORY_CLASSES,
     Branch,
     CiscoConfParse,
     CiscoPassword,
+    ConfigBuilder,
     ConfigList,
     Diff,
     IOSCfgLine,
     IOSIntfLine,
+    config_line_factory,
 )
-from ciscoconfparse2.errors import InvalidParameters
+from ciscoconfparse2.errors import InvalidParameters, ReadOnlyConfiguration
 from ciscoconfparse2.models_junos import JunosCfgLine
 
 THIS_TEST_PATH = Path(Path(__file__).resolve()).parent
@@ -60,6 +67,39 @@ def testValues_save_as_01():
     Path(filename).unlink()
 
 
+def testValues_save_as_02(tmp_path):
+    """Ensure that save_as() writes gzip files and does not leave a partial file if writing fails"""
+
+    config = ["!", "hostname Foo", "end"]
+    parse = CiscoConfParse(config)
+
+    filepath = tmp_path / "Foo.conf.gz"
+    assert parse.save_as(filepath, fsync="directory") is True
+    with gzip.open(filepath, "rt") as fh:
+        assert fh.read().splitlines() == config
+
+    filepath = tmp_path / "Foo.conf"
+    parse.save_as(filepath, fsync="none")
+    with patch.object(CiscoConfParse, "write_to", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            CiscoConfParse(["hostname Bar"]).save_as(filepath)
+
+    # The original file is intact, and the temporary file was removed
+    assert filepath.read_text().splitlines() == config
+    assert sorted(ii.name for ii in tmp_path.iterdir()) == ["Foo.conf", "Foo.conf.gz"]
+
+
+def testValues_write_to_01():
+    """Ensure that write_to() streams the configuration to a text stream"""
+
+    config = ["!", "interface GigabitEthernet1/1", " shutdown", "end"]
+    parse = CiscoConfParse(config)
+
+    stream = io.StringIO()
+    assert parse.write_to(stream) == 4
+    assert stream.getvalue() == "!\ninterface GigabitEthernet1/1\n shutdown\nend\n"
+
+
 def testValues_pickle_01():
     """Ensure that pickle() accepts a CiscoConfParse() instance and saves a file"""
 
@@ -3648,6 +3688,521 @@ def testValues_ConfigList_delete01():
     assert len(parse_uut.objs) == 1
 
 
+def testValues_ConfigList_insert_wo_commit_01():
+    """
+    Test that ConfigList() inserts without a commit keep object identity, lazily renumber lines and link parents / children
+    """
+    config = [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        "!",
+        "interface GigabitEthernet1/2",
+        " ip address 192.0.2.5 255.255.255.0",
+        "!",
+    ]
+    parse = CiscoConfParse(config, auto_commit=False)
+    intf = parse.find_objects(r"GigabitEthernet1/2")[0]
+
+    for idx in range(200):
+        intf.insert_before(f"hostname foo{idx}")
+    intf.append_to_family(" description Uplink")
+
+    # The original object is still in the ConfigList()...
+    assert parse.config_objs[203] is intf
+    assert intf.linenum == 203
+    assert [obj.linenum for obj in parse.config_objs] == list(range(len(parse.config_objs)))
+    assert [obj.text for obj in intf.children] == [" ip address 192.0.2.5 255.255.255.0", " description Uplink"]
+    assert sorted(parse.config_objs, reverse=True) == list(reversed(parse.config_objs))
+
+    # Adding a parent line adopts the following indented lines...
+    parse.config_objs[1].insert_before("interface GigabitEthernet1/0")
+    assert [obj.text for obj in parse.config_objs[1].children] == [" ip address 192.0.2.1 255.255.255.0"]
+    assert parse.config_objs[0].children == []
+
+
+def testValues_ConfigList_delete_wo_commit_01():
+    """
+    Test that ConfigList() deletes without a commit renumber lines and relink orphaned children
+    """
+    config = [
+        "router bgp 65000",
+        " address-family ipv4",
+        "  network 192.0.2.0/24",
+        " neighbor 192.0.2.2 remote-as 65001",
+        "!",
+    ]
+    parse = CiscoConfParse(config, auto_commit=False)
+    bgp = parse.config_objs[0]
+
+    # Delete ' address-family ipv4' without deleting its child...
+    del parse.config_objs[1]
+
+    assert parse.get_text() == [
+        "router bgp 65000",
+        "  network 192.0.2.0/24",
+        " neighbor 192.0.2.2 remote-as 65001",
+        "!",
+    ]
+    assert parse.config_objs[0] is bgp
+    assert [obj.text for obj in bgp.children] == ["  network 192.0.2.0/24", " neighbor 192.0.2.2 remote-as 65001"]
+    assert parse.config_objs[2].linenum == 2
+
+
+def testValues_ConfigList_delete_slice_01():
+    """
+    Test that ConfigList() deletes slices of lines, and one undo() restores all of them
+    """
+    config = [
+        "hostname Router01",
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        " shutdown",
+        "interface GigabitEthernet1/2",
+        " shutdown",
+    ]
+    parse = CiscoConfParse(config, auto_commit=False)
+    del parse.config_objs[0:1]
+    assert parse.get_text() == config[1:]
+
+    del parse.config_objs[1:5:2]
+    assert parse.get_text() == [
+        "interface GigabitEthernet1/1",
+        " shutdown",
+        " shutdown",
+    ]
+    assert [obj.text for obj in parse.config_objs[0].children] == [" shutdown", " shutdown"]
+    assert [obj.linenum for obj in parse.config_objs] == [0, 1, 2]
+
+    del parse.config_objs[-1:]
+    del parse.config_objs[5:]
+    assert parse.get_text() == ["interface GigabitEthernet1/1", " shutdown"]
+
+    # Each slice is one undo step
+    assert parse.undo(2) == 2
+    assert parse.get_text() == config[1:]
+    assert parse.undo() == 1
+    assert parse.get_text() == config
+
+
+def testValues_CiscoConfParse_snapshot_01():
+    """
+    Test that CiscoConfParse().snapshot() shares unchanged objects and only copies the families it modifies
+    """
+    config = [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        "!",
+        "interface GigabitEthernet1/2",
+        " shutdown",
+        "!",
+    ]
+    parse = CiscoConfParse(config)
+    snap = parse.snapshot()
+
+    # All objects are shared until the snapshot is modified...
+    assert all(aa is bb for aa, bb in zip(snap.config_objs.data, parse.config_objs.data))
+
+    intf = snap.find_objects(r"^interface GigabitEthernet1/2")[0]
+    intf.append_to_family(" description Spare")
+    intf.children[0].delete()
+
+    assert snap.get_text() == [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        "!",
+        "interface GigabitEthernet1/2",
+        " description Spare",
+        "!",
+    ]
+    assert parse.get_text() == config
+    assert [obj.text for obj in parse.find_objects(r"^interface GigabitEthernet1/2")[0].children] == [" shutdown"]
+
+    # Families which were not modified are still shared...
+    assert snap.config_objs.data[1] is parse.config_objs.data[1]
+    assert snap.config_objs.data[3] is not parse.config_objs.data[3]
+    assert [obj.linenum for obj in snap.find_objects(r"^interface")] == [0, 3]
+
+
+def testValues_CiscoConfParse_snapshot_02():
+    """
+    Test that changes to the original CiscoConfParse() are not visible in a snapshot
+    """
+    config = [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        "!",
+    ]
+    parse = CiscoConfParse(config, auto_commit=False)
+    addr = parse.find_objects(r"ip address")[0]
+    snap = parse.snapshot()
+
+    addr.text = " ip address 192.0.2.2 255.255.255.0"
+    parse.find_objects(r"^interface")[0].append_to_family(" shutdown")
+
+    assert parse.get_text() == [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.2 255.255.255.0",
+        " shutdown",
+        "!",
+    ]
+    assert snap.get_text() == config
+    assert [obj.text for obj in snap.find_objects(r"^interface")[0].children] == [" ip address 192.0.2.1 255.255.255.0"]
+
+
+def testValues_CiscoConfParse_undo_redo_01():
+    """
+    Test that CiscoConfParse().undo() and redo() replay inserts, deletes and text changes
+    """
+    config = [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        " shutdown",
+        "!",
+    ]
+    parse = CiscoConfParse(config)
+    intf = parse.find_objects(r"^interface")[0]
+
+    intf.append_to_family(" description Uplink")
+    parse.find_objects(r"shutdown")[0].delete()
+    parse.find_objects(r"ip address")[0].text = " ip address 192.0.2.2 255.255.255.0"
+    final_text = parse.get_text()
+
+    assert parse.undo() == 1
+    assert parse.get_text()[1] == " ip address 192.0.2.1 255.255.255.0"
+    assert parse.undo(5) == 2
+    assert parse.get_text() == config
+    assert parse.undo() == 0
+
+    intf = parse.find_objects(r"^interface")[0]
+    assert [obj.text for obj in intf.children] == [" ip address 192.0.2.1 255.255.255.0", " shutdown"]
+
+    assert parse.redo(3) == 3
+    assert parse.get_text() == final_text
+    assert parse.redo() == 0
+
+
+def testValues_ConfigList_undo_redo_01():
+    """
+    Test that ConfigList().undo() restores a deleted family and a new edit clears the redo journal
+    """
+    config = [
+        "router bgp 65000",
+        " address-family ipv4",
+        "  network 192.0.2.0 mask 255.255.255.0",
+        "!",
+    ]
+    parse = CiscoConfParse(config, auto_commit=False)
+    bgp = parse.config_objs[0]
+
+    parse.config_objs[1].delete()
+    assert parse.config_objs.undo() == 1
+    assert parse.get_text() == config
+    assert [obj.text for obj in bgp.all_children] == config[1:3]
+    assert parse.config_objs[2].parent is parse.config_objs[1]
+
+    parse.config_objs.redo()
+    parse.config_objs.undo()
+    bgp.append_to_family(" bgp log-neighbor-changes")
+    assert parse.config_objs.redo() == 0
+    assert parse.config_objs.undo() == 1
+    assert parse.get_text() == config
+
+    # Operations which rebuild the whole ConfigList() clear the journal
+    parse.config_objs.append("end")
+    parse.config_objs.reverse()
+    assert parse.config_objs.undo() == 0
+
+
+def testValues_ConfigBuilder_01():
+    """
+    Test that ConfigBuilder() builds nested blocks and parses them into a CiscoConfParse() instance
+    """
+    builder = ConfigBuilder(syntax="ios")
+    builder.line("hostname Router1")
+    builder.block(
+        "router bgp 65000",
+        [
+            "bgp router-id 192.0.2.1",
+            ("address-family ipv4", ["network 192.0.2.0 mask 255.255.255.0"]),
+        ],
+    )
+    builder.line("!")
+
+    assert len(builder) == 6
+    parse = builder.build()
+    assert parse.get_text() == [
+        "hostname Router1",
+        "router bgp 65000",
+        " bgp router-id 192.0.2.1",
+        " address-family ipv4",
+        "  network 192.0.2.0 mask 255.255.255.0",
+        "!",
+    ]
+    bgp = parse.find_objects(r"^router bgp")[0]
+    assert [obj.text for obj in bgp.all_children] == parse.get_text()[2:5]
+    assert parse.config_objs[4].parent is parse.config_objs[3]
+
+
+def testValues_ConfigBuilder_02():
+    """
+    Test that ConfigBuilder() rejects brace syntax and invalid block children
+    """
+    with pytest.raises(NotImplementedError):
+        ConfigBuilder(syntax="junos")
+
+    builder = ConfigBuilder(indent_width=2)
+    with pytest.raises(InvalidParameters):
+        builder.block("interface Ethernet0/0", [None])
+
+    builder.block("interface Ethernet0/1", ["shutdown"])
+    assert builder.build().get_text() == ["interface Ethernet0/1", "  shutdown"]
+
+
+def testValues_CiscoConfParse_intern_table_01():
+    """Test that CiscoConfParse() instances which share an intern_table share identical configuration text"""
+    intern_table = {}
+    parse_01 = CiscoConfParse(["interface GigabitEthernet1/1", "".join([" ", "shutdown"])], intern_table=intern_table)
+    parse_02 = CiscoConfParse(["interface GigabitEthernet1/2", "".join([" ", "shutdown"])], intern_table=intern_table)
+
+    assert parse_01.objs[1].text is parse_02.objs[1].text
+    assert parse_01.objs[1].line is parse_01.objs[1].text
+    assert intern_table[" shutdown"] is parse_01.objs[1].text
+
+    # Inserted lines are interned too
+    parse_02.append("".join(["host", "name Router02"]))
+    assert parse_02.objs[-1].text is intern_table["hostname Router02"]
+
+
+def testValues_CiscoConfParse_read_only_01():
+    """Test that CiscoConfParse(read_only=True) can be searched but not modified"""
+    config = [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        " shutdown",
+        "!",
+    ]
+    parse = CiscoConfParse(config, read_only=True)
+    assert parse.auto_commit is False
+    assert parse.config_objs.commit_checkpoint == 0
+    assert parse.config_objs.search_safe is True
+
+    intf = parse.find_parent_objects(["interface", "shutdown"])[0]
+    assert intf.children == (parse.objs[1], parse.objs[2])
+    assert intf.all_children == [parse.objs[1], parse.objs[2]]
+    assert parse.objs[2].linenum == 2
+
+    with pytest.raises(ReadOnlyConfiguration):
+        intf.text = "interface GigabitEthernet1/2"
+    with pytest.raises(ReadOnlyConfiguration):
+        intf.append_to_family(" no shutdown")
+    with pytest.raises(ReadOnlyConfiguration):
+        parse.objs[2].delete()
+    with pytest.raises(ReadOnlyConfiguration):
+        parse.config_objs.append("hostname Router01")
+
+    # commit() has nothing to do
+    assert parse.config_objs.commit() is True
+    assert parse.get_text() == config
+
+
+def testValues_CiscoConfParse_read_only_02():
+    """Test that the snapshot of a CiscoConfParse(read_only=True) is writable, and does not change the read-only configuration"""
+    config = [
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        " shutdown",
+        "interface GigabitEthernet1/2",
+        " shutdown",
+    ]
+    parse = CiscoConfParse(config, read_only=True)
+    what_if = parse.snapshot()
+    assert what_if.read_only is False
+    assert what_if.config_objs.read_only is False
+    # The read-only configuration does not track its snapshots
+    assert parse.config_objs.cow_shared is False
+    assert parse.config_objs.snapshots == []
+
+    intf = what_if.find_parent_objects(["interface", "shutdown"])[0]
+    intf.text = "interface GigabitEthernet1/9"
+    intf.append_to_family(" description what-if")
+    what_if.find_objects(r"^interface GigabitEthernet1/2")[0].delete()
+    what_if.commit()
+    assert what_if.get_text() == [
+        "interface GigabitEthernet1/9",
+        " ip address 192.0.2.1 255.255.255.0",
+        " shutdown",
+        " description what-if",
+    ]
+    assert parse.get_text() == config
+    assert parse.objs[0].children == (parse.objs[1], parse.objs[2])
+    assert [obj.linenum for obj in parse.objs] == [0, 1, 2, 3, 4]
+
+
+def testValues_CiscoConfParse_profile_01():
+    """Test that CiscoConfParse(profile=...) records the wall time and object count of each parse phase"""
+    config = [
+        "hostname Router01",
+        "banner motd ^",
+        "Authorized users only",
+        "^",
+        "interface GigabitEthernet1/1",
+        " shutdown",
+    ]
+    assert CiscoConfParse(config).profile_stats == {}
+
+    calls = []
+    parse = CiscoConfParse(config, profile=lambda phase, seconds, objects: calls.append(phase))
+    assert set(parse.profile_stats.keys()) == {
+        "read_config",
+        "handle_ccp_brace_syntax",
+        "checkpoint",
+        "bootstrap",
+    }
+    assert parse.profile_stats["bootstrap"]["calls"] == 1
+    assert parse.profile_stats["bootstrap"]["objects"] == 6
+    assert parse.profile_stats["read_config"]["seconds"] >= 0.0
+    assert calls[0:2] == ["read_config", "handle_ccp_brace_syntax"]
+
+    parse.commit()
+    assert parse.profile_stats["commit"]["calls"] == 1
+    assert parse.profile_stats["bootstrap"]["calls"] == 2
+    assert calls[-1] == "commit"
+
+
+def testValues_CiscoConfParse_bootstrap_banner_macro_01():
+    """Test that bootstrap() marks banner and macro children in the same pass as ignore_blank_lines"""
+    config = [
+        "banner motd ^C",
+        "  Authorized users only",
+        "",
+        "^C",
+        "macro name FOO",
+        " switchport mode access",
+        "@",
+        "",
+        "interface GigabitEthernet1/1",
+        " shutdown",
+    ]
+    parse = CiscoConfParse(config, ignore_blank_lines=True)
+    banner, macro, intf = parse.objs[0], parse.objs[4], parse.objs[7]
+    assert parse.get_text() == config[0:7] + config[8:10]
+    # Indented banner lines are only children of the banner
+    assert banner.children == [parse.objs[1], parse.objs[2], parse.objs[3]]
+    assert banner.child_indent == 0
+    assert all(parse.objs[ii].blank_line_keep is True for ii in range(0, 3))
+    assert macro.children == [parse.objs[5], parse.objs[6]]
+    assert intf.children == [parse.objs[8]]
+    assert intf.linenum == 7
+
+
+def testValues_config_line_factory_dispatch_01():
+    """Ensure that the config_line_factory() dispatch map picks the same class as checking every factory class"""
+    config = [
+        "hostname Router01",
+        "interface GigabitEthernet0/1",
+        " interface Loopback0",
+        "ip route 0.0.0.0 0.0.0.0 172.16.1.254",
+        "ipx routing",
+        "aaa authentication login default local",
+        "aaa new-model",
+        "line vty 0 4",
+        "Line con 0",
+        "vpc domain 10",
+        "no cdp run",
+        " description spanning-tree portfast default",
+        "name 172.16.1.1 server01",
+        "object network server01",
+        "object-group network servers",
+        "access-list INSIDE extended permit ip any any",
+        "mtu inside 1500",
+        "",
+    ]
+    for syntax, factory_classes in (("ios", ALL_IOS_FACTORY_CLASSES), ("iosxr", ALL_IOSXR_FACTORY_CLASSES), ("asa", ALL_ASA_FACTORY_CLASSES)):
+        for line in config:
+            expected = IOSCfgLine
+            for cls in factory_classes:
+                if cls.is_object_for(all_lines=config, line=line):
+                    expected = cls
+                    break
+            assert type(config_line_factory(all_lines=config, line=line, syntax=syntax)) is expected
+
+
+def testValues_route_table_01():
+    """Test CiscoConfParse().route_table() longest-prefix match, administrative distance order and VRFs"""
+    config = [
+        "ip route 0.0.0.0 0.0.0.0 192.0.2.1",
+        "ip route 0.0.0.0 0.0.0.0 Dialer1 250",
+        "ip route 10.0.0.0 255.0.0.0 192.0.2.2 name TEN track 5",
+        "ip route 10.1.0.0 255.255.0.0 Null0 tag 100",
+        "ip route vrf Mgmt-intf 0.0.0.0 0.0.0.0 10.1.1.254",
+        "ip route static bfd GigabitEthernet0/1 192.0.2.1",
+        "ipv6 route 2001:db8::/32 Null0",
+    ]
+    parse = CiscoConfParse(config)
+    table = parse.route_table()
+    assert len(table) == 5
+    assert [(route.next_hop_interface, route.next_hop_addr, route.admin_distance) for route in table.lookup("198.51.100.1")] == [("", "192.0.2.1", 1), ("Dialer1", "", 250)]
+    assert [(route.name, route.track, route.linenum) for route in table.lookup(IPv4Obj("10.2.0.0/16"))] == [("TEN", "5", 2)]
+    assert table.lookup("10.1.2.3")[0].tag == 100
+    assert table.lookup("2001:db8::1")[0].next_hop_interface == "Null0"
+    assert table.lookup("2001:db9::1") == []
+    assert parse.route_table(vrf="Mgmt-intf").lookup("10.1.1.1")[0].next_hop_addr == "10.1.1.254"
+    assert len(parse.route_table(vrf="UNKNOWN")) == 0
+    # The tables are cached until the configuration changes
+    assert parse.route_table() is table
+    parse.objs[3].text = "ip route 10.1.0.0 255.255.0.0 192.0.2.3"
+    assert parse.route_table().lookup("10.1.2.3")[0].next_hop_addr == "192.0.2.3"
+
+
+@pytest.mark.parametrize(
+    "syntax, filename, vrf, addr, next_hop",
+    [
+        ("nxos", "fixtures/configs/sample_01.nxos", "CHARLIE", "192.0.2.1", ("port-channel80.1", "10.10.200.134")),
+        ("nxos", "fixtures/configs/sample_01.nxos", "management", "192.0.2.1", ("", "10.10.248.1")),
+        ("iosxr", "fixtures/configs/sample_04.iosxr", None, "192.0.2.1", ("MgmtEth0/RP0/CPU0/0", "10.0.2.2")),
+        ("iosxr", "fixtures/configs/sample_05.iosxr", None, "2001:db8::1", ("Null0", "")),
+        ("iosxr", "fixtures/configs/sample_07.iosxr", "MGMT-VRF", "192.0.2.1", ("", "172.29.15.1")),
+        ("asa", "fixtures/configs/sample_01.asa", None, "10.1.1.1", ("INSIDE", "192.0.2.2")),
+        ("junos", "fixtures/configs/sample_01.junos", None, "192.168.36.1", ("", "172.16.12.1")),
+    ],
+)
+def testValues_route_table_02(syntax, filename, vrf, addr, next_hop):
+    """Test CiscoConfParse().route_table() with NXOS vrf context, IOS-XR router static, ASA route and Junos routing-options"""
+    parse = CiscoConfParse(filename, syntax=syntax)
+    route = parse.route_table(vrf=vrf).lookup(addr)[0]
+    assert (route.next_hop_interface, route.next_hop_addr) == next_hop
+
+
+def testValues_route_table_03():
+    """Test that the same routes on different lines compare equal, and truncated 'ip route vrf' lines are skipped"""
+    config = [
+        "ip route 0.0.0.0 0.0.0.0 192.0.2.1",
+        "ip route vrf Mgmt-intf 0.0.0.0 0.0.0.0 10.1.1.254",
+    ]
+    before = CiscoConfParse(config).route_table(vrf="Mgmt-intf").lookup("10.1.1.1")
+    after = CiscoConfParse(["!", "hostname Foo", *config, "ip route vrf"]).route_table(vrf="Mgmt-intf").lookup("10.1.1.1")
+    assert [route.linenum for route in before] == [1]
+    assert [route.linenum for route in after] == [3]
+    assert before == after
+    assert {*before} == {*after}
+
+
+def testValues_route_table_04():
+    """Test that CiscoConfParse().route_table() does not copy the configuration families of a snapshot"""
+    config = [
+        "hostname Router01",
+        "interface GigabitEthernet1/1",
+        " ip address 192.0.2.2 255.255.255.0",
+        "ip route 0.0.0.0 0.0.0.0 192.0.2.1",
+        "ip route vrf Mgmt-intf 0.0.0.0 0.0.0.0 10.1.1.254",
+    ]
+    parse = CiscoConfParse(config)
+    snap = parse.snapshot()
+    assert snap.route_table().lookup("198.51.100.1")[0].next_hop_addr == "192.0.2.1"
+    assert snap.route_table(vrf="Mgmt-intf").lookup("10.1.1.1")[0].linenum == 4
+    assert all(aa is bb for aa, bb in zip(snap.config_objs.data, parse.config_objs.data))
+
+
 def testValues_ConfigList_context_manager_01():
     """Test a ConfigList context-manager"""
     config = [
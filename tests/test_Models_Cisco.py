@@ -1,10 +1,15 @@
 import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from ciscoconfparse2.ccp_util import CiscoRange, IPv4Obj
+from ciscoconfparse2.ccp_abc import KEYWORD_INDEXES
+from ciscoconfparse2.ccp_util import INTERFACE_COLUMNS, CiscoRange, CiscoVlanSet, IPPrefixTrie, IPv4Obj, concat_interface_columns
 from ciscoconfparse2.ciscoconfparse2 import CiscoConfParse
-from ciscoconfparse2.models_cisco import HSRPInterfaceGroup
+from ciscoconfparse2.errors import RequirementFailure
+from ciscoconfparse2.models_base import BaseFactoryInterfaceLine
+from ciscoconfparse2.models_cisco import FHRPGroup, HSRPInterfaceGroup
 
 sys.path.insert(0, "..")
 
@@ -418,6 +423,28 @@ interface GigabitEthernet 1/1
     assert intf_obj.trunk_vlans_allowed == CiscoRange(text="", result_type=int)
 
 
+def testVal_IOSIntfLine_trunk_vlan_set_01():
+    """Test that trunk_vlans_allowed is still a CiscoRange(), and trunk_vlan_set is a CiscoVlanSet() with the same vlans"""
+    config = """!
+interface GigabitEthernet 1/1
+ switchport
+ switchport mode trunk
+ switchport trunk allowed vlan 2-10,20
+ switchport trunk allowed vlan remove 5
+!
+"""
+    cfg = CiscoConfParse(config.splitlines(), factory=True)
+    intf_obj = cfg.find_objects("^interface")[0]
+    vlans = intf_obj.trunk_vlans_allowed
+    assert isinstance(vlans, CiscoRange)
+    assert vlans[0] == 2
+    assert vlans.data == [2, 3, 4, 6, 7, 8, 9, 10, 20]
+    vlan_set = intf_obj.trunk_vlan_set
+    assert isinstance(vlan_set, CiscoVlanSet)
+    assert 20 in vlan_set and 5 not in vlan_set
+    assert vlan_set == vlans
+
+
 def testVal_IOSIntfLine_abbvs(parse_c03_factory):
     cfg = parse_c03_factory
     result_correct = {
@@ -1530,6 +1557,15 @@ def testVal_IOSIntfLine_in_ipv4_subnets(parse_c03_factory):
     assert test_result == result_correct
 
 
+def testVal_IOSIntfLine_in_ipv4_subnets_trie(parse_c03_factory):
+    """Test that in_ipv4_subnets() returns the same values for an IPPrefixTrie() as for a set of IPv4Obj()"""
+    cfg = parse_c03_factory
+    networks = {IPv4Obj("1.1.0.0/23", strict=False), IPv4Obj("1.1.2.0/23", strict=False)}
+    trie = IPPrefixTrie(networks)
+    for intf_obj in cfg.find_objects("^interface"):
+        assert intf_obj.in_ipv4_subnets(trie) == intf_obj.in_ipv4_subnets(networks), intf_obj.text
+
+
 def testVal_IOSIntfLine_has_no_icmp_unreachables(parse_c03_factory):
     cfg = parse_c03_factory
     result_correct = {
@@ -2075,6 +2111,77 @@ def testVal_IOSHSRPGroups_08(parse_sample_08_ios_factory):
     assert hsrp_groups[3].priority == 150
 
 
+def testVal_FHRPGroup_01(parse_sample_08_ios_factory):
+    """Test that FHRPGroup() records match the HSRPInterfaceGroup() properties of numbered HSRP groups"""
+    intf_obj = parse_sample_08_ios_factory.find_objects("^interface FastEthernet0/0")[0]
+    records = {record.group: record for record in FHRPGroup.from_interface(intf_obj)}
+    assert sorted(records) == [0, 110, 111, 112]
+    # 'standby ip ...' without a group number is HSRP group 0
+    assert (records[0].ipv4, records[0].priority, records[0].preempt_delay) == ("172.16.2.251", 200, 10)
+    for hsrp_group in intf_obj.get_hsrp_groups()[1:]:
+        record = records[hsrp_group.group]
+        assert (record.protocol, record.interface_name) == ("hsrp", hsrp_group.interface_name)
+        assert (record.ipv4, record.priority, record.preempt, record.preempt_delay) == (hsrp_group.ip, hsrp_group.priority, hsrp_group.preempt, hsrp_group.preempt_delay)
+        assert (record.hello_timer, record.hold_timer, record.version) == (hsrp_group.hello_timer, hsrp_group.hold_timer, hsrp_group.version)
+        assert list(record.tracking) == [(track.interface_name, track.decrement) for track in hsrp_group.interface_tracking]
+
+
+def testVal_FHRPGroup_02():
+    """Test CiscoConfParse().fhrp_groups() with VRRP, GLBP, NXOS hsrp blocks and IOS-XE VRRPv3 blocks"""
+    config = [
+        "interface Vlan10",
+        " ip address 192.0.2.2 255.255.255.0",
+        " standby version 2",
+        " standby use-bia",
+        " standby 10 ip 192.0.2.1",
+        " standby 10 ip 192.0.2.129 secondary",
+        " standby 10 timers msec 250 msec 750",
+        " standby 10 authentication md5 key-chain HSRP",
+        " vrrp 20 ip 192.0.2.254",
+        " no vrrp 20 preempt",
+        " vrrp 20 track 5 decrement 30",
+        " glbp 30 ip 192.0.2.253",
+        " glbp 30 weighting track 7",
+        "interface Vlan20",
+        " hsrp 40",
+        "  ip 198.51.100.1",
+        "  priority 120",
+        "  preempt",
+        " vrrp 50 address-family ipv4",
+        "  address 198.51.100.254 primary",
+        "  timers advertise 500",
+    ]
+    parse = CiscoConfParse(config)
+    records = {(record.interface_name, record.protocol, record.group): record for record in parse.fhrp_groups()}
+    assert len(records) == 5
+
+    hsrp = records[("Vlan10", "hsrp", 10)]
+    assert (hsrp.version, hsrp.use_bia, hsrp.ipv4_secondary) == (2, True, ("192.0.2.129",))
+    assert (hsrp.hello_timer, hsrp.hold_timer, hsrp.authentication) == (0.25, 0.75, "md5 key-chain HSRP")
+    vrrp = records[("Vlan10", "vrrp", 20)]
+    assert (vrrp.ipv4, vrrp.preempt, vrrp.tracking) == ("192.0.2.254", False, (("5", 30),))
+    glbp = records[("Vlan10", "glbp", 30)]
+    assert (glbp.ipv4, glbp.tracking) == ("192.0.2.253", (("7", 10),))
+    nxos_hsrp = records[("Vlan20", "hsrp", 40)]
+    assert (nxos_hsrp.ipv4, nxos_hsrp.priority, nxos_hsrp.preempt) == ("198.51.100.1", 120, True)
+    vrrp3 = records[("Vlan20", "vrrp", 50)]
+    assert (vrrp3.version, vrrp3.ipv4, vrrp3.hello_timer) == (3, "198.51.100.254", 0.5)
+
+
+def testVal_FHRPGroup_03():
+    """Test that the same FHRP groups on different lines compare equal"""
+    config = [
+        "interface Vlan10",
+        " standby 10 ip 192.0.2.1",
+        " vrrp 20 ip 192.0.2.254",
+    ]
+    before = CiscoConfParse(config).fhrp_groups()
+    after = CiscoConfParse(["!", "hostname Foo", *config]).fhrp_groups()
+    assert [record.linenum for record in before] != [record.linenum for record in after]
+    assert before == after
+    assert {*before} == {*after}
+
+
 ###
 ### ------ IPv4 Helper-Addresses --------
 ###
@@ -2117,3 +2224,201 @@ def testVal_IOSSDWAN_sdwan_interface_tunnel_color():
     parse = CiscoConfParse("fixtures/configs/sample_10.ios", syntax="ios", factory=False)
     intf_tunnel_color = parse.find_child_objects(["sdwan", "interface GigabitEthernet1$", "tunnel-interface", "color"])[0]
     assert intf_tunnel_color.split()[-1] == "gold"
+
+
+@pytest.mark.parametrize(
+    "syntax, filename",
+    [
+        ("ios", "fixtures/configs/sample_01.ios"),
+        ("ios", "fixtures/configs/sample_08.ios"),
+        ("nxos", "fixtures/configs/sample_01.nxos"),
+        ("iosxr", "fixtures/configs/sample_01.iosxr"),
+        ("iosxr", "fixtures/configs/sample_02.iosxr"),
+    ],
+)
+def testVal_IOSIntfLine_facts_01(syntax, filename):
+    """Test that interface facts() returns the same values as the interface properties"""
+    parse = CiscoConfParse(filename, syntax=syntax, factory=True)
+    all_facts = parse.interface_facts()
+    intfs = parse.find_objects(r"^interface\s")
+    assert len(all_facts) == len(intfs) > 0
+    for intf, facts in zip(intfs, all_facts):
+        assert list(facts.keys()) == list(intf.FACTS)
+        for name, value in facts.items():
+            assert value == getattr(intf, name), f"{intf.text} {name}"
+        # facts() does not leave the keyword index behind
+        assert KEYWORD_INDEXES.get() is None
+
+
+def testVal_IOSIntfLine_facts_02():
+    """Test that facts() does not store its keyword index on the interface, so concurrent readers are not affected"""
+    parse = CiscoConfParse("fixtures/configs/sample_01.ios", syntax="ios", factory=True)
+    intf = parse.find_objects(r"^interface\s+FastEthernet0/0$")[0]
+    expected = {name: getattr(intf, name) for name in intf.FACTS}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: intf.facts(), range(16)))
+    assert all(result == expected for result in results)
+
+    with intf._keyword_index_scope() as keyword_index:
+        assert KEYWORD_INDEXES.get() == {id(intf): keyword_index}
+        # Another thread does not see this thread's keyword index
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(KEYWORD_INDEXES.get).result() is None
+        assert not hasattr(intf, "_keyword_index")
+    assert KEYWORD_INDEXES.get() is None
+
+
+@pytest.mark.parametrize(
+    "syntax, filename",
+    [
+        ("ios", "fixtures/configs/sample_01.ios"),
+        ("nxos", "fixtures/configs/sample_01.nxos"),
+        ("iosxr", "fixtures/configs/sample_01.iosxr"),
+    ],
+)
+def testVal_IOSIntfLine_facts_03(syntax, filename):
+    """Test that CiscoConfParse().interface_facts() does not require factory=True"""
+    expected = CiscoConfParse(filename, syntax=syntax, factory=True).interface_facts()
+    parse = CiscoConfParse(filename, syntax=syntax)
+    assert parse.interface_facts() == expected
+    assert not any(isinstance(obj, BaseFactoryInterfaceLine) for obj in parse.objs)
+
+    parse = CiscoConfParse(["interface GigabitEthernet0/1", " ip address 10.0.0.1 255.255.255.0"], syntax="ios")
+    facts = parse.interface_facts()[0]
+    assert (facts["name"], facts["ipv4_addr"], facts["is_shutdown"]) == ("GigabitEthernet0/1", "10.0.0.1", False)
+
+
+@pytest.mark.parametrize(
+    "syntax, filename",
+    [
+        ("ios", "fixtures/configs/sample_01.ios"),
+        ("ios", "fixtures/configs/sample_08.ios"),
+        ("nxos", "fixtures/configs/sample_01.nxos"),
+        ("iosxr", "fixtures/configs/sample_01.iosxr"),
+    ],
+)
+def testVal_IOSIntfLine_interface_columns_01(syntax, filename):
+    """Test that CiscoConfParse().interface_columns() returns the same values as the interface properties"""
+    parse = CiscoConfParse(filename, syntax=syntax, factory=True)
+    columns = parse.interface_columns()
+    intfs = parse.find_objects(r"^interface\s")
+    assert list(columns) == list(INTERFACE_COLUMNS)
+    assert all(len(values) == len(intfs) > 0 for values in columns.values())
+    for idx, intf in enumerate(intfs):
+        addr_obj = intf.ipv4_addr_object
+        assert columns["name"][idx] == intf.name
+        assert columns["port"][idx] == (-1 if intf.cisco_interface_object.port is None else intf.cisco_interface_object.port)
+        assert columns["ipv4"][idx] == (0 if addr_obj.empty else int(addr_obj.ip))
+        assert columns["prefixlen"][idx] == intf.ipv4_masklength
+        assert columns["vlan"][idx] == intf.access_vlan
+        assert columns["mtu"][idx] == intf.manual_mtu
+        assert columns["shutdown"][idx] == intf.is_shutdown
+    assert KEYWORD_INDEXES.get() is None
+
+
+@pytest.mark.parametrize(
+    "syntax, filename",
+    [
+        ("ios", "fixtures/configs/sample_01.ios"),
+        ("ios", "fixtures/configs/sample_08.ios"),
+        ("nxos", "fixtures/configs/sample_01.nxos"),
+        ("iosxr", "fixtures/configs/sample_01.iosxr"),
+    ],
+)
+def testVal_IOSIntfLine_interface_columns_03(syntax, filename):
+    """Test that CiscoConfParse().interface_columns() does not require factory=True"""
+    expected = CiscoConfParse(filename, syntax=syntax, factory=True).interface_columns()
+    parse = CiscoConfParse(filename, syntax=syntax)
+    assert parse.interface_columns() == expected
+    assert CiscoConfParse(filename, syntax=syntax, read_only=True).interface_columns() == expected
+    # Reading the columns does not change the configuration
+    assert not any(isinstance(obj, BaseFactoryInterfaceLine) for obj in parse.objs)
+
+
+def testVal_IOSIntfLine_interface_columns_02():
+    """Test concat_interface_columns() and interface_columns(numpy=True)"""
+    config = [
+        "interface GigabitEthernet1/0/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        "interface Vlan10",
+        " shutdown",
+    ]
+    tables = [CiscoConfParse(config, factory=True).interface_columns(columns=["name", "ipv4", "shutdown"]) for _ in range(3)]
+    table = concat_interface_columns(tables)
+    assert table["name"] == ["GigabitEthernet1/0/1", "Vlan10"] * 3
+    assert table["ipv4"] == array("I", [int(IPv4Obj("192.0.2.1").ip), 0] * 3)
+    assert table["shutdown"] == array("B", [0, 1] * 3)
+    # The tables which were joined are not modified
+    assert len(tables[0]["name"]) == 2
+
+    with pytest.raises(ValueError):
+        concat_interface_columns([tables[0], {"name": []}])
+    with pytest.raises(ValueError):
+        CiscoConfParse(config, factory=True).interface_columns(columns=["speed"])
+
+    try:
+        import numpy as np
+    except ImportError:
+        with pytest.raises(RequirementFailure):
+            CiscoConfParse(config, factory=True).interface_columns(numpy=True)
+        return
+    columns = CiscoConfParse(config, factory=True).interface_columns(numpy=True)
+    assert columns["ipv4"].dtype == np.uint32
+    assert columns["shutdown"].tolist() == [False, True]
+    assert columns["name"].tolist() == ["GigabitEthernet1/0/1", "Vlan10"]
+
+
+def testVal_IOSIntfLine_mutation_cached_01():
+    """Test that cached interface properties are recomputed after a text change or a structural change"""
+    parse = CiscoConfParse(
+        [
+            "interface GigabitEthernet1/1",
+            " ip address 192.0.2.1 255.255.255.0",
+            "!",
+        ],
+        syntax="ios",
+        factory=True,
+    )
+    intf = parse.objs[0]
+    assert intf.ipv4_addr_object == IPv4Obj("192.0.2.1/24")
+    assert intf.is_switchport is False
+    assert intf.port == 1
+    # The second read is served from the cache, as a copy of the cached value
+    assert intf.ipv4_addr_object == intf.ipv4_addr_object
+    assert intf.ipv4_addr_object is not intf.ipv4_addr_object
+
+    # Changing the text of a child drops the cached value
+    intf.children[0].text = " ip address 192.0.2.9 255.255.255.0"
+    assert intf.ipv4_addr_object == IPv4Obj("192.0.2.9/24")
+
+    # Changing the text of the interface drops the cached value
+    intf.text = "interface GigabitEthernet1/2"
+    assert intf.port == 2
+    assert intf.name == "GigabitEthernet1/2"
+
+    # Adding a child drops the cached value
+    intf.append_to_family(" switchport")
+    parse.commit()
+    assert intf.is_switchport is True
+
+
+def testVal_IOSIntfLine_mutation_cached_02():
+    """Test that modifying a cached interface property value does not change the cache"""
+    parse = CiscoConfParse(
+        [
+            "interface GigabitEthernet1/1",
+            " ip address 192.0.2.1 255.255.255.0",
+            "!",
+        ],
+        syntax="ios",
+        factory=True,
+    )
+    intf = parse.objs[0]
+    addr = intf.ipv4_addr_object
+    addr.masklen = 8
+    assert intf.ipv4_addr_object == IPv4Obj("192.0.2.1/24")
+
+    cisco_intf = intf.cisco_interface_object
+    cisco_intf.port = 9
+    assert intf.cisco_interface_object.port == 1